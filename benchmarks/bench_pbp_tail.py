@@ -0,0 +1,60 @@
+"""
+Compare decoding a whole pbp.json body (what `get_pbp_data` does with `response.json()`)
+against `extract_innings_tail`, which only decodes the latest inning.
+
+Reports median decode time and tracemalloc peak memory for synthetic games from a
+regulation 9 innings up to an 18 inning marathon.
+
+Run from the repository root:
+    python -m benchmarks.bench_pbp_tail
+"""
+import json
+import statistics
+import time
+import tracemalloc
+
+from mlb_strikezone_app.pbp_tail import extract_innings_tail
+from mlb_strikezone_app.synthetic import build_game
+
+INNING_COUNTS = [9, 12, 15, 18]
+REPEATS = 15
+
+
+def full_decode(body):
+    return json.loads(body).get('game', {})
+
+
+def tail_decode(body):
+    return extract_innings_tail(body)
+
+
+def time_call(func, body):
+    samples = []
+    for _ in range(REPEATS):
+        start = time.perf_counter()
+        func(body)
+        samples.append(time.perf_counter() - start)
+    return statistics.median(samples)
+
+
+def peak_memory(func, body):
+    tracemalloc.start()
+    func(body)
+    _, peak = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    return peak
+
+
+def main():
+    print(f"{'innings':>7} {'body KB':>8} {'full ms':>8} {'tail ms':>8} {'full peak KB':>13} {'tail peak KB':>13}")
+    for innings in INNING_COUNTS:
+        body = json.dumps({'game': build_game(innings, seed=innings)}, separators=(',', ':')).encode('utf-8')
+        full_ms = time_call(full_decode, body) * 1000
+        tail_ms = time_call(tail_decode, body) * 1000
+        full_peak = peak_memory(full_decode, body) / 1024
+        tail_peak = peak_memory(tail_decode, body) / 1024
+        print(f"{innings:>7} {len(body) / 1024:>8.0f} {full_ms:>8.2f} {tail_ms:>8.2f} {full_peak:>13.0f} {tail_peak:>13.0f}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,215 @@
+"""
+Benchmark the poll-cycle hot path and compare it against a saved JSON baseline.
+
+Fixtures are synthetic pbp.json games from 1 to 18 innings plus, optionally, real games
+recorded with `--cache_mode record` (pass the cache folder with --recorded). Each fixture
+is served by a local stub HTTP server so `get_pbp_data` pays a real loopback request.
+
+Cases:
+    get_pbp_data                   request + full JSON decode through the shared session
+    get_latest_inning              latest inning/half lookup on a decoded game
+    summarize_at_bat               summary of the latest at-bat
+    stream_latest_pitch_and_info   the three above, end to end
+    play_summary                   Tk label and pitch dot rendering (needs a display; on a
+                                   headless Linux box run the script under `xvfb-run -a`)
+
+Run from the repository root:
+    python -m benchmarks.bench_poll_cycle                 # compare with the baseline
+    python -m benchmarks.bench_poll_cycle --save          # write a new baseline
+    python -m benchmarks.bench_poll_cycle --recorded ~/.mlb_strikezone_cache
+
+Exits with status 1 when any case is slower than baseline by more than --tolerance.
+"""
+import argparse
+import glob
+import json
+import os
+import statistics
+import sys
+import threading
+import time
+from http.server import ThreadingHTTPServer, BaseHTTPRequestHandler
+
+from mlb_strikezone_app.mlb_api import Pitch_Stream
+from mlb_strikezone_app.synthetic import build_game
+
+INNING_COUNTS = [1, 3, 9, 12, 18]
+ROUNDS = 7
+ROUND_SECONDS = 0.05
+DEFAULT_BASELINE = os.path.join(os.path.dirname(os.path.abspath(__file__)), 'baselines', 'poll_cycle.json')
+
+
+class StubHandler(BaseHTTPRequestHandler):
+    """Serves the pbp.json bodies in `server.bodies` (game id -> bytes) over keep-alive HTTP/1.1."""
+
+    protocol_version = "HTTP/1.1"
+
+    def do_GET(self):
+        parts = self.path.split('?')[0].split('/')
+        body = self.server.bodies.get(parts[-2]) if parts[-1] == 'pbp.json' else None
+        if body is None:
+            self.send_response(404)
+            self.send_header("Content-Length", "0")
+            self.end_headers()
+            return
+        self.send_response(200)
+        self.send_header("Content-Type", "application/json")
+        self.send_header("Content-Length", str(len(body)))
+        self.end_headers()
+        self.wfile.write(body)
+
+    def log_message(self, *args):
+        pass
+
+
+def start_stub(bodies):
+    server = ThreadingHTTPServer(("127.0.0.1", 0), StubHandler)
+    server.bodies = bodies
+    threading.Thread(target=server.serve_forever, daemon=True).start()
+    return server
+
+
+def synthetic_fixtures():
+    return {f"synthetic-{innings}": json.dumps({'game': build_game(innings, seed=innings)},
+                                               separators=(',', ':')).encode('utf-8')
+            for innings in INNING_COUNTS}
+
+
+def recorded_fixtures(cache_dir):
+    """Load every pbp.json body of a `--cache_mode record` folder."""
+    fixtures = {}
+    for meta_path in sorted(glob.glob(os.path.join(os.path.expanduser(cache_dir), '*.json'))):
+        with open(meta_path, 'r') as file:
+            url = json.load(file).get('url', '')
+        if url.split('?')[0].endswith('/pbp.json'):
+            with open(meta_path[:-len('.json')] + '.body', 'rb') as file:
+                fixtures[f"recorded-{url.split('/')[-2][:8]}"] = file.read()
+    return fixtures
+
+
+def measure(func):
+    """Return the median seconds per call of `func` over ROUNDS auto-sized rounds."""
+    loops = 1
+    while True:
+        start = time.perf_counter()
+        for _ in range(loops):
+            func()
+        if time.perf_counter() - start >= ROUND_SECONDS / 5:
+            break
+        loops *= 2
+    samples = []
+    for _ in range(ROUNDS):
+        start = time.perf_counter()
+        for _ in range(loops):
+            func()
+        samples.append((time.perf_counter() - start) / loops)
+    return statistics.median(samples)
+
+
+def latest_at_bat(stream, game_data):
+    inning, half, _ = stream.get_latest_inning(game_data)
+    events = half.get('events', []) if half else []
+    return inning, half, events[-1].get('at_bat', {}) if events else {}
+
+
+def bench_parsing(fixtures, base_url):
+    results = {}
+    stream = Pitch_Stream("bench", "trial", base_url=base_url)
+    stream.http.rate_limiter.set_rate(1e9)  # Measure the client, not the Sportradar QPS limit.
+    for name, body in fixtures.items():
+        game_id = name
+        game_data = stream.get_pbp_data(game_id)
+        inning, half, at_bat = latest_at_bat(stream, game_data)
+        half_name = "Top" if half and half.get('half') == 'T' else "Bottom"
+        results[f"get_pbp_data/{name}"] = measure(lambda: stream.get_pbp_data(game_id))
+        results[f"get_latest_inning/{name}"] = measure(lambda: stream.get_latest_inning(game_data))
+        results[f"summarize_at_bat/{name}"] = measure(
+            lambda: stream.summarize_at_bat(at_bat, inning.get('number') if inning else 'N/A', half_name))
+        results[f"stream_latest_pitch_and_info/{name}"] = measure(lambda: stream.stream_latest_pitch_and_info(game_id))
+    return results
+
+
+def bench_rendering(fixtures, base_url):
+    try:
+        import tkinter as tk
+        root = tk.Tk()
+    except Exception as e:
+        print(f"Skipping play_summary (no display: {e}); run under `xvfb-run -a`.", file=sys.stderr)
+        return {}
+    from mlb_strikezone_app.strike_zone import StrikeZone_Updates
+
+    results = {}
+    try:
+        app = StrikeZone_Updates(root, "bench", "trial")
+        stream = Pitch_Stream("bench", "trial", base_url=base_url)
+        for name in fixtures:
+            # Alternate two different pitches so every call really changes labels and the dot.
+            summaries = [stream.summarize_pbp(stream.get_pbp_data(name)),
+                         stream.summarize_pbp(stream.get_pbp_data(next(n for n in fixtures if n != name)))]
+            flip = [0]
+
+            def render():
+                flip[0] ^= 1
+                app.play_summary(summaries[flip[0]])
+                root.update_idletasks()
+
+            results[f"play_summary/{name}"] = measure(render)
+        app.fetch_worker.stop()
+    finally:
+        root.destroy()
+    return results
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Poll-cycle hot path benchmarks")
+    parser.add_argument("--save", action="store_true", help="Write the results as the new baseline")
+    parser.add_argument("--baseline", default=DEFAULT_BASELINE, help="Baseline JSON file")
+    parser.add_argument("--tolerance", type=float, default=0.25,
+                        help="Allowed slowdown against the baseline before failing (default 0.25 = 25%%)")
+    parser.add_argument("--recorded", default=None, help="Folder of a --cache_mode record cache to add real games from")
+    args = parser.parse_args()
+
+    fixtures = synthetic_fixtures()
+    if args.recorded:
+        fixtures.update(recorded_fixtures(args.recorded))
+    server = start_stub(fixtures)
+    base_url = f"http://127.0.0.1:{server.server_address[1]}/mlb"
+    try:
+        results = bench_parsing(fixtures, base_url)
+        results.update(bench_rendering(fixtures, base_url))
+    finally:
+        server.shutdown()
+
+    baseline = {}
+    if os.path.exists(args.baseline) and not args.save:
+        with open(args.baseline, 'r') as file:
+            baseline = json.load(file)["results"]
+
+    regressions = []
+    print(f"{'case':<52} {'us/call':>10} {'baseline':>10} {'ratio':>6}")
+    for case, seconds in results.items():
+        us = seconds * 1e6
+        previous = baseline.get(case)
+        if previous:
+            ratio = us / previous
+            flag = "  SLOWER" if ratio > 1 + args.tolerance else ""
+            if flag:
+                regressions.append(case)
+            print(f"{case:<52} {us:>10.1f} {previous:>10.1f} {ratio:>6.2f}{flag}")
+        else:
+            print(f"{case:<52} {us:>10.1f} {'-':>10} {'-':>6}")
+
+    if args.save:
+        os.makedirs(os.path.dirname(args.baseline), exist_ok=True)
+        with open(args.baseline, 'w') as file:
+            json.dump({"python": sys.version.split()[0], "saved_at": time.strftime("%Y-%m-%dT%H:%M:%S"),
+                       "results": {case: round(seconds * 1e6, 2) for case, seconds in results.items()}},
+                      file, indent=2)
+        print(f"Baseline saved to {args.baseline}")
+    elif regressions:
+        print(f"{len(regressions)} cases slower than baseline by more than {args.tolerance:.0%}")
+        sys.exit(1)
+
+
+if __name__ == "__main__":
+    main()
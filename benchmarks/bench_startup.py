@@ -0,0 +1,125 @@
+"""
+Measure how long the Tk app takes from process start to its first mapped window and to
+its first rendered pitch.
+
+Each run starts a fresh Python process, the same way `mlb_strikezone_app.main` would, that
+replays a synthetic game day from a temporary response cache, so no API key or network is
+needed. Runs are timed cold (empty pre-scaled background cache) and warm (background PNG
+already cached). Needs a display; on a headless Linux box run it under `xvfb-run`.
+
+Run from the repository root:
+    python -m benchmarks.bench_startup
+"""
+import datetime
+import json
+import os
+import statistics
+import subprocess
+import sys
+import tempfile
+import time
+
+REPEATS = 5
+SCHEDULE_DATE = datetime.date(2025, 6, 1)
+GAMES = 3
+
+
+def record_game_day(cache_dir):
+    """Write a replayable schedule and pbp for GAMES synthetic games into `cache_dir`."""
+    import requests
+    from mlb_strikezone_app.disk_cache import ResponseCache
+    from mlb_strikezone_app.mlb_api import MLB_API_Calls, load_teams
+    from mlb_strikezone_app.synthetic import build_game
+
+    cache = ResponseCache(cache_dir, "record")
+    api = MLB_API_Calls("bench", "trial", SCHEDULE_DATE)
+    team_ids = list(load_teams())
+
+    def store(url, body):
+        response = requests.models.Response()
+        response.status_code = 200
+        response.url = url
+        response._content = json.dumps(body).encode("utf-8")
+        cache.store(response)
+
+    games = []
+    for index in range(GAMES):
+        game = build_game(9, seed=index, game_id=f"bench-game-{index}")
+        store(api.pbp_url(game["id"]), {"game": game})
+        games.append({"id": game["id"], "status": "inprogress",
+                      "home_team": team_ids[2 * index], "away_team": team_ids[2 * index + 1]})
+    store(api.games_url, {"games": games})
+
+
+def child(cache_dir, asset_dir):
+    """Start the app like `main.run`, print 'window' and 'pitch' as they happen, then exit."""
+    import tkinter as tk
+    import mlb_strikezone_app.assets as assets
+    from mlb_strikezone_app.strike_zone import StrikeZone_Updates
+
+    assets.ASSET_CACHE_DIR = asset_dir
+    from mlb_strikezone_app.disk_cache import ResponseCache
+    from mlb_strikezone_app.http_client import shared_session
+    shared_session().cache = ResponseCache(cache_dir, "replay")
+
+    root = tk.Tk()
+    root.geometry("300x700")
+    first_map = []
+
+    def on_map(event):
+        if event.widget is root and not first_map:
+            first_map.append(True)
+            print("window", flush=True)
+
+    root.bind("<Map>", on_map)
+
+    class Timed_StrikeZone(StrikeZone_Updates):
+        def play_summary(self, pitch_summary):
+            StrikeZone_Updates.play_summary(self, pitch_summary)
+            self.root.update_idletasks()
+            print("pitch", flush=True)
+            self.root.after(0, self.root.destroy)
+
+    app = Timed_StrikeZone(root, "replay", "trial", schedule_date=SCHEDULE_DATE)
+    app.update_live_data(True)
+    root.mainloop()
+
+
+def time_run(cache_dir, asset_dir):
+    """Return (seconds to first window, seconds to first pitch) for one fresh process."""
+    start = time.perf_counter()
+    process = subprocess.Popen([sys.executable, "-m", "benchmarks.bench_startup", "--child", cache_dir, asset_dir],
+                               stdout=subprocess.PIPE, text=True)
+    marks = {}
+    for line in process.stdout:
+        marks[line.strip()] = time.perf_counter() - start
+    process.wait()
+    if process.returncode != 0 or set(marks) != {"window", "pitch"}:
+        raise RuntimeError(f"startup run failed (exit {process.returncode}, saw {sorted(marks)})")
+    return marks["window"], marks["pitch"]
+
+
+def main():
+    with tempfile.TemporaryDirectory() as cache_dir, tempfile.TemporaryDirectory() as warm_assets:
+        record_game_day(cache_dir)
+        time_run(cache_dir, warm_assets)  # Fills the warm background cache and the OS file cache.
+
+        print(f"{'assets':>6} {'window ms':>10} {'pitch ms':>9}")
+        for label in ("cold", "warm"):
+            windows, pitches = [], []
+            for _ in range(REPEATS):
+                if label == "cold":
+                    with tempfile.TemporaryDirectory() as cold_assets:
+                        window, pitch = time_run(cache_dir, cold_assets)
+                else:
+                    window, pitch = time_run(cache_dir, warm_assets)
+                windows.append(window)
+                pitches.append(pitch)
+            print(f"{label:>6} {statistics.median(windows) * 1000:>10.0f} {statistics.median(pitches) * 1000:>9.0f}")
+
+
+if __name__ == "__main__":
+    if len(sys.argv) == 4 and sys.argv[1] == "--child":
+        child(sys.argv[2], sys.argv[3])
+    else:
+        main()
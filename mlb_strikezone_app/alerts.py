@@ -0,0 +1,156 @@
+"""User alert rules, checked against every new pitch of every followed game (`--alert`, see the README)."""
+import ast
+import re
+
+from mlb_strikezone_app.mlb_api import load_play_outcome_codes
+from mlb_strikezone_app.umpire import CALLED_STRIKE_CODES, CALLED_BALL_CODES, STRIKE_ZONES
+
+ALERT_PRESETS = {
+    "heat": "pitch_speed >= 100",
+    "full_count_bases_loaded": "full_count and bases_loaded",
+    "missed_call": "called_strike and not in_zone or called_ball and in_zone",
+    "score_change": "runs_scored > 0",
+}
+
+SUMMARY_FIELDS = ("inning_number", "inning_half", "home_team_score", "away_team_score", "hitter", "pitcher",
+                  "balls", "strikes", "outs", "runners_on", "ball_strike_or_foul", "pitch_type", "pitch_speed",
+                  "pitch_zone", "pitch_x", "pitch_y", "pitch_outcome", "description", "umpire_correct",
+                  "umpire_called")
+# Computed per pitch: 3-2 count, a runner on every base, zones 1-9, the umpire's call (see
+# umpire.py) and runs since the game's previous pitch.
+DERIVED_FIELDS = ("full_count", "bases_loaded", "in_zone", "called_strike", "called_ball", "runs_scored")
+
+# The only syntax a rule may use: no calls, attributes, subscripts or comprehensions.
+ALLOWED_NODES = (ast.Expression, ast.BoolOp, ast.And, ast.Or, ast.UnaryOp, ast.Not, ast.USub, ast.Compare,
+                 ast.Eq, ast.NotEq, ast.Lt, ast.LtE, ast.Gt, ast.GtE, ast.In, ast.NotIn, ast.BinOp, ast.Add,
+                 ast.Sub, ast.Mult, ast.Div, ast.Name, ast.Load, ast.Constant, ast.Tuple)
+
+SYMBOLS = {"≥": ">=", "≤": "<=", "≠": "!="}
+
+# Fields telling a new pitch from the same pitch summarized again (as StrikeZone_Updates.pitch_identity).
+IDENTITY_FIELDS = ('pitch_x', 'pitch_y', 'pitch_speed', 'balls', 'strikes', 'outs')
+
+_NAMED_RULE = re.compile(r"^\s*([A-Za-z_]\w*)\s*=(?!=)\s*(.+)$")
+
+
+class AlertRule:
+    """
+      One compiled rule.
+
+      Attributes:
+          name (str): Shown when the rule fires.
+          source (str): The expression as written.
+          code (code): Compiled expression.
+      """
+
+    __slots__ = ("name", "source", "code")
+
+    def __init__(self, name, source, code):
+        self.name = name
+        self.source = source
+        self.code = code
+
+    def matches(self, namespace):
+        """Return True if the rule holds for a pitch's namespace."""
+        try:
+            return bool(eval(self.code, {"__builtins__": {}}, namespace))
+        except (TypeError, ZeroDivisionError):
+            return False
+
+
+def compile_rule(text):
+    """
+    Parse, validate and compile one rule. Rules are checked against ALLOWED_NODES and the
+    known fields once, at startup; ≥ ≤ ≠ are accepted for >= <= !=.
+
+    Args:
+        text (str): "name=expression", an expression, or an ALERT_PRESETS name.
+
+    Returns:
+        AlertRule: The compiled rule.
+
+    Raises:
+        ValueError: The rule is not valid, uses syntax outside the whitelist or an unknown name.
+    """
+    name, source = text.strip(), ALERT_PRESETS.get(text.strip())
+    if source is None:
+        named = _NAMED_RULE.match(text)
+        name, source = (named.group(1), named.group(2)) if named else (text.strip(), text)
+        source = ALERT_PRESETS.get(source.strip(), source)
+    for symbol, operator in SYMBOLS.items():
+        source = source.replace(symbol, operator)
+    try:
+        tree = ast.parse(source.strip(), mode='eval')
+    except SyntaxError as e:
+        raise ValueError(f"Alert rule {text!r} is not a valid expression: {e.msg}") from None
+    for node in ast.walk(tree):
+        if not isinstance(node, ALLOWED_NODES):
+            raise ValueError(f"Alert rule {text!r} uses unsupported syntax: {type(node).__name__}")
+        if isinstance(node, ast.Name) and node.id not in SUMMARY_FIELDS + DERIVED_FIELDS:
+            raise ValueError(f"Alert rule {text!r} uses unknown field {node.id!r}")
+    return AlertRule(name, source.strip(), compile(tree, f"<alert {name}>", 'eval'))
+
+
+class AlertEngine:
+    """
+      The compiled rules plus the little per-game state they need (the previous pitch, for
+      repeats and runs_scored). Only fed new pitches, so checking costs one namespace and one
+      eval per rule per pitch, independent of how long the games have run.
+
+      Attributes:
+          rules (list): Compiled AlertRule objects, in the order given.
+      """
+
+    def __init__(self, rules=()):
+        """
+        Args:
+            rules (iterable): Rule texts, see `compile_rule`.
+
+        Raises:
+            ValueError: One of the rules is not valid.
+        """
+        self.rules = [compile_rule(rule) for rule in rules]
+        self._last = {}  # game id -> (identity of its latest pitch, total runs)
+        codes = load_play_outcome_codes()
+        self._called_strikes = {codes[code] for code in CALLED_STRIKE_CODES if code in codes}
+        self._called_balls = {codes[code] for code in CALLED_BALL_CODES if code in codes}
+
+    def check(self, game_id, pitch_summary):
+        """
+        Evaluate every rule against one new pitch of a game.
+
+        Args:
+            game_id (str): Game the pitch belongs to.
+            pitch_summary (dict): Pitch summary from Pitch_Stream.
+
+        Returns:
+            list: Names of the rules that fired; empty for a summary of the pitch already checked.
+        """
+        if not self.rules:
+            return []
+        identity = tuple(pitch_summary.get(field) for field in IDENTITY_FIELDS)
+        previous_identity, previous_runs = self._last.get(game_id, (None, None))
+        if identity == previous_identity:
+            return []
+        home, away = pitch_summary.get('home_team_score'), pitch_summary.get('away_team_score')
+        runs = home + away if isinstance(home, int) and isinstance(away, int) else previous_runs
+        self._last[game_id] = (identity, runs)
+        if pitch_summary.get('pitch_type', '') == '':
+            return []  # A message ("Inning coming up.") rather than a pitch.
+
+        namespace = {field: pitch_summary.get(field) for field in SUMMARY_FIELDS}
+        runners_on = pitch_summary.get('runners_on', 0)
+        zone = pitch_summary.get('pitch_zone', -1)
+        namespace.update(
+            full_count=pitch_summary.get('balls') == 3 and pitch_summary.get('strikes') == 2,
+            bases_loaded=runners_on == 3,
+            in_zone=zone in STRIKE_ZONES,
+            called_strike=pitch_summary.get('pitch_outcome') in self._called_strikes and zone != -1,
+            called_ball=pitch_summary.get('pitch_outcome') in self._called_balls and zone != -1,
+            runs_scored=runs - previous_runs if runs is not None and previous_runs is not None else 0,
+        )
+        return [rule.name for rule in self.rules if rule.matches(namespace)]
+
+    def forget(self, game_id):
+        """Drop a game's state once it left the schedule."""
+        self._last.pop(game_id, None)
@@ -0,0 +1,51 @@
+import hashlib
+import os
+
+script_dir = os.path.dirname(os.path.abspath(__file__))
+
+strike_zone_picture_path = os.path.join(script_dir, 'strike_zone.JPG')
+
+# Pre-scaled copies of the strike zone picture, one PNG per canvas size, DPI and source file.
+ASSET_CACHE_DIR = os.path.join(os.path.expanduser("~"), ".mlb_strikezone_assets")
+
+
+def file_digest(path):
+    """Return the sha1 hex digest of a file's bytes."""
+    with open(path, 'rb') as file:
+        return hashlib.sha1(file.read()).hexdigest()
+
+
+def scaled_background_path(width, height, dpi, source=strike_zone_picture_path, directory=None):
+    """
+    Return a PNG of `source` resized to (width, height), creating it on first use.
+
+    The file name holds the size, the DPI and a hash of the source bytes, so a new
+    picture or a different display gets its own entry and a warm start skips both the
+    JPEG decode and the LANCZOS resize. PNG can be loaded straight into `tk.PhotoImage`,
+    so Pillow is only imported when the entry has to be built.
+
+    Args:
+        width (int): Target width in pixels.
+        height (int): Target height in pixels.
+        dpi (int): Display DPI the entry is made for.
+        source (str): Picture to scale. Defaults to strike_zone.JPG.
+        directory (str, optional): Cache folder. Defaults to ASSET_CACHE_DIR.
+
+    Returns:
+        str: Path of the cached PNG.
+    """
+    directory = directory or ASSET_CACHE_DIR
+    name = f"strike_zone_{width}x{height}_{dpi}dpi_{file_digest(source)[:16]}.png"
+    path = os.path.join(directory, name)
+    if os.path.exists(path):
+        return path
+
+    from PIL import Image
+    os.makedirs(directory, exist_ok=True)
+    with Image.open(source) as image:
+        scaled = image.convert("RGB").resize((width, height), Image.LANCZOS)
+    # Write then rename so a crash mid-write never leaves a truncated PNG behind.
+    temp_path = f"{path}.{os.getpid()}.tmp"
+    scaled.save(temp_path, "PNG")
+    os.replace(temp_path, path)
+    return path
@@ -0,0 +1,333 @@
+import json
+import os
+import sys
+import time
+from datetime import datetime, timezone
+from email.utils import parsedate_to_datetime
+from itertools import groupby
+
+import numpy as np
+
+from mlb_strikezone_app.http_client import CircuitOpenError, is_transient
+from mlb_strikezone_app.mlb_api import MLB_API_Calls, SPORTRADAR_BASE_URL
+from mlb_strikezone_app.pbp_state import iter_pitches
+from mlb_strikezone_app.pitch_store import GamePitchStore, COLUMNS
+from mlb_strikezone_app.scheduler import PollScheduler
+
+DEFAULT_ARCHIVE_DIR = os.path.join(os.path.expanduser("~"), ".mlb_strikezone_archive")
+
+# Schedule statuses of games whose play-by-play is final.
+COMPLETED_STATUSES = ("closed", "complete")
+
+# Transient failures (timeouts, 429, 5xx) of a request are retried this many times, waiting
+# RETRY_BASE_SECONDS, then twice as long each time up to RETRY_MAX_SECONDS, or as long as
+# the reply's Retry-After asks, before the game counts as failed for this run.
+RETRIES = 4
+RETRY_BASE_SECONDS = 2
+RETRY_MAX_SECONDS = 120
+
+# checkpoint.json lists every game written so far, so it is rewritten once per this many
+# games (and when the run stops) rather than after each one. A hard crash refetches at most
+# this many games.
+CHECKPOINT_EVERY_GAMES = 25
+
+# Columns whose values are codes into the archive's string table.
+STRING_COLUMNS = ("outcome", "pitch_type", "pitcher", "hitter", "at_bat")
+
+# The archive adds the row's game (index into games.json) to the pitch store columns, and
+# widens its outcome and pitch type codes: they index the season-wide string table, which
+# also holds every player and at-bat id and outgrows uint16 long before the season ends.
+ARCHIVE_COLUMNS = dict(COLUMNS, outcome="I", pitch_type="I", game="I")
+
+
+def home_plate_umpire(game_data):
+    """Return the full name of a game's home plate umpire, or None if the feed does not list officials."""
+    for official in game_data.get('officials', []):
+        if official.get('assignment') == 'HP':
+            return official.get('full_name') or f"{official.get('first_name', '')} {official.get('last_name', '')}".strip()
+    return None
+
+
+def retry_delay(error, attempt):
+    """
+    Seconds to wait before retry number `attempt` (0 for the first) of a transiently failed
+    request: the reply's Retry-After (seconds or an HTTP date) when it sends one, exponential
+    backoff otherwise, and the breaker's wait while it is open.
+    """
+    delay = min(RETRY_BASE_SECONDS * 2 ** attempt, RETRY_MAX_SECONDS)
+    response = getattr(error, 'response', None)
+    retry_after = response.headers.get('Retry-After') if response is not None else None
+    if retry_after:
+        try:
+            delay = float(retry_after)
+        except ValueError:
+            try:
+                delay = (parsedate_to_datetime(retry_after) - datetime.now(timezone.utc)).total_seconds()
+            except (TypeError, ValueError):
+                pass
+    return min(max(delay, 0), RETRY_MAX_SECONDS)
+
+
+def _write_json(path, data):
+    # Write then rename so a crash never leaves a half-written checkpoint or index.
+    temp_path = f"{path}.tmp"
+    with open(temp_path, 'w') as file:
+        json.dump(data, file)
+    os.replace(temp_path, path)
+
+
+class Season_Backfill(MLB_API_Calls):
+    """
+      Fetches the pbp.json of every completed game of a season and flattens the pitches
+      into a columnar NumPy archive.
+
+      Games are walked date by date from the season schedule. Each finished game is
+      written to its own part file under `parts/` and recorded in `checkpoint.json` every
+      CHECKPOINT_EVERY_GAMES games and when the run stops, so an interrupted run (Ctrl+C,
+      network error, trial quota spent) resumes where it stopped. Timeouts, 429 and 5xx
+      replies are retried with backoff before a game is given up for the run.
+      Once every game is in, the parts are concatenated into one `.npy` per column under
+      `columns/`, which PitchArchive memory-maps.
+
+      Requests go through the shared session, so they wait on its RateLimiter, and every
+      call is counted by a PollScheduler against the monthly quota.
+
+      Attributes:
+          season (int): Season year.
+          season_type (str): 'PRE', 'REG' or 'PST'.
+          archive_dir (str): Folder of the archive, its parts and its checkpoint.
+          done (dict): Game id -> {"date": ..., "rows": ..., "umpire": ...} of every game already written.
+          unsaved (int): Games in `done` that are not in checkpoint.json yet.
+          poll_scheduler (PollScheduler): Tracks the API call budget.
+      """
+
+    def __init__(self, api_key, access_level, season, archive_dir, season_type='REG', base_url=SPORTRADAR_BASE_URL):
+        """
+        Args:
+            api_key (str): The user's Sportradar API key.
+            access_level (str): The API access level (e.g., "trial" or "production").
+            season (int): Season year.
+            archive_dir (str): Folder to build the archive in.
+            season_type (str): 'PRE', 'REG' or 'PST'.
+            base_url (str, optional): Root of the MLB API. Defaults to Sportradar.
+        """
+        MLB_API_Calls.__init__(self, api_key, access_level, base_url=base_url)
+        self.season = season
+        self.season_type = season_type
+        self.archive_dir = archive_dir
+        self.parts_dir = os.path.join(archive_dir, 'parts')
+        self.checkpoint_path = os.path.join(archive_dir, 'checkpoint.json')
+        os.makedirs(self.parts_dir, exist_ok=True)
+        self.done = self._load_checkpoint()
+        self.unsaved = 0
+        self.poll_scheduler = PollScheduler(access_level)
+        self.http.request_hooks.append(self.poll_scheduler.record_request)
+
+    def _load_checkpoint(self):
+        if not os.path.exists(self.checkpoint_path):
+            return {}
+        with open(self.checkpoint_path, 'r') as file:
+            checkpoint = json.load(file)
+        if (checkpoint.get('season'), checkpoint.get('season_type')) != (self.season, self.season_type):
+            raise ValueError(f"{self.archive_dir} holds the {checkpoint.get('season')} "
+                             f"{checkpoint.get('season_type')} season; pick another archive folder.")
+        return checkpoint.get('done', {})
+
+    def _save_checkpoint(self):
+        _write_json(self.checkpoint_path, {"season": self.season, "season_type": self.season_type,
+                                           "done": self.done})
+        self.unsaved = 0
+
+    def _with_retries(self, fetch, *args):
+        # Calls fetch(*args), retrying transient failures per RETRIES; other errors raise at once.
+        for attempt in range(RETRIES + 1):
+            try:
+                return fetch(*args)
+            except Exception as e:
+                if attempt == RETRIES or not is_transient(e):
+                    raise
+                delay = retry_delay(e, attempt)
+                if isinstance(e, CircuitOpenError):
+                    delay = max(delay, self.http.breaker.reset_seconds)
+                print(f"{type(e).__name__}: {e}; retrying in {delay:.0f} s", file=sys.stderr)
+                time.sleep(delay)
+
+    def completed_games(self):
+        """
+        Returns:
+            list: (date, game_id) of every completed game of the season, in date order.
+        """
+        games = []
+        for game in self._with_retries(self.get_season_schedule, self.season, self.season_type):
+            if game.get('status') in COMPLETED_STATUSES:
+                games.append((game.get('scheduled', '')[:10], game.get('id')))
+        return sorted(games)
+
+    def run(self):
+        """
+        Backfill every completed game not in the checkpoint yet, then build the archive.
+
+        Returns:
+            bool: True when every game is in and the archive was built, False if the run
+            stopped early (quota spent or failed games to retry).
+        """
+        games = self.completed_games()
+        failed = 0
+        try:
+            for day, day_games in groupby(games, key=lambda item: item[0]):
+                pending = [game_id for _, game_id in day_games if game_id not in self.done]
+                if not pending:
+                    continue
+                print(f"{day}: {len(pending)} games", file=sys.stderr)
+                for game_id in pending:
+                    if self.poll_scheduler.remaining_budget() == 0:
+                        print("Monthly API quota spent; run again next month to resume.", file=sys.stderr)
+                        return False
+                    try:
+                        self.backfill_game(game_id, day)
+                    except Exception as e:
+                        failed += 1
+                        print(f"Error backfilling {game_id}:", e, file=sys.stderr)
+        finally:
+            if self.unsaved:
+                self._save_checkpoint()
+        if failed:
+            print(f"{failed} games failed; run again to retry them.", file=sys.stderr)
+            return False
+        self.build_archive([game_id for _, game_id in games])
+        return True
+
+    def backfill_game(self, game_id, day):
+        """
+        Fetch one game and write its pitches to a part file. checkpoint.json is rewritten
+        every CHECKPOINT_EVERY_GAMES games.
+
+        Args:
+            game_id (str): Game to fetch.
+            day (str): Its schedule date as YYYY-MM-DD.
+        """
+        game_data = self._with_retries(self.get_pbp_data, game_id)
+        store = GamePitchStore()
+        for inning, half, at_bat, pitch in iter_pitches(game_data):
+            store.append(inning.get('number', 0), half.get('half', ''), at_bat, pitch)
+
+        columns = {name: np.frombuffer(column, dtype=column.typecode) for name, column in store.columns.items()}
+        # Part codes index this game's own string table; build_archive maps them to a shared one.
+        columns['strings'] = np.array(store.strings.values, dtype=str)
+        part_path = os.path.join(self.parts_dir, f"{game_id}.npz")
+        temp_path = os.path.join(self.parts_dir, f"{game_id}.tmp.npz")
+        np.savez(temp_path, **columns)
+        os.replace(temp_path, part_path)
+
+        self.done[game_id] = {"date": day, "rows": len(store), "umpire": home_plate_umpire(game_data)}
+        self.unsaved += 1
+        if self.unsaved >= CHECKPOINT_EVERY_GAMES:
+            self._save_checkpoint()
+
+    def build_archive(self, game_ids):
+        """
+        Concatenate the part files of `game_ids`, in that order, into one memory-mappable
+        `.npy` per column, plus `strings.json` and the `games.json` index. Only one game's
+        part is held in memory at a time.
+
+        Args:
+            game_ids (list): Games to include, all present in `done`.
+        """
+        total = sum(self.done[game_id]["rows"] for game_id in game_ids)
+        columns_dir = os.path.join(self.archive_dir, 'columns')
+        os.makedirs(columns_dir, exist_ok=True)
+        outputs = {name: np.lib.format.open_memmap(os.path.join(columns_dir, f"{name}.npy"), mode='w+',
+                                                   dtype=np.dtype(typecode), shape=(total,))
+                   for name, typecode in ARCHIVE_COLUMNS.items()}
+
+        codes = {}
+        games = []
+        start = 0
+        for game_index, game_id in enumerate(game_ids):
+            with np.load(os.path.join(self.parts_dir, f"{game_id}.npz")) as part:
+                local_strings = part['strings']
+                remap = np.array([codes.setdefault(value, len(codes)) for value in local_strings.tolist()],
+                                 dtype=np.uint32)
+                for name in STRING_COLUMNS:
+                    if len(codes) > np.iinfo(outputs[name].dtype).max + 1:
+                        raise OverflowError(f"{len(codes)} archive strings overflow the {outputs[name].dtype} "
+                                            f"'{name}' column")
+                stop = start + self.done[game_id]["rows"]
+                for name in COLUMNS:
+                    values = part[name]
+                    outputs[name][start:stop] = remap[values] if name in STRING_COLUMNS and len(values) else values
+            outputs['game'][start:stop] = game_index
+            games.append({"id": game_id, "date": self.done[game_id]["date"], "umpire": self.done[game_id].get("umpire"),
+                          "start": start, "stop": stop})
+            start = stop
+
+        for output in outputs.values():
+            output.flush()
+        _write_json(os.path.join(self.archive_dir, 'strings.json'), list(codes))
+        # Written last: PitchArchive only opens an archive that has its index.
+        _write_json(os.path.join(self.archive_dir, 'games.json'),
+                    {"season": self.season, "season_type": self.season_type, "games": games})
+        print(f"Archive built: {total} pitches from {len(games)} games in {self.archive_dir}", file=sys.stderr)
+
+
+class PitchArchive:
+    """
+      Read side of a backfilled season: every column memory-mapped, so opening the
+      archive costs a few file opens and analytics only page in the columns they touch.
+
+      Attributes:
+          directory (str): Archive folder.
+          columns (dict): Column name -> read-only numpy.memmap (see ARCHIVE_COLUMNS).
+          strings (list): String table the code columns index into.
+          games (list): {"id", "date", "umpire", "start", "stop"} per game, in archive order.
+      """
+
+    def __init__(self, directory):
+        self.directory = directory
+        with open(os.path.join(directory, 'games.json'), 'r') as file:
+            index = json.load(file)
+        with open(os.path.join(directory, 'strings.json'), 'r') as file:
+            self.strings = json.load(file)
+        self.season = index['season']
+        self.games = index['games']
+        self.columns = {name: np.load(os.path.join(directory, 'columns', f"{name}.npy"), mmap_mode='r')
+                        for name in ARCHIVE_COLUMNS}
+        self._codes = None
+        self._game_index = {game['id']: game for game in self.games}
+
+    def __len__(self):
+        return len(self.columns['x'])
+
+    def code(self, value):
+        """Return the code of a string in the archive, or None if it never occurs."""
+        if self._codes is None:
+            self._codes = {string: code for code, string in enumerate(self.strings)}
+        return self._codes.get(value)
+
+    def game_rows(self, game_id):
+        """Return the slice of rows holding one game's pitches."""
+        game = self._game_index[game_id]
+        return slice(game['start'], game['stop'])
+
+
+def run_backfill(api_key, access_level, season, archive_dir=None, season_type='REG', base_url=SPORTRADAR_BASE_URL):
+    """
+    Backfill a season into `archive_dir` (default ~/.mlb_strikezone_archive/<season>_<type>).
+
+    Args:
+        api_key (str): The user's Sportradar API key.
+        access_level (str): The API access level (e.g., "trial" or "production").
+        season (int): Season year.
+        archive_dir (str, optional): Archive folder.
+        season_type (str): 'PRE', 'REG' or 'PST'.
+        base_url (str, optional): Root of the MLB API. Defaults to Sportradar.
+
+    Returns:
+        bool: True when the archive was built.
+    """
+    archive_dir = archive_dir or os.path.join(DEFAULT_ARCHIVE_DIR, f"{season}_{season_type}")
+    try:
+        return Season_Backfill(api_key, access_level, season, archive_dir, season_type, base_url).run()
+    except KeyboardInterrupt:
+        print("Interrupted; run the same command again to resume.", file=sys.stderr)
+        return False
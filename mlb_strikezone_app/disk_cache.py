@@ -0,0 +1,166 @@
+import hashlib
+import json
+import os
+import threading
+import time
+from urllib.parse import urlsplit, urlunsplit, parse_qsl, urlencode
+
+import requests
+
+from mlb_strikezone_app.modes import CACHE_MODES
+
+DEFAULT_CACHE_DIR = os.path.join(os.path.expanduser("~"), ".mlb_strikezone_cache")
+DEFAULT_MAX_BYTES = 200 * 1024 * 1024
+
+# Seconds a stored response is served without going to the network, by endpoint.
+DEFAULT_TTLS = {
+    "teams": 24 * 60 * 60,
+    "schedule": 60,
+    "pbp": 2,
+    "push": 0,  # Streams bypass the cache; listed so every endpoint kind has a TTL.
+    "other": 60,
+}
+
+
+class ReplayMissError(requests.RequestException):
+    """Raised in replay mode when a URL was never recorded."""
+
+
+def cache_key_url(url):
+    """Return `url` without its api_key query parameter, so recordings are key independent."""
+    parts = urlsplit(url)
+    query = [(k, v) for k, v in parse_qsl(parts.query) if k != "api_key"]
+    return urlunsplit((parts.scheme, parts.netloc, parts.path, urlencode(query), ""))
+
+
+def endpoint_kind(url):
+    """Classify a Sportradar URL as 'teams', 'schedule', 'pbp', 'push' or 'other' for TTL lookup."""
+    path = urlsplit(url).path
+    if path.endswith("/subscribe"):
+        return "push"
+    for kind in ("teams", "schedule", "pbp"):
+        if path.endswith(f"/{kind}.json"):
+            return kind
+    return "other"
+
+
+class ResponseCache:
+    """
+      On-disk cache of Sportradar responses underneath Sportradar_Session.
+
+      Each response body is stored as `<sha1>.body` next to a `<sha1>.json` metadata file,
+      keyed by the URL minus its api_key. In "record" mode fresh entries (within their
+      endpoint TTL) are served from disk and every network 200 is written back; in
+      "replay" mode only recorded responses are served, TTLs are ignored and nothing touches
+      the network, so a recorded game day can be replayed offline at zero quota.
+      The directory is kept under `max_bytes` by evicting least recently used entries.
+
+      Attributes:
+          directory (str): Folder holding the cached files.
+          mode (str): "record" or "replay".
+          max_bytes (int): Size bound of the cache directory.
+          ttls (dict): Endpoint kind -> seconds an entry is considered fresh.
+      """
+
+    def __init__(self, directory=DEFAULT_CACHE_DIR, mode="record", max_bytes=DEFAULT_MAX_BYTES, ttls=None):
+        if mode not in CACHE_MODES or mode == "off":
+            raise ValueError(f"Unknown cache mode: {mode}")
+        self.directory = directory
+        self.mode = mode
+        self.max_bytes = max_bytes
+        self.ttls = dict(DEFAULT_TTLS, **(ttls or {}))
+        self._lock = threading.Lock()
+        os.makedirs(self.directory, exist_ok=True)
+
+    def _paths(self, url):
+        digest = hashlib.sha1(cache_key_url(url).encode("utf-8")).hexdigest()
+        base = os.path.join(self.directory, digest)
+        return base + ".body", base + ".json"
+
+    def lookup(self, url):
+        """
+        Return the stored response for a URL if it may be served.
+
+        Args:
+            url (str): Full request URL (the api_key is ignored).
+
+        Returns:
+            requests.Response or None: A 200 response rebuilt from disk, or None on a miss
+            or (in record mode) an expired entry.
+
+        Raises:
+            ReplayMissError: In replay mode when the URL was never recorded.
+        """
+        body_path, meta_path = self._paths(url)
+        try:
+            with open(meta_path, "r") as file:
+                meta = json.load(file)
+            with open(body_path, "rb") as file:
+                body = file.read()
+        except (OSError, ValueError):
+            if self.mode == "replay":
+                raise ReplayMissError(f"Not recorded: {cache_key_url(url)}")
+            return None
+
+        if self.mode == "record" and time.time() - meta["stored_at"] > self.ttls[endpoint_kind(url)]:
+            return None
+
+        now = time.time()
+        os.utime(meta_path, (now, now))  # LRU order follows last use.
+        response = requests.models.Response()
+        response.status_code = 200
+        response.url = url
+        response._content = body
+        response.headers.update(meta.get("headers", {}))
+        response.headers["X-Cache-Stored-At"] = str(meta["stored_at"])
+        return response
+
+    def store(self, response):
+        """
+        Persist a 200 response (record mode only) and evict old entries if over `max_bytes`.
+
+        Args:
+            response (requests.Response): Network response to store.
+        """
+        if self.mode != "record" or response.status_code != 200:
+            return
+        body_path, meta_path = self._paths(response.url)
+        headers = {k: response.headers[k] for k in ("ETag", "Last-Modified", "Content-Type") if k in response.headers}
+        meta = {"url": cache_key_url(response.url), "stored_at": time.time(), "headers": headers}
+        self._write(body_path, response.content, "wb")
+        self._write(meta_path, json.dumps(meta), "w")
+        self._evict()
+
+    @staticmethod
+    def _write(path, data, flags):
+        temp_path = f"{path}.{threading.get_ident()}.tmp"
+        with open(temp_path, flags) as file:
+            file.write(data)
+        os.replace(temp_path, path)
+
+    def _evict(self):
+        with self._lock:
+            entries = []
+            total = 0
+            for name in os.listdir(self.directory):
+                if not name.endswith(".json"):
+                    continue
+                meta_path = os.path.join(self.directory, name)
+                body_path = meta_path[:-len(".json")] + ".body"
+                try:
+                    size = os.path.getsize(body_path) + os.path.getsize(meta_path)
+                    last_used = os.path.getmtime(meta_path)
+                except OSError:
+                    continue
+                entries.append((last_used, size, body_path, meta_path))
+                total += size
+            entries.sort()
+            for last_used, size, body_path, meta_path in entries:
+                if total <= self.max_bytes:
+                    break
+                for path in (body_path, meta_path):
+                    try:
+                        os.remove(path)
+                    except OSError:
+                        pass
+                total -= size
@@ -0,0 +1,317 @@
+"""One shared poller for many viewers: `--serve PORT` broadcasts every pitch over Server-Sent Events."""
+import json
+import random
+import sys
+import threading
+from collections import deque
+from http.server import ThreadingHTTPServer, BaseHTTPRequestHandler
+
+from mlb_strikezone_app.fetch_worker import ResultsThread
+from mlb_strikezone_app.headless import Headless_Pitch_Stream
+from mlb_strikezone_app.metrics import shared_metrics
+from mlb_strikezone_app.mlb_api import SPORTRADAR_BASE_URL
+from mlb_strikezone_app.push_feed import RECONNECT_BASE_SECONDS, MAX_RECONNECT_SECONDS
+
+# Events kept for clients resuming with Last-Event-ID.
+EVENT_BACKLOG = 2000
+
+# Idle streams get a comment line this often, so proxies keep them open and clients can time out dead ones.
+KEEPALIVE_SECONDS = 15
+CLIENT_READ_TIMEOUT_SECONDS = 3 * KEEPALIVE_SECONDS
+
+
+def sse_event(event_id, event, data):
+    """Encode one Server-Sent Event."""
+    return f"id: {event_id}\nevent: {event}\ndata: {json.dumps(data)}\n\n".encode('utf-8')
+
+
+class Broadcaster:
+    """
+      Thread-safe hub between the poller and the client streams.
+
+      Each event is encoded once when published; every client stream writes the same bytes.
+      Streams wait on a condition for events newer than the last one they sent, so a slow
+      client only ever delays itself.
+
+      Attributes:
+          last_id (int): Id of the newest event.
+          games (bytes or None): Latest encoded games event.
+          latest_pitches (dict): Game id -> latest encoded pitch event of that game.
+      """
+
+    def __init__(self, backlog=EVENT_BACKLOG):
+        self.last_id = 0
+        self.games = None
+        self.latest_pitches = {}
+        self._events = deque(maxlen=backlog)
+        self._changed = threading.Condition()
+
+    def publish(self, event, data, game_id=None):
+        """Encode and queue an event for every client."""
+        with self._changed:
+            self.last_id += 1
+            encoded = sse_event(self.last_id, event, data)
+            self._events.append((self.last_id, encoded))
+            if event == "games":
+                self.games = encoded
+                # Games that dropped off the schedule leave the snapshot too.
+                live = set(data["games"].values())
+                self.latest_pitches = {game: pitch for game, pitch in self.latest_pitches.items() if game in live}
+            elif event == "pitch":
+                self.latest_pitches[game_id] = encoded
+            self._changed.notify_all()
+        shared_metrics().increment("fanout_events", event=event)
+
+    def snapshot(self):
+        """Return (last_id, [encoded events]) bringing a new client up to date."""
+        with self._changed:
+            events = ([self.games] if self.games is not None else []) + list(self.latest_pitches.values())
+            return self.last_id, events
+
+    def events_after(self, event_id, timeout):
+        """
+        Wait up to `timeout` seconds for events newer than `event_id`.
+
+        Returns:
+            tuple: (last_id, [encoded events]); the events are None when `event_id` is older
+            than the backlog, or from before a server restart, and the client needs a snapshot instead.
+        """
+        with self._changed:
+            if event_id > self.last_id:
+                return self.last_id, None
+            self._changed.wait_for(lambda: self.last_id > event_id, timeout)
+            if self.last_id <= event_id:
+                return event_id, []
+            if not self._events or self._events[0][0] > event_id + 1:
+                return self.last_id, None
+            return self.last_id, [encoded for number, encoded in self._events if number > event_id]
+
+
+class FanoutPoller(Headless_Pitch_Stream):
+    """
+      The headless poller (or push feed reader), publishing to a Broadcaster instead of
+      writing JSON lines, so one Sportradar call budget serves every viewer.
+
+      Attributes:
+          broadcaster (Broadcaster): Hub the games and pitches are published to.
+      """
+
+    def __init__(self, api_key, access_level, broadcaster, game_ids=None, schedule_date=None,
+                 base_url=SPORTRADAR_BASE_URL, push=False):
+        Headless_Pitch_Stream.__init__(self, api_key, access_level, None, game_ids, schedule_date, base_url, push)
+        self.broadcaster = broadcaster
+
+    def get_live_games(self, all_teams):
+        before = dict(self.live_games_dict)
+        transitions = Headless_Pitch_Stream.get_live_games(self, all_teams)
+        if self.live_games_dict != before or self.broadcaster.games is None:
+            self.broadcaster.publish("games", {"games": self.live_games_dict})
+        return transitions
+
+    def emit(self, game_id, matchup, pitch_summary):
+        """Publish one pitch summary to every client."""
+        self.broadcaster.publish("pitch", self.pitch_record(game_id, matchup, pitch_summary), game_id)
+
+
+class FanoutHandler(BaseHTTPRequestHandler):
+    """
+      Serves GET /events (text/event-stream) from the Broadcaster in `server.broadcaster`:
+
+          event: games   data: {"games": {matchup: game_id, ...}}
+          event: pitch   data: headless JSON line record (game_id, game, received_at, summary fields)
+
+      Every event has an increasing `id:`. A client reconnecting with Last-Event-ID gets the
+      events it missed, or a fresh snapshot when it fell behind the backlog; new clients
+      start from the snapshot.
+      """
+
+    protocol_version = "HTTP/1.1"
+
+    def do_GET(self):
+        if self.path.split('?')[0] != '/events':
+            self.send_error(404)
+            return
+        broadcaster = self.server.broadcaster
+        self.send_response(200)
+        self.send_header("Content-Type", "text/event-stream; charset=utf-8")
+        self.send_header("Cache-Control", "no-cache")
+        self.send_header("Transfer-Encoding", "chunked")
+        self.end_headers()
+        self.close_connection = True
+
+        metrics = shared_metrics()
+        metrics.increment("fanout_connections")
+        last_event_id = self.headers.get("Last-Event-ID", "")
+        if last_event_id.isdigit():
+            event_id, events = broadcaster.events_after(int(last_event_id), 0)
+        else:
+            event_id, events = None, None
+        if events is None:
+            event_id, events = broadcaster.snapshot()
+        while True:
+            self._write(b"".join(events) if events else b": keepalive\n\n")
+            event_id, events = broadcaster.events_after(event_id, KEEPALIVE_SECONDS)
+            if events is None:
+                metrics.increment("fanout_resnapshots")
+                event_id, events = broadcaster.snapshot()
+
+    def _write(self, data):
+        self.wfile.write(b"%x\r\n%s\r\n" % (len(data), data))
+
+    def log_message(self, *args):
+        pass
+
+
+class FanoutServer(ThreadingHTTPServer):
+    daemon_threads = True
+
+    def handle_error(self, request, client_address):
+        # Viewers closing their window end their stream with a broken pipe; that is routine.
+        if not isinstance(sys.exc_info()[1], ConnectionError):
+            super().handle_error(request, client_address)
+
+
+def serve_fanout(broadcaster, port, host="0.0.0.0"):
+    """
+    Serve a Broadcaster's /events stream from a daemon thread.
+
+    Returns:
+        FanoutServer: The running server.
+    """
+    server = FanoutServer((host, port), FanoutHandler)
+    server.broadcaster = broadcaster
+    threading.Thread(target=server.serve_forever, name="strikezone-fanout", daemon=True).start()
+    return server
+
+
+def run_fanout(api_key, access_level, port, host="0.0.0.0", game_ids=None, schedule_date=None,
+               base_url=SPORTRADAR_BASE_URL, push=False):
+    """
+    Poll once for everyone and serve the pitches at http://host:port/events until interrupted.
+
+    Args:
+        api_key (str): The user's Sportradar API key.
+        access_level (str): The API access level (e.g., "trial" or "production").
+        port (int): Port to serve the event stream on.
+        host (str): Interface to bind. Defaults to every interface, so the office can connect.
+        game_ids (iterable, optional): Restrict polling to these game ids.
+        schedule_date (datetime.date, optional): Day whose schedule is polled. Defaults to today.
+        base_url (str, optional): Root of the MLB API. Defaults to Sportradar.
+        push (bool): Take new pitches from the Sportradar push feed, polling only while it is down.
+    """
+    broadcaster = Broadcaster()
+    server = serve_fanout(broadcaster, port, host)
+    print(f"Serving pitches to viewers at http://{host}:{server.server_address[1]}/events", file=sys.stderr)
+    try:
+        FanoutPoller(api_key, access_level, broadcaster, game_ids, schedule_date, base_url, push).run_forever()
+    except KeyboardInterrupt:
+        pass
+    finally:
+        server.shutdown()
+
+
+class FanoutClient(ResultsThread):
+    """
+      Stand-in for FetchWorker when the window is a viewer of a `--serve` poller: it
+      reads the server's event stream and queues the same result tuples, so the window
+      renders them unchanged and never calls Sportradar itself.
+
+      Attributes:
+          app (StrikeZone_Updates): Window whose live_games_dict is kept in sync.
+          url (str): The server's /events URL.
+          prefetch_all (bool): Always True; the server sends every game.
+          connected (threading.Event): Set while the stream is open.
+          results (queue.Queue): Finished results for the UI thread.
+      """
+
+    prefetch_all = True
+
+    def __init__(self, app, server_url):
+        """
+        Args:
+            app (StrikeZone_Updates): The window being fed.
+            server_url (str): Root URL of the fan-out server, e.g. http://poller-host:8766.
+        """
+        super().__init__("strikezone-fanout-client")
+        self.app = app
+        self.url = server_url.rstrip('/') + '/events'
+        self.connected = threading.Event()
+        self._last_event_id = None
+        self._stopping = threading.Event()
+        self._response = None
+
+    def push_connected(self):
+        """Return True while the server stream is open."""
+        return self.connected.is_set()
+
+    def submit_poll(self, selected_game, refresh_schedule=True):
+        """Nothing to do: the server pushes games and pitches as they change."""
+
+    def submit_pitch(self, game_id):
+        """Nothing to do: the latest pitch of every game is already cached by the window."""
+
+    def stop(self):
+        """Close the stream and let the thread exit."""
+        self._stopping.set()
+        response = self._response
+        if response is not None:
+            response.close()
+
+    def run(self):
+        from mlb_strikezone_app.http_client import shared_session
+        failures = 0
+        while not self._stopping.is_set():
+            headers = {"accept": "text/event-stream"}
+            if self._last_event_id is not None:
+                headers["Last-Event-ID"] = self._last_event_id
+            try:
+                # Straight on the pooled session: viewer traffic is not Sportradar traffic,
+                # so it skips the rate limiter and the quota hooks.
+                self._response = shared_session().session.get(self.url, headers=headers, stream=True,
+                                                              timeout=CLIENT_READ_TIMEOUT_SECONDS)
+                with self._response:
+                    self._response.raise_for_status()
+                    self._response.encoding = 'utf-8'
+                    self.connected.set()
+                    failures = 0
+                    self._read_events(self._response.iter_lines(decode_unicode=True))
+                    raise ConnectionError("fan-out server closed the stream")
+            except Exception as e:
+                if self._stopping.is_set():
+                    return
+                failures += 1
+                self.results.put(("error", e))
+            finally:
+                self._response = None
+                self.connected.clear()
+            delay = min(MAX_RECONNECT_SECONDS, RECONNECT_BASE_SECONDS * 2 ** failures)
+            self._stopping.wait(delay * random.uniform(0.5, 1.5))
+
+    def _read_events(self, lines):
+        event_id, event, data = None, "message", []
+        for line in lines:
+            if self._stopping.is_set():
+                return
+            if line:
+                field, _, value = line.partition(":")
+                value = value[1:] if value.startswith(" ") else value
+                if field == "id":
+                    event_id = value
+                elif field == "event":
+                    event = value
+                elif field == "data":
+                    data.append(value)
+                continue
+            if data:
+                self._handle(event, json.loads("\n".join(data)))
+            if event_id is not None:
+                self._last_event_id = event_id
+            event_id, event, data = None, "message", []
+
+    def _handle(self, event, data):
+        if event == "games":
+            self.app.live_games_dict = dict(data["games"])
+            games = list(self.app.live_games_dict.values())
+            self.results.put(("games", games[0] if games else None))
+        elif event == "pitch":
+            self.results.put(("pitches", data["game_id"], [data]))
@@ -0,0 +1,209 @@
+import queue
+import threading
+from concurrent.futures import ThreadPoolExecutor
+
+from mlb_strikezone_app.metrics import shared_metrics
+from mlb_strikezone_app.mlb_api import load_teams
+from mlb_strikezone_app.push_feed import PushFeed
+from mlb_strikezone_app.replay import build_replay
+
+
+class ResultsThread(threading.Thread):
+    """
+      Daemon thread that hands finished results to the Tk loop: it puts result tuples on
+      `results` and the window's `root.after` callback takes them off with `drain`.
+
+      Attributes:
+          results (queue.Queue): Finished results for the UI thread.
+      """
+
+    def __init__(self, name):
+        super().__init__(name=name, daemon=True)
+        self.results = queue.Queue()
+
+    def drain(self):
+        """
+        Return every result that is ready without blocking.
+
+        Returns:
+            list: Result tuples in the order they were produced.
+        """
+        ready = []
+        while True:
+            try:
+                ready.append(self.results.get_nowait())
+            except queue.Empty:
+                return ready
+
+
+class FetchWorker(ResultsThread):
+    """
+      Background thread that performs every Sportradar request and all play-by-play
+      parsing on behalf of the Tk window, so the Tk main loop only ever renders.
+
+      Jobs are submitted with `submit_poll` / `submit_pitch` and finished results are
+      placed on `results` as tuples the UI drains from a `root.after` callback:
+
+          ("games", fetched_game_id)
+          ("pitches", game_id, [pitch_summary, ...])   # only when the pbp changed (no 304)
+          ("replay", game_id, ReplayIndex)              # after `submit_replay`
+          ("error", exception)
+
+      With `push` set, a PushFeed thread queues every pushed pitch as a job here, so all
+      parsing stays on this one thread. While the feed is connected, polls only refresh the
+      schedule; when it drops, they fetch pbp.json again until it is back.
+
+      Attributes:
+          app (StrikeZone_Updates): Object providing the MLB_API_Calls requests and the
+              get_latest_inning/summarize_at_bat parsing.
+          teams (dict or None): Team id to team name mapping used by get_live_games; None loads
+              teams.json on the first schedule refresh, off the Tk thread.
+          prefetch_all (bool): Refresh every live game on each poll, not just the selected one.
+          max_concurrency (int): Cap on parallel pbp fetches in prefetch mode.
+          push_feed (PushFeed or None): Push feed reader when `push` is set.
+          jobs (queue.Queue): Pending work for the thread. `None` stops the thread.
+          results (queue.Queue): Finished results for the UI thread.
+      """
+
+    def __init__(self, app, teams=None, prefetch_all=False, max_concurrency=4, push=False):
+        """
+        Args:
+            app (StrikeZone_Updates): The application instance whose API and parsing methods are used.
+            teams (dict, optional): Team id to team name mapping. Defaults to teams.json.
+            prefetch_all (bool): Refresh every live game on each poll.
+            max_concurrency (int): Cap on parallel pbp fetches in prefetch mode.
+            push (bool): Take new pitches from the push feed, polling only while it is down.
+        """
+        super().__init__("strikezone-fetch")
+        self.app = app
+        self.teams = teams
+        self.prefetch_all = prefetch_all
+        self.max_concurrency = max(1, max_concurrency)
+        self.pool = ThreadPoolExecutor(max_workers=self.max_concurrency,
+                                       thread_name_prefix="strikezone-prefetch") if prefetch_all else None
+        self.jobs = queue.Queue()
+        self.push_feed = PushFeed(app.push_url(), on_message=lambda payload: self.jobs.put(("push", payload)),
+                                  on_connect=lambda: self.jobs.put(("resume", None))) if push else None
+
+    def push_connected(self):
+        """Return True while new pitches arrive from the push feed instead of polls."""
+        return self.push_feed is not None and self.push_feed.connected.is_set()
+
+    def submit_poll(self, selected_game, refresh_schedule=True):
+        """
+        Queue a refresh: the live games schedule (when `refresh_schedule` is set) followed
+        by the pitch data of the game currently selected in the dropdown.
+
+        Args:
+            selected_game (str): Dropdown label of the selected game (may be 'No Live Games').
+            refresh_schedule (bool): Also re-fetch today's schedule.
+        """
+        self.jobs.put(("poll", (selected_game, refresh_schedule)))
+
+    def submit_pitch(self, game_id):
+        """
+        Queue a pitch data refresh for a single game.
+
+        Args:
+            game_id (str): The unique identifier of the game.
+        """
+        self.jobs.put(("pitch", game_id))
+
+    def submit_replay(self, game_id):
+        """
+        Queue a full fetch of a game's play-by-play, indexed for replay.
+
+        Args:
+            game_id (str): The unique identifier of the game.
+        """
+        self.jobs.put(("replay", game_id))
+
+    def stop(self):
+        """Ask the thread to exit after the job it is currently running."""
+        if self.push_feed is not None:
+            self.push_feed.stop()
+        self.jobs.put(None)
+
+    def run(self):
+        if self.push_feed is not None:
+            self.push_feed.start()
+        while True:
+            job = self.jobs.get()
+            if job is None:
+                if self.pool is not None:
+                    self.pool.shutdown(wait=False)
+                return
+            try:
+                kind, arg = job
+                if kind == "poll":
+                    self._poll(*arg)
+                elif kind == "pitch":
+                    self._pitch(arg)
+                elif kind == "push":
+                    self._push(arg)
+                elif kind == "resume":
+                    self._resume()
+                elif kind == "replay":
+                    with shared_metrics().timer("fetch", game=arg):
+                        self.results.put(("replay", arg, build_replay(self.app, arg)))
+            except Exception as e:
+                self.results.put(("error", e))
+
+    def _poll(self, selected_game, refresh_schedule):
+        if refresh_schedule:
+            self.app.get_live_games(self.teams if self.teams is not None else load_teams())
+        games = list(self.app.live_games_dict.values())
+        game_id = self.app.live_games_dict.get(selected_game)
+        if game_id is None and games:
+            # The UI falls back to the first game when nothing valid is selected.
+            game_id = games[0]
+        self.results.put(("games", game_id))
+        if self.push_connected():
+            return
+        if self.prefetch_all:
+            self._prefetch(games)
+        elif game_id is not None:
+            self._pitch(game_id, conditional=True)
+
+    def _push(self, payload):
+        game_id, summary = self.app.summarize_pushed_pitch(payload)
+        if summary is not None:
+            self.results.put(("pitches", game_id, [summary]))
+
+    def _resume(self):
+        # The feed cannot replay what was thrown while it was down: one conditional poll per
+        # game already being followed picks those pitches up (a 304 means none were missed).
+        game_ids = [game_id for game_id in self.app.live_games_dict.values() if game_id in self.app.game_progress]
+        if self.prefetch_all:
+            self._prefetch(game_ids)
+        else:
+            for game_id in game_ids:
+                try:
+                    self._pitch(game_id, conditional=True)
+                except Exception as e:
+                    self.results.put(("error", e))
+
+    def _prefetch(self, game_ids):
+        # Downloads run in parallel on the bounded pool; the shared session's rate limiter
+        # keeps them under the account QPS. Parsing stays on this thread, in order.
+        for game_id, game_data, error in self.pool.map(self._fetch_pbp, game_ids):
+            if error is not None:
+                self.results.put(("error", error))
+            elif game_data is not None:
+                self.results.put(("pitches", game_id, self.app.summarize_new_pitches(game_id, game_data)))
+
+    def _fetch_pbp(self, game_id):
+        # One failing game must not abort the rest of the slate.
+        try:
+            with shared_metrics().timer("fetch", game=game_id):
+                return game_id, self.app.fetch_new_pbp(game_id, True), None
+        except Exception as e:
+            return game_id, None, e
+
+    def _pitch(self, game_id, conditional=False):
+        # Scheduled polls are conditional so a 304 skips the decode and the render.
+        # Explicit game switches always fetch in full so the newly selected game renders.
+        with shared_metrics().timer("fetch", game=game_id):
+            summaries = self.app.stream_new_pitches(game_id, conditional)
+        if summaries is not None:
+            self.results.put(("pitches", game_id, summaries))
@@ -0,0 +1,200 @@
+import json
+import queue
+import sys
+import time
+from datetime import datetime, timezone
+
+from mlb_strikezone_app.alerts import AlertEngine
+from mlb_strikezone_app.metrics import shared_metrics
+from mlb_strikezone_app.mlb_api import Pitch_Stream, load_teams, SPORTRADAR_BASE_URL
+from mlb_strikezone_app.push_feed import PushFeed
+from mlb_strikezone_app.scheduler import PollScheduler
+
+
+class Headless_Pitch_Stream(Pitch_Stream):
+    """
+      Display-free poller that writes every new pitch summary as one JSON line.
+
+      Reuses the same schedule, pbp and parsing pipeline as the Tk window, without importing
+      tkinter, PIL or windll, so many of these can run per host on a Linux server.
+
+      Attributes:
+          output (file): Text stream the JSON lines are written to.
+          game_ids (set or None): Only these game ids are polled; None polls every live game.
+          poll_scheduler (PollScheduler): Picks poll intervals and tracks the API call budget.
+          push_feed (PushFeed or None): Push feed reader; pbp.json is only polled while it is down.
+          pushed (queue.Queue or None): Pushed pitch payloads, and None after each (re)connect.
+          alerts (AlertEngine): Alert rules; the names of the ones a pitch fires go in its "alerts".
+      """
+
+    def __init__(self, api_key, access_level, output=sys.stdout, game_ids=None, schedule_date=None,
+                 base_url=SPORTRADAR_BASE_URL, push=False, alert_rules=()):
+        """
+        Args:
+            api_key (str): The user's Sportradar API key.
+            access_level (str): The API access level (e.g., "trial" or "production").
+            output (file): Text stream to write JSON lines to. Defaults to stdout.
+            game_ids (iterable, optional): Restrict polling to these game ids.
+            schedule_date (datetime.date, optional): Day whose schedule is polled. Defaults to today.
+            base_url (str, optional): Root of the MLB API. Defaults to Sportradar.
+            push (bool): Take new pitches from the push feed, polling only while it is down.
+            alert_rules (iterable): Alert rule texts (see alerts.py).
+        """
+        Pitch_Stream.__init__(self, api_key, access_level, schedule_date, base_url)
+        self.output = output
+        self.game_ids = set(game_ids) if game_ids else None
+        self.poll_scheduler = PollScheduler(access_level)
+        self.http.request_hooks.append(self.poll_scheduler.record_request)
+        self.pushed = queue.Queue() if push else None
+        self.push_feed = PushFeed(self.push_url(), on_message=self.pushed.put,
+                                  on_connect=lambda: self.pushed.put(None)) if push else None
+        self.alerts = AlertEngine(alert_rules)
+
+    def evict_game(self, game_id):
+        """Drop a finished game's alert state as well."""
+        Pitch_Stream.evict_game(self, game_id)
+        self.alerts.forget(game_id)
+
+    def poll_once(self):
+        """
+        Refresh the schedule when due, then emit the new pitches of every tracked live game.
+
+        Returns:
+            dict: Game id -> latest pitch summary emitted this cycle.
+        """
+        if self.schedule.refresh_due():
+            self.get_live_games(load_teams())
+
+        latest = {}
+        for matchup, game_id in list(self.live_games_dict.items()):
+            if self.game_ids is not None and game_id not in self.game_ids:
+                continue
+            try:
+                game_data = self.fetch_new_pbp(game_id, conditional=True)
+                if game_data is None:
+                    continue
+                for pitch_summary in self.new_pitch_summaries(game_id, game_data):
+                    self.emit(game_id, matchup, pitch_summary)
+                    latest[game_id] = pitch_summary
+            except Exception as e:
+                shared_metrics().increment("errors", kind="fetch", error=type(e).__name__)
+                print(f"Error polling {game_id} ({type(e).__name__}):", e, file=sys.stderr)
+        return latest
+
+    def emit_pushed(self, payload):
+        """
+        Emit one pitch from the push feed unless it is filtered out or was already emitted.
+
+        Returns:
+            tuple: (game_id, pitch_summary), pitch_summary being None when nothing was emitted.
+        """
+        game_id = payload.get('game', {}).get('id')
+        if self.game_ids is not None and game_id not in self.game_ids:
+            return game_id, None
+        game_id, pitch_summary = self.summarize_pushed_pitch(payload)
+        if pitch_summary is not None:
+            matchup = next((matchup for matchup, live_id in self.live_games_dict.items() if live_id == game_id), None)
+            self.emit(game_id, matchup, pitch_summary)
+        return game_id, pitch_summary
+
+    def emit(self, game_id, matchup, pitch_summary):
+        """Write one pitch summary as a JSON line, with the names of the alert rules it fired."""
+        record = self.pitch_record(game_id, matchup, pitch_summary)
+        fired = self.alerts.check(game_id, pitch_summary)
+        if fired:
+            record["alerts"] = fired
+        self.output.write(json.dumps(record) + "\n")
+        self.output.flush()
+
+    @staticmethod
+    def pitch_record(game_id, matchup, pitch_summary):
+        """Return the emitted form of a pitch summary: the summary plus its game and arrival time."""
+        return {"game_id": game_id, "game": matchup,
+                "received_at": datetime.now(timezone.utc).isoformat(), **pitch_summary}
+
+    def run_forever(self):
+        """
+        Poll until interrupted, sleeping as long as the poll scheduler says between cycles.
+        With the push feed connected, cycles only refresh the schedule and the sleeps are
+        spent emitting pushed pitches.
+        """
+        latest = {}
+        if self.push_feed is not None:
+            self.push_feed.start()
+        while True:
+            try:
+                if self.push_feed is not None and self.push_feed.connected.is_set():
+                    if self.schedule.refresh_due():
+                        self.get_live_games(load_teams())
+                else:
+                    latest.update(self.poll_once())
+            except Exception as e:
+                shared_metrics().increment("errors", kind="poll", error=type(e).__name__)
+                print(f"Error updating live data ({type(e).__name__}):", e, file=sys.stderr)
+            remaining = self.poll_scheduler.remaining_budget()
+            if remaining is not None:
+                shared_metrics().set_gauge("quota_remaining", remaining)
+            intervals = [self.poll_scheduler.next_interval_ms(latest.get(game_id))
+                         for game_id in self.live_games_dict.values()] or [self.poll_scheduler.next_interval_ms(None)]
+            self.wait(min(intervals) / 1000, latest)
+
+    def wait(self, seconds, latest):
+        """
+        Sleep between cycles. With a push feed, emit its pitches as they arrive meanwhile, and
+        after each (re)connect catch up with one poll, since a feed cannot replay what it missed.
+
+        Args:
+            seconds (float): How long to wait.
+            latest (dict): Game id -> latest emitted pitch summary, updated in place.
+        """
+        if self.pushed is None:
+            time.sleep(seconds)
+            return
+        deadline = time.monotonic() + seconds
+        was_connected = self.push_feed.connected.is_set()
+        while True:
+            remaining = deadline - time.monotonic()
+            if remaining <= 0:
+                return
+            try:
+                payload = self.pushed.get(timeout=min(remaining, 1))
+            except queue.Empty:
+                if was_connected and not self.push_feed.connected.is_set():
+                    return  # The feed dropped: go back to polling now, not at the end of the wait.
+                continue
+            try:
+                if payload is None:
+                    latest.update(self.poll_once())
+                else:
+                    game_id, pitch_summary = self.emit_pushed(payload)
+                    if pitch_summary is not None:
+                        latest[game_id] = pitch_summary
+            except Exception as e:
+                shared_metrics().increment("errors", kind="push", error=type(e).__name__)
+                print(f"Error handling pushed pitch ({type(e).__name__}):", e, file=sys.stderr)
+
+
+def run_headless(api_key, access_level, output_path=None, game_ids=None, schedule_date=None,
+                 base_url=SPORTRADAR_BASE_URL, push=False, alert_rules=()):
+    """
+    Run the headless JSONL pitch stream until interrupted.
+
+    Args:
+        api_key (str): The user's Sportradar API key.
+        access_level (str): The API access level (e.g., "trial" or "production").
+        output_path (str, optional): File to append JSON lines to. Defaults to stdout.
+        game_ids (iterable, optional): Restrict polling to these game ids.
+        schedule_date (datetime.date, optional): Day whose schedule is polled. Defaults to today.
+        base_url (str, optional): Root of the MLB API. Defaults to Sportradar.
+        push (bool): Take new pitches from the push feed, polling only while it is down.
+        alert_rules (iterable): Alert rule texts (see alerts.py).
+    """
+    output = open(output_path, 'a') if output_path else sys.stdout
+    try:
+        Headless_Pitch_Stream(api_key, access_level, output, game_ids, schedule_date, base_url, push,
+                              alert_rules).run_forever()
+    except KeyboardInterrupt:
+        pass
+    finally:
+        if output is not sys.stdout:
+            output.close()
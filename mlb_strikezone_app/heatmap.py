@@ -0,0 +1,117 @@
+import numpy as np
+from PIL import Image
+
+HEATMAP_CELL_PX = 4
+HEATMAP_SIGMA_CELLS = 2.5
+HEATMAP_MAX_ALPHA = 170
+
+# Colormap stops (position, (r, g, b, a)) from cold and transparent to hot and opaque.
+COLORMAP_STOPS = [
+    (0.00, (0, 0, 255, 0)),
+    (0.25, (0, 160, 255, HEATMAP_MAX_ALPHA // 2)),
+    (0.50, (0, 220, 90, HEATMAP_MAX_ALPHA)),
+    (0.75, (255, 220, 0, HEATMAP_MAX_ALPHA)),
+    (1.00, (230, 30, 30, HEATMAP_MAX_ALPHA)),
+]
+
+
+def build_colormap():
+    """
+    Returns:
+        numpy.ndarray: (256, 4) uint8 RGBA lookup table interpolated from COLORMAP_STOPS.
+    """
+    positions = np.array([p for p, _ in COLORMAP_STOPS])
+    colors = np.array([c for _, c in COLORMAP_STOPS], dtype=np.float32)
+    steps = np.linspace(0, 1, 256)
+    return np.stack([np.interp(steps, positions, colors[:, channel]) for channel in range(4)],
+                    axis=1).astype(np.uint8)
+
+
+def gaussian_kernel(sigma):
+    """
+    Returns:
+        numpy.ndarray: Square, normalised 2D Gaussian of radius ceil(3 * sigma).
+    """
+    radius = int(np.ceil(3 * sigma))
+    axis = np.arange(-radius, radius + 1, dtype=np.float32)
+    one_d = np.exp(-(axis ** 2) / (2 * sigma ** 2))
+    kernel = np.outer(one_d, one_d)
+    return kernel / kernel.sum()
+
+
+class PitchHeatmap:
+    """
+      Pitch-location density rendered as a single RGBA image layer.
+
+      Pitches are binned into a grid of HEATMAP_CELL_PX pixel cells. Because a Gaussian
+      blur is linear, the blurred density is kept up to date by adding one pre-computed
+      kernel stamp per pitch instead of re-blurring the whole grid, and rendering is a
+      single colormap lookup over the grid.
+
+      Attributes:
+          width (int): Image width in pixels.
+          height (int): Image height in pixels.
+          counts (numpy.ndarray): Raw pitch count per cell.
+          density (numpy.ndarray): Blurred pitch density per cell.
+      """
+
+    def __init__(self, width, height, cell=HEATMAP_CELL_PX, sigma=HEATMAP_SIGMA_CELLS):
+        self.width = width
+        self.height = height
+        self.cell = cell
+        self.grid_w = -(-width // cell)
+        self.grid_h = -(-height // cell)
+        self.counts = np.zeros((self.grid_h, self.grid_w), dtype=np.uint32)
+        self.density = np.zeros((self.grid_h, self.grid_w), dtype=np.float32)
+        self.kernel = gaussian_kernel(sigma)
+        self.radius = self.kernel.shape[0] // 2
+        self.colormap = build_colormap()
+
+    def clear(self):
+        """Forget every pitch."""
+        self.counts.fill(0)
+        self.density.fill(0)
+
+    def add(self, x, y):
+        """
+        Add one pitch at image pixel (x, y); points outside the image are clamped to its edge.
+
+        Args:
+            x (float): Horizontal pixel position.
+            y (float): Vertical pixel position.
+        """
+        col = min(max(int(x // self.cell), 0), self.grid_w - 1)
+        row = min(max(int(y // self.cell), 0), self.grid_h - 1)
+        self.counts[row, col] += 1
+
+        r = self.radius
+        top, bottom = max(row - r, 0), min(row + r + 1, self.grid_h)
+        left, right = max(col - r, 0), min(col + r + 1, self.grid_w)
+        self.density[top:bottom, left:right] += self.kernel[top - row + r:bottom - row + r,
+                                                            left - col + r:right - col + r]
+
+    def render(self):
+        """
+        Returns:
+            PIL.Image.Image: RGBA image of size (width, height) with the colormapped density.
+        """
+        peak = self.density.max()
+        if peak <= 0:
+            return Image.new("RGBA", (self.width, self.height), (0, 0, 0, 0))
+        levels = (self.density * (255 / peak)).astype(np.uint8)
+        rgba = self.colormap[levels]
+        grid_image = Image.fromarray(rgba, "RGBA")
+        return grid_image.resize((self.grid_w * self.cell, self.grid_h * self.cell), Image.BILINEAR) \
+            .crop((0, 0, self.width, self.height))
+
+    def composite(self, background):
+        """
+        Blend the heatmap over a background image.
+
+        Args:
+            background (PIL.Image.Image): Image of size (width, height).
+
+        Returns:
+            PIL.Image.Image: RGBA background with the heatmap layer on top.
+        """
+        return Image.alpha_composite(background.convert("RGBA"), self.render())
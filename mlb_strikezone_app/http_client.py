@@ -0,0 +1,375 @@
+import threading
+import time
+from mlb_strikezone_app.metrics import shared_metrics
+
+# Connection pool sizing for the shared session. Sportradar is a single host, so one
+# pool is enough; pool_maxsize bounds how many keep-alive sockets can be reused at once.
+POOL_CONNECTIONS = 4
+POOL_MAXSIZE = 16
+
+# Sportradar queries-per-second limit for each API access level.
+ACCESS_LEVEL_QPS = {
+    "trial": 1,
+    "production": 10,
+}
+
+# Every API request gives up on connecting after CONNECT_TIMEOUT_SECONDS and on a silent
+# response after READ_TIMEOUT_SECONDS, so a hung server cannot stall the fetch worker.
+CONNECT_TIMEOUT_SECONDS = 3.05
+READ_TIMEOUT_SECONDS = 10
+
+# Circuit breaker: after BREAKER_FAILURE_THRESHOLD transient failures in a row, requests are
+# refused without calling the API for BREAKER_RESET_SECONDS; then one probe is let through.
+# Each failed probe doubles the wait, up to BREAKER_MAX_RESET_SECONDS.
+BREAKER_FAILURE_THRESHOLD = 5
+BREAKER_RESET_SECONDS = 15
+BREAKER_MAX_RESET_SECONDS = 300
+
+DEFAULT_HEADERS = {
+    "accept": "application/json",
+    "accept-encoding": "gzip, deflate",
+    "connection": "keep-alive",
+}
+
+
+class RateLimiter:
+    """
+      Thread-safe token bucket that spaces requests so that every thread sharing it
+      together stays under `qps` requests per second.
+
+      Attributes:
+          qps (float): Allowed requests per second.
+      """
+
+    def __init__(self, qps):
+        self.qps = qps
+        self._next_slot = 0.0
+        self._lock = threading.Lock()
+
+    def set_rate(self, qps):
+        """Change the allowed requests per second."""
+        with self._lock:
+            self.qps = qps
+
+    def acquire(self):
+        """Block until the caller may send one request."""
+        with self._lock:
+            now = time.monotonic()
+            slot = max(now, self._next_slot)
+            self._next_slot = slot + 1.0 / self.qps
+        delay = slot - now
+        if delay > 0:
+            time.sleep(delay)
+
+
+class CircuitOpenError(Exception):
+    """Raised instead of sending a request while the circuit breaker is open."""
+
+
+def is_transient(error):
+    """
+    Return True for failures that say nothing about the request itself and are worth
+    retrying later: timeouts, connection errors, 429 and 5xx replies, garbled bodies and an
+    open circuit. Other 4xx replies (a bad key, an unknown game) are not.
+    """
+    import requests
+    if isinstance(error, requests.HTTPError):
+        status_code = error.response.status_code if error.response is not None else None
+        return status_code is None or status_code == 429 or status_code >= 500
+    return isinstance(error, (requests.RequestException, ValueError, CircuitOpenError))
+
+
+class CircuitBreaker:
+    """
+      Thread-safe circuit breaker in front of the API.
+
+      Closed, every request goes out. After `failure_threshold` transient failures in a row
+      it opens and `before_request` raises CircuitOpenError at once, so a failing API is not
+      hammered by every poll of every game. After the reset wait it half-opens: a single probe
+      goes out and its outcome closes the circuit or opens it again for twice as long.
+
+      Attributes:
+          state (str): 'closed', 'open' or 'half_open'.
+          failures (int): Transient failures in a row.
+          reset_seconds (float): Current wait before the next probe.
+      """
+
+    def __init__(self, failure_threshold=BREAKER_FAILURE_THRESHOLD, reset_seconds=BREAKER_RESET_SECONDS,
+                 max_reset_seconds=BREAKER_MAX_RESET_SECONDS):
+        self.failure_threshold = failure_threshold
+        self.base_reset_seconds = reset_seconds
+        self.max_reset_seconds = max_reset_seconds
+        self.state = "closed"
+        self.failures = 0
+        self.reset_seconds = reset_seconds
+        self._opened_at = 0.0
+        self._lock = threading.Lock()
+
+    def before_request(self):
+        """
+        Raises:
+            CircuitOpenError: The circuit is open, or half-open with its probe already out.
+        """
+        with self._lock:
+            if self.state == "closed":
+                return
+            wait = self._opened_at + self.reset_seconds - time.monotonic()
+            if self.state == "open" and wait <= 0:
+                self.state = "half_open"
+                return
+        shared_metrics().increment("circuit_rejections")
+        raise CircuitOpenError(f"API circuit open after {self.failures} failures; "
+                               f"next try in {max(0, round(wait))} s")
+
+    def record(self, ok):
+        """Record the outcome of a request that went out: True unless it failed transiently."""
+        with self._lock:
+            if ok:
+                self.failures = 0
+                self.reset_seconds = self.base_reset_seconds
+                self.state = "closed"
+            else:
+                self.failures += 1
+                if self.state == "half_open":
+                    self.reset_seconds = min(self.reset_seconds * 2, self.max_reset_seconds)
+                if self.state == "half_open" or self.failures >= self.failure_threshold:
+                    self.state = "open"
+                    self._opened_at = time.monotonic()
+            state = self.state
+        shared_metrics().set_gauge("circuit_open", 0 if state == "closed" else 1)
+
+
+def _timed_pool_classes():
+    # Connection pools whose connections time connect() (DNS + TCP + TLS) into the metrics.
+    from urllib3.connection import HTTPConnection, HTTPSConnection
+    from urllib3.connectionpool import HTTPConnectionPool, HTTPSConnectionPool
+
+    class TimedHTTPConnection(HTTPConnection):
+        def connect(self):
+            with shared_metrics().timer("connect", host=self.host):
+                super().connect()
+
+    class TimedHTTPSConnection(HTTPSConnection):
+        def connect(self):
+            with shared_metrics().timer("connect", host=self.host):
+                super().connect()
+
+    class TimedHTTPConnectionPool(HTTPConnectionPool):
+        ConnectionCls = TimedHTTPConnection
+
+    class TimedHTTPSConnectionPool(HTTPSConnectionPool):
+        ConnectionCls = TimedHTTPSConnection
+
+    return {"http": TimedHTTPConnectionPool, "https": TimedHTTPSConnectionPool}
+
+
+class Sportradar_Session:
+    """
+      Pooled, compressed, conditional HTTP client shared by every MLB_API_Calls instance.
+
+      A single `requests.Session` keeps TCP+TLS connections alive between polls and
+      negotiates gzip. For URLs fetched with `conditional=True` the ETag/Last-Modified
+      validators of the previous 200 response are sent back, and a 304 reply is returned
+      as `None` so callers can skip the JSON decode and the render entirely.
+      Every request first waits on `rate_limiter`, so parallel fetches from any number
+      of threads share one QPS budget, and passes `breaker`, which stops requests for a
+      while once the API keeps failing. Requests time out per CONNECT/READ_TIMEOUT_SECONDS.
+
+      `requests` is imported and the pooled session built on the first request, which the
+      GUI makes from its fetch worker, so the import stays off the path to the first window.
+
+      Attributes:
+          session (requests.Session): The pooled keep-alive session, built on first use.
+          rate_limiter (RateLimiter): QPS limiter shared by all requests.
+          breaker (CircuitBreaker): Refuses requests while the API is failing.
+          request_hooks (list): Callables `hook(url, status_code)` run after every network
+              request; `status_code` is None when the request raised. The shared Metrics
+              counter hook is always registered.
+          cache (ResponseCache or None): Optional on-disk record/replay cache consulted first.
+          validators (dict): URL -> {"ETag": ..., "Last-Modified": ...} from the last 200.
+      """
+
+    def __init__(self):
+        self._session = None
+        self.validators = {}
+        self.rate_limiter = RateLimiter(ACCESS_LEVEL_QPS["trial"])
+        self.breaker = CircuitBreaker()
+        self.request_hooks = [shared_metrics().record_request]
+        self.cache = None
+        self._served_from_cache = {}
+        self._lock = threading.Lock()
+
+    @property
+    def session(self):
+        with self._lock:
+            if self._session is None:
+                import requests
+                from requests.adapters import HTTPAdapter
+                session = requests.Session()
+                adapter = HTTPAdapter(pool_connections=POOL_CONNECTIONS, pool_maxsize=POOL_MAXSIZE)
+                adapter.poolmanager.pool_classes_by_scheme = _timed_pool_classes()
+                session.mount("https://", adapter)
+                session.mount("http://", adapter)
+                session.headers.update(DEFAULT_HEADERS)
+                self._session = session
+            return self._session
+
+    def get(self, url, conditional=False, decode=None):
+        """
+        GET a URL through the pooled session.
+
+        Args:
+            url (str): Full request URL.
+            conditional (bool): Send If-None-Match/If-Modified-Since from the last response.
+            decode (callable, optional): `decode(response)` parsing the body. Its result is
+                returned instead of the response (which is closed), and a body it cannot
+                parse counts as a failed request for the circuit breaker.
+
+        Returns:
+            requests.Response or None: The response (or `decode`'s result), or None if the
+            server answered 304 Not Modified.
+
+        Raises:
+            requests.HTTPError: On a 4xx/5xx status (including 429 Too Many Requests).
+            requests.Timeout: Connecting or reading took longer than the timeouts.
+            CircuitOpenError: The API kept failing; no request was sent.
+            Exception: Whatever `decode` raised.
+        """
+        if self.cache is not None:
+            cached = self.cache.lookup(url)
+            if cached is not None:
+                response = self._serve_cached(url, cached, conditional)
+                return decode(response) if decode is not None and response is not None else response
+
+        headers = {}
+        if conditional:
+            with self._lock:
+                cached = self.validators.get(url, {})
+            if cached.get("ETag"):
+                headers["if-none-match"] = cached["ETag"]
+            if cached.get("Last-Modified"):
+                headers["if-modified-since"] = cached["Last-Modified"]
+
+        session = self.session
+        import requests  # Already loaded by `session`; this only binds the name.
+        from mlb_strikezone_app.disk_cache import endpoint_kind
+        metrics = shared_metrics()
+        endpoint = endpoint_kind(url)
+
+        self.breaker.before_request()
+        ok = False
+        try:
+            # Recorded in `finally`, whatever is raised, so a half-open probe is always released.
+            self.rate_limiter.acquire()
+            try:
+                with metrics.timer("http", endpoint=endpoint):
+                    response = session.get(url, headers=headers,
+                                           timeout=(CONNECT_TIMEOUT_SECONDS, READ_TIMEOUT_SECONDS))
+            except requests.RequestException:
+                self._run_hooks(url, None)
+                raise
+            metrics.observe("server", response.elapsed.total_seconds(), endpoint=endpoint)
+            self._run_hooks(url, response.status_code)
+            ok = response.status_code != 429 and response.status_code < 500
+            if response.status_code == 304:
+                response.close()
+                return None
+            # 429 / 5xx must surface as errors so the poll scheduler can back off.
+            response.raise_for_status()
+            if self.cache is not None:
+                self.cache.store(response)
+
+            if response.status_code == 200:
+                found = {k: response.headers[k] for k in ("ETag", "Last-Modified") if k in response.headers}
+                with self._lock:
+                    if found:
+                        self.validators[url] = found
+                    else:
+                        self.validators.pop(url, None)
+            if decode is None:
+                return response
+            ok = False
+            with response:
+                decoded = decode(response)
+            ok = True
+            return decoded
+        finally:
+            self.breaker.record(ok)
+
+    def stream(self, url, read_timeout):
+        """
+        Open a long-lived streaming GET, e.g. a push feed, through the pooled session.
+        Streams are never cached or conditional.
+
+        Args:
+            url (str): Full request URL.
+            read_timeout (float): Seconds without any byte (heartbeats included) before
+                reading the stream raises, so a silently dead connection is noticed.
+
+        Returns:
+            requests.Response: The open response; iterate it with `iter_lines()` and close it.
+
+        Raises:
+            requests.HTTPError: On a 4xx/5xx status.
+            CircuitOpenError: The API kept failing; no request was sent.
+        """
+        session = self.session
+        import requests  # Already loaded by `session`; this only binds the name.
+        self.breaker.before_request()
+        ok = False
+        try:
+            self.rate_limiter.acquire()
+            try:
+                response = session.get(url, stream=True, timeout=(CONNECT_TIMEOUT_SECONDS, read_timeout))
+            except requests.RequestException:
+                self._run_hooks(url, None)
+                raise
+            self._run_hooks(url, response.status_code)
+            ok = response.status_code != 429 and response.status_code < 500
+            if response.status_code >= 400:
+                response.close()
+                response.raise_for_status()
+            return response
+        finally:
+            self.breaker.record(ok)
+
+    def forget(self, url):
+        """Drop the validators kept for a URL that will not be requested again."""
+        from mlb_strikezone_app.disk_cache import cache_key_url
+        with self._lock:
+            self.validators.pop(url, None)
+            self._served_from_cache.pop(cache_key_url(url), None)
+
+    def _serve_cached(self, url, response, conditional):
+        # A conditional request answered from the same stored entry as last time is a 304.
+        from mlb_strikezone_app.disk_cache import cache_key_url  # Loaded already: it made `cache`.
+        stored_at = response.headers["X-Cache-Stored-At"]
+        key = cache_key_url(url)
+        with self._lock:
+            previously_served = self._served_from_cache.get(key)
+            self._served_from_cache[key] = stored_at
+        if conditional and previously_served == stored_at:
+            return None
+        return response
+
+    def _run_hooks(self, url, status_code):
+        for hook in list(self.request_hooks):
+            hook(url, status_code)
+
+
+_shared_session = None
+_shared_session_lock = threading.Lock()
+
+
+def shared_session():
+    """
+    Return the process-wide Sportradar_Session, creating it on first use.
+
+    Returns:
+        Sportradar_Session: The shared pooled session.
+    """
+    global _shared_session
+    with _shared_session_lock:
+        if _shared_session is None:
+            _shared_session = Sportradar_Session()
+        return _shared_session
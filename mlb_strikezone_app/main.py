@@ -1,19 +1,31 @@
-# from strike_zone as strike_zone # Uncomment this line to run with `python main.py` from mlb_strikezone_app folder
-from mlb_strikezone_app.strike_zone import tk, StrikeZone_Updates, windll  # comment this out if uncommenting above
 import argparse
 import os
+import sys
+from datetime import date
 from dotenv import load_dotenv
 
+from mlb_strikezone_app.mlb_api import SPORTRADAR_BASE_URL
+from mlb_strikezone_app.modes import HEATMAP_SCOPES, CACHE_MODES
+from mlb_strikezone_app.pitch_trail import TRAIL_SCOPES
+
 # Load environment variables from the .env file
 load_dotenv()
 
 
-def run(api_key, access_level):
+def run(api_key, access_level, prefetch_all=False, max_concurrency=4, schedule_date=None, trail_scope='off',
+        heatmap_scope='off', base_url=SPORTRADAR_BASE_URL, push=False, server_url=None, shards=0,
+        replay_game_id=None, alert_rules=()):
+    # Imported here so the headless mode never needs tkinter, PIL or windll.
+    from mlb_strikezone_app.strike_zone import tk, StrikeZone_Updates, windll
     root = tk.Tk()
     root.geometry("300x700")
-    windll.shcore.SetProcessDpiAwareness(1)
-    app = StrikeZone_Updates(root, api_key, access_level)
+    if windll is not None:
+        windll.shcore.SetProcessDpiAwareness(1)
+    app = StrikeZone_Updates(root, api_key, access_level, prefetch_all, max_concurrency, schedule_date, trail_scope,
+                             heatmap_scope, base_url, push, server_url, shards, alert_rules)
     app.update_live_data(True)
+    if replay_game_id:
+        app.start_replay(replay_game_id)
     root.mainloop()
 
 
@@ -28,7 +40,8 @@ def main():
         • Go to https://console.sportradar.com/signup\n
         • Create a free account → Add trial → choose MLB API.\n
         • Your API key will appear on your Sportradar console page.\n\n
-        Note: The program refreshes every 20 seconds. The background flashes red letting you know the program has:\n\n
+        Note: The program refreshes about every 20 seconds (faster mid at-bat, slower between innings,
+        backing off on API errors or when a trial key's monthly calls run low). The background flashes red letting you know the program has:\n\n
         • Refreshed data shown\n
         • Updated live games dropdown
         
@@ -41,27 +54,152 @@ def main():
     parser.add_argument("--api_key", dest='api_key', type=str, help="Your Sportradar API key")
     parser.add_argument("--access_level", dest='access_level', type=str, default="trial",
                         help="API access level (e.g., trial, production)")
+    parser.add_argument("--prefetch_all", dest='prefetch_all', action='store_true',
+                        help="Poll every live game each refresh so switching games is instant")
+    parser.add_argument("--max_concurrency", dest='max_concurrency', type=int, default=4,
+                        help="Maximum parallel game fetches with --prefetch_all (default 4)")
+    parser.add_argument("--cache_mode", dest='cache_mode', choices=CACHE_MODES, default="off",
+                        help="On-disk response cache: 'record' saves responses, 'replay' serves only\n"
+                             "recorded responses offline (no API key needed). Default 'off'.")
+    parser.add_argument("--cache_dir", dest='cache_dir', type=str, default=None,
+                        help="Folder for the response cache (default ~/.mlb_strikezone_cache)")
+    parser.add_argument("--date", dest='schedule_date', type=date.fromisoformat, default=None,
+                        help="Schedule day to show as YYYY-MM-DD (default today), e.g. a recorded day in replay mode")
+    parser.add_argument("--cache_max_mb", dest='cache_max_mb', type=int, default=200,
+                        help="Size bound of the response cache in MB (default 200)")
+    parser.add_argument("--trail", dest='trail_scope', choices=TRAIL_SCOPES, default="off",
+                        help="Keep a numbered, fading trail of every pitch in the at-bat or inning (default off)")
+    parser.add_argument("--heatmap", dest='heatmap_scope', choices=HEATMAP_SCOPES, default="off",
+                        help="Draw a pitch-location heatmap for the whole game or the current pitcher (default off)")
+    parser.add_argument("--headless", dest='headless', action='store_true',
+                        help="No window: write every new pitch of every live game as a JSON line")
+    parser.add_argument("--output", dest='output', type=str, default=None,
+                        help="File to append JSON lines to with --headless (default stdout)")
+    parser.add_argument("--game_id", dest='game_ids', action='append', default=None,
+                        help="With --headless, only poll this game id (repeatable)")
+    parser.add_argument("--base_url", dest='base_url', type=str, default=SPORTRADAR_BASE_URL,
+                        help="Root of the MLB API, e.g. http://127.0.0.1:8765/mlb for the local simulator\n"
+                             "(python -m mlb_strikezone_app.simulator). Default Sportradar.")
+    parser.add_argument("--push", dest='push', action='store_true',
+                        help="Take new pitches from the Sportradar push feed as they happen instead of\n"
+                             "polling pbp.json; polling resumes whenever the feed is down")
+    parser.add_argument("--serve", dest='serve_port', type=int, default=None,
+                        help="No window: poll once for the whole office and stream every pitch to viewers\n"
+                             "started with --server, as Server-Sent Events on this port")
+    parser.add_argument("--serve_host", dest='serve_host', type=str, default="0.0.0.0",
+                        help="Interface --serve listens on (default all interfaces)")
+    parser.add_argument("--server", dest='server_url', type=str, default=None,
+                        help="Show the pitches of a --serve poller, e.g. http://poller-host:8766, instead of\n"
+                             "calling Sportradar (no API key needed)")
+    parser.add_argument("--shards", dest='shards', type=int, default=0,
+                        help="Poll with this many worker processes sharing a shared-memory pitch table, for\n"
+                             "slates of a hundred games or more (window or --headless). Default off.")
+    parser.add_argument("--replay", dest='replay_game_id', type=str, default=None,
+                        help="Open the window replaying this game id pitch by pitch, with a slider and\n"
+                             "1x-60x playback; works for finished games and --cache_mode replay recordings")
+    parser.add_argument("--alert", dest='alert_rules', action='append', default=[],
+                        help="Alert rule checked against every new pitch of every game, e.g.\n"
+                             "\"pitch_speed >= 100\", \"loaded=full_count and bases_loaded\" or a preset\n"
+                             "(heat, full_count_bases_loaded, missed_call, score_change). Repeatable.\n"
+                             "The window polls every game, flashes and switches to it; --headless adds \"alerts\".")
+    parser.add_argument("--metrics_port", dest='metrics_port', type=int, default=None,
+                        help="Serve per-stage poll latencies (p50/p95/p99) and request counters in the\n"
+                             "Prometheus text format at http://127.0.0.1:PORT/metrics")
+    parser.add_argument("--metrics_file", dest='metrics_file', type=str, default=None,
+                        help="Rewrite this JSON file with the same metrics every 10 seconds")
+    parser.add_argument("--backfill", dest='backfill_season', type=int, default=None,
+                        help="No window: fetch every completed game of this season into a columnar pitch\n"
+                             "archive. Resumes where an interrupted run stopped.")
+    parser.add_argument("--season_type", dest='season_type', choices=("PRE", "REG", "PST"), default="REG",
+                        help="Season part to --backfill (default REG)")
+    parser.add_argument("--archive_dir", dest='archive_dir', type=str, default=None,
+                        help="Folder of the --backfill archive (default ~/.mlb_strikezone_archive/<season>_<type>)")
+    parser.add_argument("--umpire_report", dest='umpire_report_dir', type=str, default=None,
+                        help="No API calls: print the called ball/strike accuracy of a --backfill archive\n"
+                             "folder as JSON, overall and per game, home plate umpire and count")
 
     args = parser.parse_args()
 
-    print("Starting live MLB pitch stream...")
-    print(f"Using access level: {args.access_level}")
+    if args.umpire_report_dir:
+        # Reads a finished archive only, so it needs no API key and prints nothing else to stdout.
+        from mlb_strikezone_app.umpire_stats import print_umpire_report
+        print_umpire_report(args.umpire_report_dir)
+        return
+
+    # Keep stdout clean for the JSON lines in headless mode.
+    log = sys.stderr if args.headless or args.backfill_season or args.serve_port else sys.stdout
+    print("Starting live MLB pitch stream...", file=log)
+    print(f"Using access level: {args.access_level}", file=log)
+
+    if args.alert_rules:
+        from mlb_strikezone_app.alerts import compile_rule
+        try:
+            for rule in args.alert_rules:
+                compile_rule(rule)
+        except ValueError as e:
+            print(e, file=log)
+            return
+
+    if args.cache_mode != "off":
+        from mlb_strikezone_app.disk_cache import ResponseCache, DEFAULT_CACHE_DIR
+        from mlb_strikezone_app.http_client import shared_session
+        cache_dir = args.cache_dir or DEFAULT_CACHE_DIR
+        shared_session().cache = ResponseCache(cache_dir, args.cache_mode, args.cache_max_mb * 1024 * 1024)
+        print(f"Response cache: {args.cache_mode} in {cache_dir}", file=log)
+
+    if args.metrics_port is not None:
+        from mlb_strikezone_app.metrics import serve_metrics
+        serve_metrics(args.metrics_port)
+        print(f"Metrics: http://127.0.0.1:{args.metrics_port}/metrics", file=log)
+    if args.metrics_file:
+        from mlb_strikezone_app.metrics import dump_metrics_periodically
+        dump_metrics_periodically(args.metrics_file)
 
     if api_key_from_env:
         api_key = api_key_from_env
         access_level = access_level_from_env
-        run(api_key, access_level)
 
     elif args.api_key:
         api_key = args.api_key
         access_level = args.access_level
-        run(api_key, access_level)
+
+    elif args.server_url:
+        # A viewer of a fan-out server never calls Sportradar, so it needs no key.
+        api_key = "viewer"
+        access_level = args.access_level
+
+    elif args.cache_mode == "replay":
+        # Recordings are keyed without the api_key, so any placeholder works offline.
+        api_key = "replay"
+        access_level = args.access_level
 
     else:
         print("Must have api_key. Will look in .env first then arguments. Access level 'trial' is default. \n"
               "Go to https://console.sportradar.com/signup .\n"
               "Create a free account > Add trial > choose MLB API.\n"
-              "Once chosen a API key will seen in your SportsRadar console page.")
+              "Once chosen a API key will seen in your SportsRadar console page.", file=log)
+        return
+
+    if args.backfill_season:
+        from mlb_strikezone_app.backfill import run_backfill
+        run_backfill(api_key, access_level, args.backfill_season, args.archive_dir, args.season_type,
+                     args.base_url)
+    elif args.serve_port is not None:
+        from mlb_strikezone_app.fanout import run_fanout
+        run_fanout(api_key, access_level, args.serve_port, args.serve_host, args.game_ids, args.schedule_date,
+                   args.base_url, args.push)
+    elif args.headless and args.shards:
+        from mlb_strikezone_app.sharded import run_sharded
+        run_sharded(api_key, access_level, args.shards, args.output, args.game_ids, args.schedule_date,
+                    args.base_url, args.alert_rules)
+    elif args.headless:
+        from mlb_strikezone_app.headless import run_headless
+        run_headless(api_key, access_level, args.output, args.game_ids, args.schedule_date, args.base_url,
+                     args.push, args.alert_rules)
+    else:
+        run(api_key, access_level, args.prefetch_all, args.max_concurrency, args.schedule_date, args.trail_scope,
+            args.heatmap_scope, args.base_url, args.push, args.server_url, args.shards,
+            args.replay_game_id, args.alert_rules)
 
 
 if __name__ == "__main__":
@@ -0,0 +1,223 @@
+import json
+import os
+import sys
+import threading
+import time
+from collections import deque
+from contextlib import contextmanager
+
+# Samples kept per stage and label; percentiles are taken over this rolling window.
+WINDOW_SIZE = 1024
+QUANTILES = (0.5, 0.95, 0.99)
+DEFAULT_DUMP_SECONDS = 10
+
+# Stages timed along one poll cycle, in order.
+#   connect  DNS + TCP + TLS of a new pooled connection
+#   http     whole request through the session (includes connect, server and download)
+#   server   request sent -> response headers parsed (requests' Response.elapsed)
+#   decode   JSON decode of a pbp body (tail or full)
+#   parse    GameProgress walk and pitch summaries
+#   render   Tk labels, dot, trail and heatmap for one summary
+#   fetch    one game's whole job on the fetch worker (request to summaries)
+STAGES = ("connect", "http", "server", "decode", "parse", "render", "fetch")
+
+
+def _quantile(ordered, q):
+    index = min(len(ordered) - 1, max(0, round(q * (len(ordered) - 1))))
+    return ordered[index]
+
+
+def _label_text(labels):
+    return ",".join(f'{key}="{value}"' for key, value in labels)
+
+
+class Metrics:
+    """
+      Thread-safe in-process registry of stage latencies and counters.
+
+      Latencies are kept per (stage, label) in rolling windows of the last WINDOW_SIZE
+      samples, so p50/p95/p99 follow recent behaviour; the count and sum never reset.
+      Counters and gauges are plain numbers keyed by name and labels.
+      """
+
+    def __init__(self):
+        self._lock = threading.Lock()
+        self._samples = {}
+        self._totals = {}
+        self._counters = {}
+        self._gauges = {}
+
+    def observe(self, stage, seconds, **labels):
+        """Record one latency sample of `stage`, e.g. observe('decode', 0.004, game=game_id)."""
+        key = (stage, tuple(sorted(labels.items())))
+        with self._lock:
+            window = self._samples.get(key)
+            if window is None:
+                window = self._samples[key] = deque(maxlen=WINDOW_SIZE)
+                self._totals[key] = [0, 0.0]
+            window.append(seconds)
+            totals = self._totals[key]
+            totals[0] += 1
+            totals[1] += seconds
+
+    @contextmanager
+    def timer(self, stage, **labels):
+        """Time the body of a `with` block as one sample of `stage`."""
+        start = time.perf_counter()
+        try:
+            yield
+        finally:
+            self.observe(stage, time.perf_counter() - start, **labels)
+
+    def increment(self, name, amount=1, **labels):
+        """Add `amount` to a counter."""
+        key = (name, tuple(sorted(labels.items())))
+        with self._lock:
+            self._counters[key] = self._counters.get(key, 0) + amount
+
+    def set_gauge(self, name, value, **labels):
+        """Set a gauge to its current value."""
+        with self._lock:
+            self._gauges[(name, tuple(sorted(labels.items())))] = value
+
+    def forget(self, **labels):
+        """Drop every latency, counter and gauge series carrying all of `labels`, e.g. forget(game=game_id)."""
+        wanted = set(labels.items())
+        with self._lock:
+            for series in (self._samples, self._totals, self._counters, self._gauges):
+                for key in [key for key in series if wanted <= set(key[1])]:
+                    del series[key]
+
+    def record_request(self, url, status_code):
+        """
+        Sportradar_Session request hook: count calls, 304s and failed requests.
+
+        Args:
+            url (str): Requested URL.
+            status_code (int or None): HTTP status, or None if the request raised.
+        """
+        from mlb_strikezone_app.disk_cache import endpoint_kind
+        endpoint = endpoint_kind(url)
+        status = "error" if status_code is None else str(status_code)
+        self.increment("requests", endpoint=endpoint, status=status)
+        if status_code == 304:
+            self.increment("not_modified", endpoint=endpoint)
+        elif status_code is None or status_code >= 400:
+            self.increment("errors", endpoint=endpoint, kind="http")
+
+    def snapshot(self):
+        """
+        Returns:
+            dict: {"stages": [...], "counters": [...], "gauges": [...]}, JSON serialisable.
+        """
+        with self._lock:
+            samples = {key: sorted(window) for key, window in self._samples.items()}
+            totals = {key: list(value) for key, value in self._totals.items()}
+            counters = dict(self._counters)
+            gauges = dict(self._gauges)
+        stages = []
+        for (stage, labels), ordered in sorted(samples.items()):
+            count, total = totals[(stage, labels)]
+            stages.append({"stage": stage, "labels": dict(labels), "count": count, "sum": total,
+                           **{f"p{round(q * 100)}": _quantile(ordered, q) for q in QUANTILES}})
+        return {
+            "stages": stages,
+            "counters": [{"name": name, "labels": dict(labels), "value": value}
+                         for (name, labels), value in sorted(counters.items())],
+            "gauges": [{"name": name, "labels": dict(labels), "value": value}
+                       for (name, labels), value in sorted(gauges.items())],
+        }
+
+    def prometheus_text(self):
+        """Return every metric in the Prometheus text exposition format."""
+        snapshot = self.snapshot()
+        lines = ["# TYPE strikezone_stage_seconds summary"]
+        for entry in snapshot["stages"]:
+            labels = [("stage", entry["stage"])] + sorted(entry["labels"].items())
+            for q in QUANTILES:
+                quantile_labels = _label_text(labels + [("quantile", q)])
+                lines.append(f"strikezone_stage_seconds{{{quantile_labels}}} {entry[f'p{round(q * 100)}']:.6f}")
+            lines.append(f"strikezone_stage_seconds_sum{{{_label_text(labels)}}} {entry['sum']:.6f}")
+            lines.append(f"strikezone_stage_seconds_count{{{_label_text(labels)}}} {entry['count']}")
+        for kind, metric_type in (("counters", "counter"), ("gauges", "gauge")):
+            typed = set()
+            for entry in snapshot[kind]:
+                name = f"strikezone_{entry['name']}" + ("_total" if metric_type == "counter" else "")
+                if name not in typed:
+                    lines.append(f"# TYPE {name} {metric_type}")
+                    typed.add(name)
+                lines.append(f"{name}{{{_label_text(sorted(entry['labels'].items()))}}} {entry['value']}")
+        return "\n".join(lines) + "\n"
+
+
+_shared_metrics = Metrics()
+
+
+def shared_metrics():
+    """Return the process-wide Metrics registry."""
+    return _shared_metrics
+
+
+def serve_metrics(port, host="127.0.0.1", metrics=None):
+    """
+    Serve `/metrics` in the Prometheus text format from a daemon thread.
+
+    Args:
+        port (int): Port to listen on.
+        host (str): Interface to bind. Defaults to localhost only.
+        metrics (Metrics, optional): Registry to expose. Defaults to the shared one.
+
+    Returns:
+        ThreadingHTTPServer: The running server.
+    """
+    from http.server import ThreadingHTTPServer, BaseHTTPRequestHandler
+    metrics = metrics or shared_metrics()
+
+    class MetricsHandler(BaseHTTPRequestHandler):
+        def do_GET(self):
+            if self.path.split('?')[0] != '/metrics':
+                self.send_error(404)
+                return
+            body = metrics.prometheus_text().encode('utf-8')
+            self.send_response(200)
+            self.send_header("Content-Type", "text/plain; version=0.0.4")
+            self.send_header("Content-Length", str(len(body)))
+            self.end_headers()
+            self.wfile.write(body)
+
+        def log_message(self, *args):
+            pass
+
+    server = ThreadingHTTPServer((host, port), MetricsHandler)
+    threading.Thread(target=server.serve_forever, name="strikezone-metrics", daemon=True).start()
+    return server
+
+
+def dump_metrics_periodically(path, interval=DEFAULT_DUMP_SECONDS, metrics=None):
+    """
+    Rewrite `path` with a JSON snapshot every `interval` seconds from a daemon thread.
+
+    Args:
+        path (str): JSON file to write.
+        interval (float): Seconds between dumps.
+        metrics (Metrics, optional): Registry to dump. Defaults to the shared one.
+
+    Returns:
+        threading.Thread: The dumping thread.
+    """
+    metrics = metrics or shared_metrics()
+
+    def dump_forever():
+        while True:
+            time.sleep(interval)
+            try:
+                temp_path = f"{path}.tmp"
+                with open(temp_path, 'w') as file:
+                    json.dump(dict(metrics.snapshot(), written_at=time.time()), file)
+                os.replace(temp_path, path)
+            except OSError as e:
+                print("Could not write metrics:", e, file=sys.stderr)
+
+    thread = threading.Thread(target=dump_forever, name="strikezone-metrics-dump", daemon=True)
+    thread.start()
+    return thread
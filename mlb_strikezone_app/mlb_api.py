@@ -0,0 +1,705 @@
+import os
+import json
+import sys
+import threading
+from datetime import datetime, timezone
+from functools import lru_cache
+from mlb_strikezone_app.http_client import shared_session, is_transient, ACCESS_LEVEL_QPS
+from mlb_strikezone_app.metrics import shared_metrics
+from mlb_strikezone_app.pbp_state import GameProgress, iter_pitches
+from mlb_strikezone_app.pbp_tail import extract_innings_tail
+from mlb_strikezone_app.pitch_store import HALF_CODES
+from mlb_strikezone_app.schedule_state import ScheduleTracker, team_name
+from mlb_strikezone_app.umpire import RunningAccuracy
+
+# Get the directory of the current script (mlb_api.py)
+script_dir = os.path.dirname(os.path.abspath(__file__))
+
+# Construct the full paths to the JSON files
+play_outcomes_file_path = os.path.join(script_dir, 'play_outcome_codes.json')
+teams_file_path = os.path.join(script_dir, 'teams.json')
+
+SPORTRADAR_BASE_URL = "https://api.sportradar.com/mlb"
+
+
+@lru_cache(maxsize=None)
+def load_play_outcome_codes():
+    """Return the outcome id -> description table, reading play_outcome_codes.json on first use."""
+    with open(play_outcomes_file_path, 'r') as file:
+        return json.load(file)
+
+
+@lru_cache(maxsize=None)
+def load_teams():
+    """Return the team id -> team name table, reading teams.json on first use."""
+    with open(teams_file_path, 'r') as file:
+        return json.load(file)
+
+
+class MLB_API_Calls:
+    """
+      A class to interact with the Sportradar MLB API for fetching team data,
+      today's live games, and pitch-by-pitch (PBP) data.
+
+      Attributes:
+          api_key (str): API key for authenticating requests to Sportradar.
+          access_level (str): Access level for the API (e.g., 'trial', 'production').
+          live_games_dict (dict): Dictionary mapping game matchups to game IDs, rebuilt on every
+              schedule refresh so finished games drop out.
+          schedule (ScheduleTracker): Day rollover, per-day schedule cache and game statuses.
+          games_url (str): URL for fetching the current day's game schedule.
+          teams_url (str): URL for fetching all MLB teams.
+          http (Sportradar_Session): Shared pooled, compressed, conditional HTTP client.
+          base_url (str): Root of the MLB API, e.g. a local stand-in server instead of Sportradar.
+          last_good (dict): 'schedule' or a game id -> when its data was last fetched successfully (UTC).
+
+      Polls serve stale data rather than fail: when a schedule or pbp poll times out, gets a
+      429/5xx or a garbled body, or is refused by the circuit breaker, it is answered like a
+      304. Callers keep the last good data they already hold in memory (the ScheduleTracker's
+      games, each game's latest pitch summaries) and the next poll revalidates it. Such keys
+      are reported by `stale_since` until a poll succeeds again.
+      """
+
+    def __init__(self, api_key, access_level, schedule_date=None, base_url=SPORTRADAR_BASE_URL):
+        """
+        Args:
+            api_key (str): API key for authenticating requests to Sportradar.
+            access_level (str): Access level for the API (e.g., 'trial', 'production').
+            schedule_date (datetime.date, optional): Day whose schedule is polled. Defaults to today,
+                rolling over at midnight; set it to replay a recorded game day.
+            base_url (str, optional): Root of the MLB API. Defaults to Sportradar.
+        """
+        self.live_games_dict = {}
+        self.access_level = access_level
+        self.api_key = api_key
+        self.base_url = base_url.rstrip('/')
+        self.http = shared_session()
+        self.http.rate_limiter.set_rate(ACCESS_LEVEL_QPS.get(self.access_level, ACCESS_LEVEL_QPS["trial"]))
+        self.schedule = ScheduleTracker(schedule_date)
+        self.teams_url = f"{self.base_url}/{self.access_level}/v8/en/league/teams.json?api_key={self.api_key}"
+        self.last_good = {}
+        self._stale = {}
+        self._freshness_lock = threading.Lock()
+
+    def get_teams(self):
+        """
+        Fetch all MLB teams and return a mapping of team IDs to full team names.
+        Used to create play_outcome_codes.json. Use again in time in case MLB Teams change their names.
+
+        Returns:
+            dict: A dictionary with team IDs as keys and team names as values.
+
+        Example:
+            # api = MLB_API_Calls(api_key="your_api_key", access_level="trial")
+            # teams = api.get_teams()
+            # isinstance(teams, dict)
+            True
+        """
+        all_teams_temp = {}
+        for team in self.http.get(self.teams_url, decode=lambda r: r.json()['teams']):
+            all_teams_temp[team.get('id')] = team.get('market', ' ') + " " + team.get('name', ' ')
+        return all_teams_temp
+
+    @property
+    def games_url(self):
+        return self.schedule_url(self.schedule.current_day())
+
+    def schedule_url(self, day):
+        """Return the schedule.json URL of one day."""
+        return f"{self.base_url}/{self.access_level}/v8/en/games/{day:%Y/%m/%d}/schedule.json?api_key={self.api_key}"
+
+    def get_live_games(self, all_teams):
+        """
+       Refresh the schedule and rebuild live_games_dict with the in-progress MLB games.
+
+       Fetches the current day's schedule and, after midnight, the previous day's while one of
+       its games is still being played. A 304 Not Modified keeps that day's cached state.
+       Games that finished, or whose day is no longer tracked, are dropped with `evict_game`.
+       Teams missing from `all_teams` are named from the schedule itself.
+
+       Args:
+           all_teams (dict): A dictionary of team IDs to team names.
+
+       Returns:
+           list: (game_id, old_status, new_status) of the status changes this refresh saw.
+       """
+        transitions = []
+        refreshed = True
+        for day in self.schedule.days_to_fetch():
+            url = self.schedule_url(day)
+            try:
+                games = self.http.get(url, conditional=True, decode=lambda r: r.json().get('games', []))
+                if games is not None:
+                    transitions += self.schedule.update(day, games, all_teams)
+            except Exception as e:
+                self.serve_stale('schedule', url, e)
+                refreshed = False
+        if refreshed:
+            # A failed day leaves the refresh due, so the next cycle retries it.
+            self.schedule.mark_refreshed()
+            self.mark_fresh('schedule')
+        for _, _, status in transitions:
+            shared_metrics().increment("game_status_changes", status=status)
+        self.live_games_dict = self.schedule.live_games()
+        game_ids, days = self.schedule.pop_evicted()
+        for game_id in game_ids:
+            self.evict_game(game_id)
+        for day in days:
+            self.http.forget(self.schedule_url(day))
+        return transitions
+
+    def evict_game(self, game_id):
+        """
+        Drop everything kept for a game that is over: its conditional request validators and
+        its metric series. Subclasses drop their own per-game state too.
+        """
+        self.http.forget(self.pbp_url(game_id))
+        shared_metrics().forget(game=game_id)
+        with self._freshness_lock:
+            self.last_good.pop(game_id, None)
+            self._stale.pop(game_id, None)
+
+    def mark_fresh(self, key):
+        """Record a successful fetch of 'schedule' or a game id."""
+        with self._freshness_lock:
+            self.last_good[key] = datetime.now(timezone.utc)
+            recovered = self._stale.pop(key, None) is not None
+        if recovered:
+            print(f"{key}: API back, data fresh again.", file=sys.stderr)
+
+    def serve_stale(self, key, url, error):
+        """
+        Handle a failed poll of 'schedule' or a game id by keeping its last good data: mark the
+        key stale and return, so the caller carries on as after a 304. Errors that are not
+        transient (see http_client.is_transient) are raised as before.
+
+        Args:
+            key (str): 'schedule' or the game id.
+            url (str): URL that failed.
+            error (Exception): What went wrong.
+
+        Raises:
+            Exception: `error`, when it is not transient.
+        """
+        if not is_transient(error):
+            raise error
+        if isinstance(error, ValueError):
+            # The garbled body's validators were kept; without them the next poll refetches it whole.
+            self.http.forget(url)
+        with self._freshness_lock:
+            newly_stale = key not in self._stale
+            self._stale[key] = self.last_good.get(key)
+        shared_metrics().increment("stale_served", kind='schedule' if key == 'schedule' else 'pbp',
+                                   error=type(error).__name__)
+        if newly_stale:
+            print(f"{key}: serving last good data ({type(error).__name__}):", error, file=sys.stderr)
+
+    def stale_since(self, *keys):
+        """
+        Returns:
+            tuple: (stale, last good) for 'schedule' / game id keys: whether any of them is
+            stale, and the oldest last good fetch time among the stale ones (None if never fetched).
+        """
+        with self._freshness_lock:
+            stale = [key for key in keys if key in self._stale]
+            times = [self._stale[key] for key in stale]
+        if not stale:
+            return False, None
+        return True, None if None in times else min(times)
+
+    def get_pbp_data(self, game_id, conditional=False):
+        """
+        Fetch the pitch-by-pitch (PBP) data for a specific game.
+
+        Args:
+            game_id (str): The unique identifier of the game.
+            conditional (bool): Send ETag/If-Modified-Since from the previous fetch of this game.
+
+        Returns:
+            dict or None: A dictionary containing the PBP data for the game, or None when
+            `conditional` is set and the server answered 304 (no new pitch).
+        """
+        def decode(response):
+            with shared_metrics().timer("decode", game=game_id):
+                return response.json().get('game', {})
+
+        return self.http.get(self.pbp_url(game_id), conditional=conditional, decode=decode)
+
+    def get_pbp_tail(self, game_id, first_inning_index=None, conditional=False):
+        """
+        Fetch a game's play-by-play but decode only its trailing innings.
+
+        Falls back to the full `response.json()` decode of `get_pbp_data` when the tail
+        cannot be located in the body.
+
+        Args:
+            game_id (str): The unique identifier of the game.
+            first_inning_index (int, optional): Index of the first inning to decode. Defaults to the last.
+            conditional (bool): Send ETag/If-Modified-Since from the previous fetch of this game.
+
+        Returns:
+            dict or None: {'innings': [...], 'innings_offset': int} (or the full game object on
+            fallback), or None when `conditional` is set and the server answered 304, or when
+            the poll failed transiently and the game's last good data stays in use (`serve_stale`).
+        """
+        def decode(response):
+            with shared_metrics().timer("decode", game=game_id):
+                tail = extract_innings_tail(response.content, first_inning_index)
+                return tail if tail is not None else response.json().get('game', {})
+
+        url = self.pbp_url(game_id)
+        try:
+            tail = self.http.get(url, conditional=conditional, decode=decode)
+        except Exception as e:
+            self.serve_stale(game_id, url, e)
+            return None
+        self.mark_fresh(game_id)
+        return tail
+
+    def pbp_url(self, game_id):
+        """Return the pbp.json URL of a game."""
+        return f"{self.base_url}/{self.access_level}/v8/en/games/{game_id}/pbp.json?api_key={self.api_key}"
+
+    def push_url(self):
+        """Return the URL of the push feed of pitch events of every live game."""
+        return f"{self.base_url}/{self.access_level}/stream/en/events/subscribe?api_key={self.api_key}"
+
+    def season_schedule_url(self, year, season_type='REG'):
+        """Return the schedule.json URL of a whole season ('PRE', 'REG' or 'PST')."""
+        return f"{self.base_url}/{self.access_level}/v8/en/games/{year}/{season_type}/schedule.json?api_key={self.api_key}"
+
+    def get_season_schedule(self, year, season_type='REG'):
+        """
+        Fetch every game of a season.
+
+        Args:
+            year (int): Season year.
+            season_type (str): 'PRE', 'REG' or 'PST'.
+
+        Returns:
+            list: The schedule's game dicts (id, status, scheduled, home_team, away_team, ...).
+        """
+        return self.http.get(self.season_schedule_url(year, season_type), decode=lambda r: r.json().get('games', []))
+
+
+class Pitch_Stream(MLB_API_Calls):
+    """
+      Play-by-play parsing on top of MLB_API_Calls, with no GUI dependency. Turns pbp.json
+      responses into the pitch summaries shown by StrikeZone_Updates or written as JSON
+      lines by the headless mode.
+
+      Inherits:
+          MLB_API_Calls: Manages API calls to fetch live game and pitch-by-pitch data.
+
+      Attributes:
+          last_out (str): Keeps track of the last recorded out.
+          last_inning (str): Keeps track of the last recorded inning.
+          game_progress (dict): Game id -> GameProgress, the incremental pbp read position.
+          umpire_accuracy (dict): Game id -> RunningAccuracy of the called balls and strikes read so far.
+      """
+
+    def __init__(self, api_key, access_level, schedule_date=None, base_url=SPORTRADAR_BASE_URL):
+        """
+        Args:
+            api_key (str): The user's Sportradar API key.
+            access_level (str): The API access level (e.g., "trial" or "production").
+            schedule_date (datetime.date, optional): Day whose schedule is polled. Defaults to today.
+            base_url (str, optional): Root of the MLB API. Defaults to Sportradar.
+        """
+        MLB_API_Calls.__init__(self, api_key, access_level, schedule_date, base_url)
+        self.last_out = 'N/A'
+        self.last_inning = 'N/A'
+        self.game_progress = {}
+        self.umpire_accuracy = {}
+
+    def evict_game(self, game_id):
+        """
+        Drop a finished game's read position and umpire accuracy as well, so evicted games
+        leave nothing behind.
+        """
+        MLB_API_Calls.evict_game(self, game_id)
+        self.game_progress.pop(game_id, None)
+        self.umpire_accuracy.pop(game_id, None)
+
+    def get_latest_inning(self, game_data):
+        """
+        Extracts the most recent inning and half-inning data from the full game object.
+
+        Args:
+            game_data (dict): A full play-by-play response from the API.
+
+        Returns:
+            tuple:
+                - inning_dict (dict or None): The most recent inning's data.
+                - half_dict (dict or None): The most recent half-inning's data.
+                - error_msg (str or None): Error message if inning data is not found.
+        """
+        innings = game_data.get('innings', [])
+        if not innings:
+            return None, None, "No innings data found."
+
+        last_inning = innings[-1]
+        halfs = last_inning.get('halfs', [])
+        if not halfs:
+            return None, None, "Inning coming up."
+
+        last_half = halfs[1] if halfs[-1].get("events") else halfs[0]
+        #print("Last Inning:", last_inning.get('number', 'not here'), "Last Half:", last_half.get('half', 'not here'))
+        return last_inning, last_half, None
+
+    def stream_latest_pitch_and_info(self, game_id, conditional=False):
+        """
+        Fetches and summarizes the most recent pitch and game context data for a given game.
+
+        Args:
+            game_id (str): Unique identifier for the selected MLB game.
+            conditional (bool): Use a conditional request; returns None on 304 Not Modified.
+
+        Returns:
+            dict: A dictionary summarizing the most recent pitch, including:
+                - inning_number (str)
+                - inning_half (str)
+                - home_team_score (str)
+                - away_team_score (str)
+                - hitter (str)
+                - pitcher (str)
+                - balls (str)
+                - strikes (str)
+                - outs (str)
+                - runners_on (int)
+                - ball_strike_or_foul (str)
+                - pitch_type (str)
+                - pitch_speed (str)
+                - pitch_zone (int)
+                - pitch_x (float)
+                - pitch_y (float)
+                - pitch_outcome (str)
+                - description (str)
+                Or a message-only fallback if no pitch data is currently available.
+                None if `conditional` is set and nothing changed since the last fetch.
+        """
+        #print(game_id)
+        game_data = self.get_pbp_data(game_id, conditional)
+        if game_data is None:
+            return None
+        return self.summarize_pbp(game_data)
+
+    def summarize_pbp(self, game_data):
+        """
+        Summarize the most recent pitch of an already fetched play-by-play game object.
+
+        Args:
+            game_data (dict): The 'game' object of a pbp.json response.
+
+        Returns:
+            dict: Same pitch summary as `stream_latest_pitch_and_info`.
+        """
+        inning, half_data, error = self.get_latest_inning(game_data)
+        if error:
+            error_summary = {
+                "inning_number": f"{error}",
+                "inning_half": '',
+                "home_team_score": "",
+                "away_team_score": "",
+                "hitter": '',
+                "pitcher": '',
+                "balls": '',
+                "strikes": '',
+                "outs": "",
+                "runners_on": 0,
+                "ball_strike_or_foul": '',
+                "pitch_type": "",
+                "pitch_speed": "",
+                "pitch_zone": -1,
+                "pitch_x": 0,
+                "pitch_y": 0,
+                "pitch_outcome": '',
+                "description": ''
+            }
+            #print(error)
+            return error_summary
+
+        events = half_data.get('events', [])
+        half = "Top" if half_data.get('half', '') == 'T' else "Bottom"
+        inning_number = inning.get('number', 'N/A')
+        if not events:
+            error_summary = {
+                "inning_number": f"No events yet in the {half} of the {inning_number}.",
+                "inning_half": '',
+                "home_team_score": "",
+                "away_team_score": "",
+                "hitter": '',
+                "pitcher": '',
+                "balls": '',
+                "strikes": '',
+                "outs": "",
+                "runners_on": 0,
+                "ball_strike_or_foul": '',
+                "pitch_type": "",
+                "pitch_speed": "",
+                "pitch_zone": -1,
+                "pitch_x": 0,
+                "pitch_y": 0,
+                "pitch_outcome": '',
+                "description": ''
+            }
+            #print(f"No events yet in the {half} of the {inning_number}.")
+            return error_summary
+
+        at_bat = events[-1].get('at_bat', {})
+        summary = self.summarize_at_bat(at_bat, inning_number, half)
+
+        return summary
+
+    def stream_new_pitches(self, game_id, conditional=False):
+        """
+        Fetch a game's play-by-play and summarize only the pitches added since the previous call.
+
+        Args:
+            game_id (str): Unique identifier for the selected MLB game.
+            conditional (bool): Use a conditional request; returns None on 304 Not Modified.
+
+        Returns:
+            list or None: Pitch summaries in the order they were thrown (see
+            `stream_latest_pitch_and_info`), or None if nothing changed since the last fetch.
+        """
+        game_data = self.fetch_new_pbp(game_id, conditional)
+        if game_data is None:
+            return None
+        return self.summarize_new_pitches(game_id, game_data)
+
+    def fetch_new_pbp(self, game_id, conditional=False):
+        """
+        Fetch and decode only the innings a game's GameProgress has not finished reading.
+
+        Args:
+            game_id (str): Unique identifier of the game.
+            conditional (bool): Use a conditional request; returns None on 304 Not Modified.
+
+        Returns:
+            dict or None: Innings tail for `summarize_new_pitches`, or None on 304.
+        """
+        progress = self.game_progress.get(game_id)
+        first_inning_index = progress.inning_index if progress is not None else None
+        return self.get_pbp_tail(game_id, first_inning_index, conditional)
+
+    def summarize_new_pitches(self, game_id, game_data):
+        """
+        Summarize the pitches added to an already fetched game since the previous call.
+
+        When there is no new pitch the latest state is returned as a single summary, which
+        also carries the "No events yet" / "Inning coming up" messages.
+
+        Args:
+            game_id (str): Unique identifier of the game.
+            game_data (dict): The 'game' object of a pbp.json response.
+
+        Returns:
+            list: Pitch summaries in the order they were thrown.
+        """
+        summaries = self.new_pitch_summaries(game_id, game_data)
+        if not summaries:
+            summary = self.summarize_pbp(game_data)
+            accuracy = self.umpire_accuracy.get(game_id)
+            if accuracy is not None:
+                summary["umpire_correct"] = accuracy.correct
+                summary["umpire_called"] = accuracy.called
+            return [summary]
+        return summaries
+
+    def new_pitch_summaries(self, game_id, game_data):
+        """
+        Summarize only the pitches added to an already fetched game since the previous call.
+        Each summary also carries the game's running umpire accuracy as "umpire_correct" and
+        "umpire_called".
+
+        Args:
+            game_id (str): Unique identifier of the game.
+            game_data (dict): The 'game' object of a pbp.json response.
+
+        Returns:
+            list: Pitch summaries in the order they were thrown, empty if nothing new.
+        """
+        with shared_metrics().timer("parse", game=game_id):
+            return self._new_pitch_summaries(game_id, game_data)
+
+    def _new_pitch_summaries(self, game_id, game_data):
+        progress = self.game_progress.setdefault(game_id, GameProgress())
+        # last_out is tracked per game so polling several games does not mix their outs.
+        self.last_out = progress.last_out
+        summaries = [self._record_pitch(game_id, inning, half_data, at_bat, pitch_event)
+                     for inning, half_data, at_bat, pitch_event in progress.new_pitches(game_data)]
+        progress.last_out = self.last_out
+        return summaries
+
+    def _record_pitch(self, game_id, inning, half_data, at_bat, pitch_event):
+        # Adds a new pitch to the game's umpire accuracy, then summarizes it.
+        accuracy = self.umpire_accuracy.setdefault(game_id, RunningAccuracy())
+        accuracy.add(pitch_event.get('outcome_id'), pitch_event.get('mlb_pitch_data', {}).get('zone', -1))
+        half = "Top" if half_data.get('half', '') == 'T' else "Bottom"
+        summary = self.summarize_at_bat(at_bat, inning.get('number', 'N/A'), half, pitch_event)
+        summary["umpire_correct"] = accuracy.correct
+        summary["umpire_called"] = accuracy.called
+        return summary
+
+    def summarize_pushed_pitch(self, payload):
+        """
+        Summarize one pitch message of the push feed (see push_feed.py), unless a poll or an
+        earlier message already handed it out.
+
+        Args:
+            payload (dict): The message's 'payload': 'game', 'inning', 'half', 'at_bat' and 'event'.
+
+        Returns:
+            tuple: (game_id, summary), summary being None for a pitch already handed out.
+        """
+        game_id = payload.get('game', {}).get('id')
+        pitch_event = payload.get('event', {})
+        with shared_metrics().timer("parse", game=game_id):
+            progress = self.game_progress.setdefault(game_id, GameProgress())
+            if 'id' in pitch_event and not progress.claim_pitch(pitch_event['id']):
+                return game_id, None
+            self.last_out = progress.last_out
+            summary = self._record_pitch(game_id, {'number': payload.get('inning', 0)},
+                                         {'half': payload.get('half', '')}, payload.get('at_bat', {}), pitch_event)
+            progress.last_out = self.last_out
+        return game_id, summary
+
+    def summarize_game(self, game_data):
+        """
+        Summarize every pitch of a play-by-play game object in one pass, for a ReplayIndex.
+        The live read positions and umpire accuracy are left untouched.
+
+        Args:
+            game_data (dict): The 'game' object of a pbp.json response.
+
+        Returns:
+            list: (key, summary, wall clock start) per pitch in the order thrown; key is
+            (inning number, half code, at-bat number in the half, pitch number in the at-bat).
+        """
+        saved_last_out = self.last_out
+        self.last_out = 'N/A'
+        accuracy = RunningAccuracy()
+        entries = []
+        current_half = current_at_bat = None
+        at_bat_number = pitch_number = 0
+        for inning, half_data, at_bat, pitch_event in iter_pitches(game_data):
+            if half_data is not current_half:
+                current_half, current_at_bat, at_bat_number = half_data, None, -1
+            if at_bat is not current_at_bat:
+                current_at_bat, at_bat_number, pitch_number = at_bat, at_bat_number + 1, -1
+            pitch_number += 1
+            accuracy.add(pitch_event.get('outcome_id'), pitch_event.get('mlb_pitch_data', {}).get('zone', -1))
+            half_code = half_data.get('half', '')
+            summary = self.summarize_at_bat(at_bat, inning.get('number', 'N/A'),
+                                            "Top" if half_code == 'T' else "Bottom", pitch_event)
+            summary["umpire_correct"] = accuracy.correct
+            summary["umpire_called"] = accuracy.called
+            entries.append(((inning.get('number', 0), HALF_CODES.get(half_code, 0), at_bat_number, pitch_number),
+                            summary, pitch_event.get('wall_clock', {}).get('start_time')))
+        self.last_out = saved_last_out
+        return entries
+
+    def game_matchup(self, game_id, game_data):
+        """Return a game's "Away vs(@) Home" label: its dropdown entry, or one built from its pbp teams."""
+        for matchup, live_game_id in self.live_games_dict.items():
+            if live_game_id == game_id:
+                return matchup
+        all_teams = load_teams()
+        home, away = game_data.get('home') or {}, game_data.get('away') or {}
+        home_team = team_name(all_teams, home.get('id') or game_data.get('home_team', ''), home)
+        away_team = team_name(all_teams, away.get('id') or game_data.get('away_team', ''), away)
+        return f"{away_team} vs(@) {home_team}"
+
+    def summarize_at_bat(self, at_bat, inning_number, half, pitch_event=None):
+        """
+        Parse and summarize at-bat data for GUI rendering.
+
+        Args:
+            at_bat (dict): Dictionary containing at-bat and pitch data.
+            inning_number (int or str): Inning number of the event.
+            half (str): 'Top' or 'Bottom' half of the inning.
+            pitch_event (dict, optional): Pitch to summarize. Defaults to the at-bat's last event.
+
+        Returns:
+            dict: Summary of batter, pitcher, pitch type, count, and scores.
+        """
+        events = at_bat.get('events', [])
+        hitter = at_bat.get('hitter', {})
+        pitcher = at_bat.get('pitcher', {})
+        hitter_name = f"{hitter.get('preferred_name', '')} {hitter.get('last_name', '')}"
+        pitcher_name = f"{pitcher.get('preferred_name', '')} {pitcher.get('last_name', '')}"
+        home_team_score = at_bat.get('score', {}).get('home_team_runs', 'N/A')
+        away_team_score = at_bat.get('score', {}).get('away_team_runs', 'N/A')
+        if not events:
+            return {
+                "inning_number": inning_number,
+                "inning_half": half,
+                "home_team_score": home_team_score,
+                "away_team_score": away_team_score,
+                "hitter": hitter_name,
+                "pitcher": pitcher_name,
+                "balls": '',
+                "strikes": '',
+                "outs": self.last_out,
+                "runners_on": 0,
+                "ball_strike_or_foul": '',
+                "pitch_type": "",
+                "pitch_speed": "",
+                "pitch_zone": -1,
+                "pitch_x": 0,
+                "pitch_y": 0,
+                "pitch_outcome": "",
+                "description": at_bat.get('description', '')
+            }
+
+        last_event = pitch_event if pitch_event is not None else events[-1]
+        count = last_event.get('count', {})
+        balls = count.get('balls', 0)
+        strikes = count.get('strikes', 0)
+        outs = count.get('outs', '')
+        if outs == '':
+            if self.last_inning == inning_number:
+                outs = self.last_out
+        else:
+            self.last_out = outs
+
+        # Runners the pitch was thrown with, by the bases they started it on.
+        runners_on = len({runner.get('starting_base') for runner in last_event.get('runners', [])
+                          if runner.get('starting_base') in (1, 2, 3)})
+
+        mlb_pitch_data = last_event.get('mlb_pitch_data', {})
+        pitch_type = mlb_pitch_data.get('description', 'Unknown')
+        pitch_zone = mlb_pitch_data.get('zone', -1)
+        pitch_speed = last_event.get('pitcher', {}).get('pitch_speed', 0)
+        pitch_x = last_event.get('pitcher', {}).get('pitch_x', 0)
+        pitch_y = last_event.get('pitcher', {}).get('pitch_y', 0)
+        pitch_outcome = load_play_outcome_codes().get(last_event.get('outcome_id'), 'Unknown')
+
+        if pitch_outcome in ['Strike', ' Foul Ball']:
+            ball_strike_or_foul = 'Strike'
+        elif "Ball" in pitch_outcome:
+            ball_strike_or_foul = 'Ball'
+        else:
+            ball_strike_or_foul = 'N/A'
+
+        return {
+            "inning_number": inning_number,
+            "inning_half": half,
+            "home_team_score": home_team_score,
+            "away_team_score": away_team_score,
+            "hitter": hitter_name,
+            "pitcher": pitcher_name,
+            "balls": balls,
+            "strikes": strikes,
+            "outs": outs,
+            "runners_on": runners_on,
+            "ball_strike_or_foul": ball_strike_or_foul,
+            "pitch_type": pitch_type,
+            "pitch_speed": pitch_speed,
+            "pitch_zone": pitch_zone,
+            "pitch_x": pitch_x,
+            "pitch_y": pitch_y,
+            "pitch_outcome": pitch_outcome,
+            "description": at_bat.get('description', '')
+        }
@@ -0,0 +1,5 @@
+# Choices of CLI options whose modules are heavy to import: heatmap.py (NumPy and Pillow) and
+# disk_cache.py (requests). Kept free of imports so main.py can build its argument parser, and
+# `--headless` can run, without loading either; disk_cache.py validates its mode against these.
+HEATMAP_SCOPES = ("off", "game", "pitcher")
+CACHE_MODES = ("off", "record", "replay")
@@ -0,0 +1,142 @@
+class GameProgress:
+    """
+      Incremental read position inside one game's play-by-play document.
+
+      Remembers the inning, half and at-bat that were last read plus the pitch event
+      ids already seen in that at-bat, so each poll only walks what was appended since
+      the previous poll instead of the whole game.
+
+      Attributes:
+          inning_index (int or None): Index into `innings` of the last read at-bat. None until first read.
+          half_index (int): Index into that inning's `halfs`.
+          event_index (int): Index into that half's `events` of the last read at-bat.
+          at_bat_id (str or None): Id of the last read at-bat.
+          seen_pitch_ids (set): Pitch event ids already produced for `at_bat_id`.
+          delivered_pitch_ids (set): Pitch event ids of the whole game already handed out, by a
+              poll or by the push feed, so a poll after a push outage does not repeat them.
+          last_out (str): Last recorded out count of this game.
+      """
+
+    def __init__(self):
+        self.inning_index = None
+        self.half_index = 0
+        self.event_index = 0
+        self.at_bat_id = None
+        self.seen_pitch_ids = set()
+        self.delivered_pitch_ids = set()
+        self.last_out = 'N/A'
+
+    def new_pitches(self, game_data):
+        """
+        Return the pitch events added to the game since the previous call.
+
+        The first call only returns the latest pitch of the game (what the window shows
+        today); later calls return every pitch that landed in between, in order.
+
+        Args:
+            game_data (dict): The 'game' object of a pbp.json response, or the tail returned
+                by `extract_innings_tail` whose 'innings_offset' gives the index of its first inning.
+
+        Returns:
+            list: Tuples of (inning_dict, half_dict, at_bat_dict, pitch_event_dict).
+        """
+        innings = game_data.get('innings', [])
+        offset = game_data.get('innings_offset', 0)
+        if not innings:
+            return []
+        if self.inning_index is None or self.inning_index < offset:
+            return self._latest_pitch(innings, offset)
+
+        found = []
+        for inning_index in range(self.inning_index, offset + len(innings)):
+            inning = innings[inning_index - offset]
+            halfs = inning.get('halfs', [])
+            first_half = self.half_index if inning_index == self.inning_index else 0
+            for half_index in range(first_half, len(halfs)):
+                half = halfs[half_index]
+                events = half.get('events', [])
+                resume_here = inning_index == self.inning_index and half_index == self.half_index
+                first_event = self.event_index if resume_here else 0
+                for event_index in range(first_event, len(events)):
+                    at_bat = events[event_index].get('at_bat')
+                    if not at_bat:
+                        continue
+                    self._move_to(inning_index, half_index, event_index, at_bat)
+                    for pitch in self._unseen_pitches(at_bat):
+                        found.append((inning, half, at_bat, pitch))
+        return found
+
+    def _latest_pitch(self, innings, offset):
+        for local_index in range(len(innings) - 1, -1, -1):
+            inning_index = local_index + offset
+            halfs = innings[local_index].get('halfs', [])
+            for half_index in range(len(halfs) - 1, -1, -1):
+                events = halfs[half_index].get('events', [])
+                for event_index in range(len(events) - 1, -1, -1):
+                    at_bat = events[event_index].get('at_bat')
+                    if not at_bat:
+                        continue
+                    self._move_to(inning_index, half_index, event_index, at_bat)
+                    pitches = self._unseen_pitches(at_bat)
+                    if not pitches:
+                        return []
+                    return [(innings[local_index], halfs[half_index], at_bat, pitches[-1])]
+        return []
+
+    def _move_to(self, inning_index, half_index, event_index, at_bat):
+        at_bat_id = at_bat.get('id')
+        if (inning_index, half_index, event_index) != (self.inning_index, self.half_index, self.event_index) \
+                or at_bat_id != self.at_bat_id:
+            self.seen_pitch_ids = set()
+        self.inning_index = inning_index
+        self.half_index = half_index
+        self.event_index = event_index
+        self.at_bat_id = at_bat_id
+
+    def _unseen_pitches(self, at_bat):
+        unseen = []
+        for position, event in enumerate(at_bat.get('events', [])):
+            if event.get('type', 'pitch') != 'pitch':
+                continue
+            pitch_id = event.get('id', position)
+            if pitch_id not in self.seen_pitch_ids:
+                self.seen_pitch_ids.add(pitch_id)
+                if 'id' not in event or self.claim_pitch(event['id']):
+                    unseen.append(event)
+        return unseen
+
+    def claim_pitch(self, pitch_id):
+        """
+        Mark a pitch as handed out.
+
+        Args:
+            pitch_id (str): Pitch event id.
+
+        Returns:
+            bool: True the first time, False if a poll or the push feed already handed it out.
+        """
+        if pitch_id in self.delivered_pitch_ids:
+            return False
+        self.delivered_pitch_ids.add(pitch_id)
+        return True
+
+
+def iter_pitches(game_data):
+    """
+    Yield every pitch of a play-by-play game object, in the order it was thrown.
+
+    Args:
+        game_data (dict): The 'game' object of a pbp.json response.
+
+    Yields:
+        tuple: (inning_dict, half_dict, at_bat_dict, pitch_event_dict).
+    """
+    for inning in game_data.get('innings', []):
+        for half in inning.get('halfs', []):
+            for event in half.get('events', []):
+                at_bat = event.get('at_bat')
+                if not at_bat:
+                    continue
+                for pitch in at_bat.get('events', []):
+                    if pitch.get('type', 'pitch') == 'pitch':
+                        yield inning, half, at_bat, pitch
@@ -0,0 +1,93 @@
+import json
+
+_decoder = json.JSONDecoder()
+HALFS_KEY = '"halfs"'
+
+
+def _escaped(text, quote_pos):
+    """Whether the quote at quote_pos is preceded by an odd run of backslashes."""
+    i = quote_pos - 1
+    while i >= 0 and text[i] == '\\':
+        i -= 1
+    return (quote_pos - 1 - i) % 2 == 1
+
+
+def _object_start(text, key_pos):
+    """
+    Walk back from a key to the '{' that opens the object holding it.
+
+    The key itself sits outside any string, so every unescaped quote passed on the way
+    back toggles in and out of a string value; braces inside strings are not counted.
+    """
+    depth = 0
+    in_string = False
+    for i in range(key_pos - 1, -1, -1):
+        c = text[i]
+        if c == '"':
+            if not _escaped(text, i):
+                in_string = not in_string
+        elif in_string:
+            continue
+        elif c == '}':
+            depth += 1
+        elif c == '{':
+            if depth == 0:
+                return i
+            depth -= 1
+    return -1
+
+
+def _is_key(text, pos):
+    """Whether the '"halfs"' at pos is an object key and not a string value that reads "halfs"."""
+    end = pos + len(HALFS_KEY)
+    while end < len(text) and text[end] in ' \t\r\n':
+        end += 1
+    return end < len(text) and text[end] == ':'
+
+
+def extract_innings_tail(raw, first_inning_index=None):
+    """
+    Decode only the trailing innings of a pbp.json body instead of the whole game tree.
+
+    Every inning object in Sportradar's play-by-play is the only object carrying a
+    "halfs" key, so the inning boundaries can be located with a plain substring search.
+    Only the requested innings are then handed to the JSON decoder; the rest of the
+    document is never turned into Python objects.
+
+    Args:
+        raw (bytes or str): Body of a pbp.json response.
+        first_inning_index (int, optional): Index into the game's `innings` list of the
+            first inning to decode. Defaults to the last inning only.
+
+    Returns:
+        dict or None: {'innings': [...], 'innings_offset': index of the first returned
+        inning in the full list}, or None if the body does not look as expected, in which
+        case callers should fall back to a full decode.
+    """
+    text = raw.decode('utf-8') if isinstance(raw, (bytes, bytearray)) else raw
+    positions = []
+    pos = text.find(HALFS_KEY)
+    while pos != -1:
+        if _is_key(text, pos):
+            positions.append(pos)
+        pos = text.find(HALFS_KEY, pos + len(HALFS_KEY))
+    if not positions:
+        return None
+
+    last_index = len(positions) - 1
+    if first_inning_index is None or first_inning_index > last_index:
+        first_inning_index = last_index
+
+    innings = []
+    for key_pos in positions[first_inning_index:]:
+        start = _object_start(text, key_pos)
+        if start == -1:
+            return None
+        try:
+            inning, end = _decoder.raw_decode(text, start)
+        except ValueError:
+            return None
+        if not isinstance(inning, dict) or 'halfs' not in inning or end <= key_pos:
+            return None
+        innings.append(inning)
+    return {'innings': innings, 'innings_offset': first_inning_index}
@@ -0,0 +1,193 @@
+import threading
+from array import array
+
+# Typecode of every per-pitch column. Coordinates and speed are float32, counts and zone
+# int8 (-1 when the feed omits them), codes uint16 and interned player / at-bat ids uint32:
+# about 40 bytes per pitch, so a whole game of ~300 pitches stays around 12 KB.
+COLUMNS = {
+    "x": "f",
+    "y": "f",
+    "speed": "f",
+    "zone": "b",
+    "balls": "b",
+    "strikes": "b",
+    "outs": "b",
+    "outcome": "H",
+    "pitch_type": "H",
+    "pitcher": "I",
+    "hitter": "I",
+    "inning": "H",
+    "half": "B",
+    "at_bat": "I",
+}
+
+HALF_CODES = {"T": 0, "B": 1}
+
+
+def _small_int(value):
+    # Zone and count fields are missing or None on some pitches; int8 columns store -1 for them.
+    return value if isinstance(value, int) and -128 <= value <= 127 else -1
+
+
+class Interner:
+    """
+      Thread-safe string <-> small int table, so each player id, outcome code and pitch
+      type of a game is stored once and the columns only hold integers.
+
+      Attributes:
+          values (list): Interned strings; a string's code is its index.
+      """
+
+    def __init__(self):
+        self.values = []
+        self._codes = {}
+        self._lock = threading.Lock()
+
+    def code(self, value):
+        """Return the code of `value`, interning it on first use."""
+        code = self._codes.get(value)
+        if code is not None:
+            return code
+        with self._lock:
+            code = self._codes.get(value)
+            if code is None:
+                code = len(self.values)
+                self.values.append(value)
+                self._codes[value] = code
+            return code
+
+    def lookup(self, value):
+        """Return the code of `value`, or None if it was never interned."""
+        return self._codes.get(value)
+
+    def __getitem__(self, code):
+        return self.values[code]
+
+
+class PitchRecord:
+    """
+      One stored pitch, read back from a GamePitchStore row. Fields hold the column values,
+      with pitcher, hitter, outcome and pitch_type still as interned codes.
+      """
+
+    __slots__ = ("row",) + tuple(COLUMNS)
+
+    def __init__(self, store, row):
+        self.row = row
+        for name in COLUMNS:
+            setattr(self, name, store.columns[name][row])
+
+    def __repr__(self):
+        return "PitchRecord(" + ", ".join(f"{name}={getattr(self, name)!r}" for name in self.__slots__) + ")"
+
+
+class GamePitchStore:
+    """
+      Append-only columnar pitch history of one game.
+
+      Each pitch is one row across typed `array.array` columns (see COLUMNS). Rows are
+      appended in the order pitches are thrown, so an inning or an at-bat is a contiguous
+      row range and slicing it is a zero-copy `memoryview` of each column.
+
+      Attributes:
+          strings (Interner): This game's table of player and at-bat ids, outcome codes and pitch types.
+          columns (dict): Column name -> array.array.
+          inning_rows (dict): (inning number, half code) -> [start row, stop row).
+          at_bat_rows (dict): Interned at-bat id -> [start row, stop row).
+      """
+
+    def __init__(self, strings=None):
+        self.strings = strings if strings is not None else Interner()
+        self.columns = {name: array(typecode) for name, typecode in COLUMNS.items()}
+        self.inning_rows = {}
+        self.at_bat_rows = {}
+
+    def __len__(self):
+        return len(self.columns["x"])
+
+    def append(self, inning_number, half, at_bat, pitch_event):
+        """
+        Append one pitch event of a pbp.json at-bat.
+
+        Args:
+            inning_number (int): Inning number of the pitch.
+            half (str): 'T' or 'B'.
+            at_bat (dict): The at-bat the pitch belongs to.
+            pitch_event (dict): The pitch event.
+
+        Returns:
+            int: Row of the new pitch.
+        """
+        strings = self.strings
+        pitch = pitch_event.get('pitcher', {})
+        count = pitch_event.get('count', {})
+        at_bat_code = strings.code(at_bat.get('id', ''))
+        half_code = HALF_CODES.get(half, 0)
+        row = len(self)
+        values = {
+            "x": pitch.get('pitch_x', 0) or 0,
+            "y": pitch.get('pitch_y', 0) or 0,
+            "speed": pitch.get('pitch_speed', 0) or 0,
+            "zone": _small_int(pitch_event.get('mlb_pitch_data', {}).get('zone')),
+            "balls": _small_int(count.get('balls')),
+            "strikes": _small_int(count.get('strikes')),
+            "outs": _small_int(count.get('outs')),
+            "outcome": strings.code(pitch_event.get('outcome_id', '')),
+            "pitch_type": strings.code(pitch_event.get('mlb_pitch_data', {}).get('description', 'Unknown')),
+            "pitcher": strings.code(at_bat.get('pitcher', {}).get('id', '')),
+            "hitter": strings.code(at_bat.get('hitter', {}).get('id', '')),
+            "inning": inning_number if isinstance(inning_number, int) else 0,
+            "half": half_code,
+            "at_bat": at_bat_code,
+        }
+        for name, column in self.columns.items():
+            column.append(values[name])
+
+        inning_key = (values["inning"], half_code)
+        self.inning_rows.setdefault(inning_key, [row, row])[1] = row + 1
+        self.at_bat_rows.setdefault(at_bat_code, [row, row])[1] = row + 1
+        return row
+
+    def record(self, row):
+        """Return row `row` as a PitchRecord."""
+        return PitchRecord(self, row)
+
+    def rows_for_inning(self, inning_number, half=None):
+        """
+        Args:
+            inning_number (int): Inning number.
+            half (str, optional): 'T' or 'B'. Defaults to both halves.
+
+        Returns:
+            range: Rows of the inning (empty if it has no stored pitch).
+        """
+        halves = [HALF_CODES[half]] if half is not None else [0, 1]
+        bounds = [self.inning_rows[(inning_number, h)] for h in halves if (inning_number, h) in self.inning_rows]
+        if not bounds:
+            return range(0)
+        return range(min(start for start, _ in bounds), max(stop for _, stop in bounds))
+
+    def rows_for_at_bat(self, at_bat_id):
+        """Return the rows of an at-bat by its Sportradar id (empty if unknown)."""
+        code = self.strings.lookup(at_bat_id)
+        start, stop = self.at_bat_rows.get(code, (0, 0))
+        return range(start, stop)
+
+    def column(self, name, rows=None):
+        """
+        Args:
+            name (str): Column name, see COLUMNS.
+            rows (range, optional): Contiguous rows to view. Defaults to all rows.
+
+        Returns:
+            memoryview: Zero-copy view of the column (or of the row range).
+        """
+        view = memoryview(self.columns[name])
+        if rows is None:
+            return view
+        return view[rows.start:rows.stop]
+
+    def nbytes(self):
+        """Bytes held by the columns."""
+        return sum(column.itemsize * len(column) for column in self.columns.values())
+
@@ -0,0 +1,87 @@
+TRAIL_SCOPES = ("off", "at_bat", "inning")
+TRAIL_POOL_SIZE = 300
+TRAIL_DOT_RADIUS = 7
+# The newest FADE_STEPS pitches get progressively lighter colors; older ones keep the
+# lightest shade, so each new pitch recolors at most FADE_STEPS + 1 items.
+FADE_STEPS = 6
+MAX_FADE = 0.7
+FADE_TOWARDS = (255, 255, 255)
+
+
+def fade_color(color, amount):
+    """
+    Blend a '#rrggbb' color towards FADE_TOWARDS.
+
+    Args:
+        color (str): Base color as '#rrggbb'.
+        amount (float): 0 keeps the color, 1 returns FADE_TOWARDS.
+
+    Returns:
+        str: The blended '#rrggbb' color.
+    """
+    base = [int(color[i:i + 2], 16) for i in (1, 3, 5)]
+    mixed = [round(c + (t - c) * amount) for c, t in zip(base, FADE_TOWARDS)]
+    return "#{:02x}{:02x}{:02x}".format(*mixed)
+
+
+class PitchTrail:
+    """
+      Persistent, numbered pitch trail drawn from a fixed pool of canvas items.
+
+      All ovals and number labels are created once, hidden. Each new pitch takes the next
+      pool slot (oldest first once the pool wraps) and is moved with `coords`/`itemconfig`,
+      so no canvas items are created or destroyed while the game runs and the cost of a
+      pitch stays flat however many are on screen.
+
+      Attributes:
+          canvas (tk.Canvas): Canvas the trail is drawn on.
+          pool_size (int): Number of pooled dots, i.e. the most pitches shown at once.
+          count (int): Pitches added since the last `clear`.
+      """
+
+    def __init__(self, canvas, pool_size=TRAIL_POOL_SIZE, radius=TRAIL_DOT_RADIUS):
+        self.canvas = canvas
+        self.pool_size = pool_size
+        self.radius = radius
+        self.count = 0
+        self.dots = []
+        self.labels = []
+        self.colors = [None] * pool_size
+        for _ in range(pool_size):
+            self.dots.append(canvas.create_oval(0, 0, 0, 0, outline='black', state='hidden'))
+            self.labels.append(canvas.create_text(0, 0, font=("Helvetica", 7, "bold"), state='hidden'))
+
+    def add(self, x, y, color):
+        """
+        Show a pitch at canvas coordinates (x, y) as the newest, fully colored dot.
+
+        Args:
+            x (float): Canvas x coordinate.
+            y (float): Canvas y coordinate.
+            color (str): '#rrggbb' color of the pitch result.
+        """
+        slot = self.count % self.pool_size
+        self.count += 1
+        r = self.radius
+        dot = self.dots[slot]
+        label = self.labels[slot]
+        self.colors[slot] = color
+        self.canvas.coords(dot, x - r, y - r, x + r, y + r)
+        self.canvas.coords(label, x, y)
+        self.canvas.itemconfig(dot, state='normal')
+        self.canvas.itemconfig(label, text=str(self.count), state='normal')
+        self.canvas.tag_raise(dot)
+        self.canvas.tag_raise(label)
+
+        visible = min(self.count, self.pool_size)
+        for age in range(min(FADE_STEPS + 1, visible)):
+            aged_slot = (self.count - 1 - age) % self.pool_size
+            amount = MAX_FADE * min(age, FADE_STEPS) / FADE_STEPS
+            self.canvas.itemconfig(self.dots[aged_slot], fill=fade_color(self.colors[aged_slot], amount))
+
+    def clear(self):
+        """Hide every dot, e.g. when a new at-bat or inning starts."""
+        for slot in range(min(self.count, self.pool_size)):
+            self.canvas.itemconfig(self.dots[slot], state='hidden')
+            self.canvas.itemconfig(self.labels[slot], state='hidden')
+        self.count = 0
@@ -0,0 +1,117 @@
+import json
+import random
+import sys
+import threading
+
+from mlb_strikezone_app.http_client import shared_session
+from mlb_strikezone_app.metrics import shared_metrics
+
+# Sportradar push feeds send a heartbeat line every few seconds; a stream silent for this
+# long is treated as dead and reconnected.
+HEARTBEAT_TIMEOUT_SECONDS = 20
+
+# Reconnect backoff: RECONNECT_BASE_SECONDS * 2**failures with +-50% jitter, capped.
+RECONNECT_BASE_SECONDS = 1
+MAX_RECONNECT_SECONDS = 60
+
+
+class PushFeed(threading.Thread):
+    """
+      Daemon thread holding a long-lived push feed connection open and handing every pitch
+      message to a callback as soon as its line arrives.
+
+      The feed is newline-delimited JSON in Sportradar's push envelope:
+
+          {"heartbeat": {"interval": 5}}
+          {"payload": {"game": {"id": ..., "status": ...}, "inning": 3, "half": "T",
+                       "at_bat": {...}, "event": {...}},
+           "metadata": {"game_id": ..., "event_type": "pitch"}}
+
+      where 'at_bat' and 'event' are shaped like the at-bat and pitch event of pbp.json, so
+      `Pitch_Stream.summarize_pushed_pitch` summarizes them with the polling code.
+
+      The callbacks run on this thread and should only queue work. A push feed cannot be
+      replayed from an offset, so `on_connect` is the consumer's cue to catch up with one
+      pbp poll per tracked game; pitches that show up twice are dropped by GameProgress.
+      While `connected` is clear the consumer keeps polling pbp.json as before.
+
+      Attributes:
+          url (str): Push feed URL (`MLB_API_Calls.push_url()`).
+          on_message (callable): `on_message(payload)` for every pitch message.
+          on_connect (callable or None): Called after every successful (re)connect.
+          connected (threading.Event): Set while the stream is open.
+          read_timeout (float): Seconds of silence before the connection is dropped.
+      """
+
+    def __init__(self, url, on_message, on_connect=None, session=None, read_timeout=HEARTBEAT_TIMEOUT_SECONDS):
+        """
+        Args:
+            url (str): Push feed URL.
+            on_message (callable): Receives the 'payload' of each pitch message.
+            on_connect (callable, optional): Called after each (re)connect.
+            session (Sportradar_Session, optional): HTTP client. Defaults to the shared one.
+            read_timeout (float): Seconds of silence before reconnecting.
+        """
+        super().__init__(name="strikezone-push", daemon=True)
+        self.url = url
+        self.on_message = on_message
+        self.on_connect = on_connect
+        self.session = session or shared_session()
+        self.read_timeout = read_timeout
+        self.connected = threading.Event()
+        self._stopping = threading.Event()
+        self._response = None
+
+    def stop(self):
+        """Close the stream and let the thread exit."""
+        self._stopping.set()
+        response = self._response
+        if response is not None:
+            response.close()
+
+    def run(self):
+        metrics = shared_metrics()
+        failures = 0
+        while not self._stopping.is_set():
+            try:
+                self._response = self.session.stream(self.url, self.read_timeout)
+                with self._response:
+                    self.connected.set()
+                    metrics.set_gauge("push_connected", 1)
+                    failures = 0
+                    if self.on_connect is not None:
+                        self.on_connect()
+                    for line in self._response.iter_lines():
+                        if self._stopping.is_set():
+                            return
+                        if line:
+                            self._dispatch(line)
+                    raise ConnectionError("push feed closed by the server")
+            except Exception as e:
+                if self._stopping.is_set():
+                    return
+                failures += 1
+                metrics.increment("errors", kind="push", error=type(e).__name__)
+                print(f"Push feed disconnected ({type(e).__name__}):", e, file=sys.stderr)
+            finally:
+                self._response = None
+                self.connected.clear()
+                metrics.set_gauge("push_connected", 0)
+            delay = min(MAX_RECONNECT_SECONDS, RECONNECT_BASE_SECONDS * 2 ** failures)
+            self._stopping.wait(delay * random.uniform(0.5, 1.5))
+
+    def _dispatch(self, line):
+        metrics = shared_metrics()
+        try:
+            message = json.loads(line)
+        except ValueError:
+            # One garbled line is not worth dropping the connection for.
+            metrics.increment("errors", kind="push", error="JSONDecodeError")
+            return
+        if "heartbeat" in message:
+            metrics.increment("push_messages", type="heartbeat")
+            return
+        event_type = message.get("metadata", {}).get("event_type", "pitch")
+        metrics.increment("push_messages", type=event_type)
+        if event_type == "pitch" and "payload" in message:
+            self.on_message(message["payload"])
@@ -0,0 +1,120 @@
+"""Pitch-by-pitch replay of one game: the window's Replay button and `--replay GAME_ID`."""
+from bisect import bisect_left
+from datetime import datetime
+
+from mlb_strikezone_app.pitch_store import HALF_CODES
+
+# Playback speeds offered by the window; 1x follows the pitches' own wall clock.
+REPLAY_SPEEDS = (1, 2, 5, 10, 30, 60)
+
+# Time between two pitches at 1x when the play-by-play has no wall clock for them, and the
+# bounds real gaps are clamped to, so mound visits and inning breaks do not stall playback.
+DEFAULT_PITCH_GAP_SECONDS = 20
+MIN_PITCH_GAP_SECONDS = 2
+MAX_PITCH_GAP_SECONDS = 60
+
+
+def _thrown_at(value):
+    try:
+        return datetime.fromisoformat(value.replace('Z', '+00:00'))
+    except (AttributeError, ValueError):
+        return None
+
+
+class ReplayIndex:
+    """
+      Every pitch of one game, summarized once, in the order thrown. Scrubbing and playback
+      only index into it; the innings / halfs / events tree is never walked again.
+
+      A pitch is addressed either by its position (0 .. len - 1), in O(1), or by its key
+      (inning number, half, at-bat number in the half, pitch number in the at-bat); keys are
+      sorted by construction, so `position` finds one by bisection in O(log n).
+
+      Attributes:
+          game_id (str): Game replayed.
+          matchup (str): "Away vs(@) Home" label shown while replaying.
+          keys (list): Key of each position; halves are coded with pitch_store.HALF_CODES.
+          summaries (list): Pitch summary of each position, as Pitch_Stream produces them.
+          gaps (list): Seconds at 1x from each pitch to the next one.
+          at_bat_starts (list): Position of the first pitch of each position's at-bat.
+          inning_starts (list): Position of the first pitch of each position's half-inning.
+      """
+
+    def __init__(self, game_id, matchup, entries):
+        """
+        Args:
+            game_id (str): Game replayed.
+            matchup (str): Label shown while replaying.
+            entries (list): (key, summary, wall clock start) per pitch, from `Pitch_Stream.summarize_game`.
+        """
+        self.game_id = game_id
+        self.matchup = matchup
+        self.keys = [key for key, _, _ in entries]
+        self.summaries = [summary for _, summary, _ in entries]
+        times = [_thrown_at(start_time) for _, _, start_time in entries]
+        self.gaps = []
+        for position in range(len(entries)):
+            following = times[position + 1] if position + 1 < len(times) else None
+            if times[position] is None or following is None or following <= times[position]:
+                gap = DEFAULT_PITCH_GAP_SECONDS
+            else:
+                gap = (following - times[position]).total_seconds()
+            self.gaps.append(min(max(gap, MIN_PITCH_GAP_SECONDS), MAX_PITCH_GAP_SECONDS))
+        self.at_bat_starts = []
+        self.inning_starts = []
+        for position, key in enumerate(self.keys):
+            previous = self.keys[position - 1] if position else None
+            new_inning = previous is None or previous[:2] != key[:2]
+            self.inning_starts.append(position if new_inning else self.inning_starts[-1])
+            self.at_bat_starts.append(position if new_inning or previous[2] != key[2] else self.at_bat_starts[-1])
+
+    def __len__(self):
+        return len(self.summaries)
+
+    def summary(self, position):
+        """Return the pitch summary at a position."""
+        return self.summaries[position]
+
+    def position(self, inning, half='T', at_bat=0, pitch=0):
+        """
+        Return the position of a pitch, or of the first pitch after it when there is no such
+        pitch (e.g. the first pitch of an inning with `at_bat=0, pitch=0`).
+
+        Args:
+            inning (int): Inning number.
+            half (str): 'T' or 'B'.
+            at_bat (int): At-bat number within the half, from 0.
+            pitch (int): Pitch number within the at-bat, from 0.
+
+        Returns:
+            int: Position, clamped to the last pitch.
+        """
+        key = (inning, HALF_CODES.get(half, 0), at_bat, pitch)
+        return min(bisect_left(self.keys, key), len(self.keys) - 1)
+
+    def scope_start(self, position, scope):
+        """Return the first position of the at-bat ('at_bat') or half-inning ('inning') of a pitch."""
+        if scope == 'at_bat':
+            return self.at_bat_starts[position]
+        if scope == 'inning':
+            return self.inning_starts[position]
+        return position
+
+    def gap_ms(self, position, speed):
+        """Return how long (ms) the pitch at `position` stays up at `speed`x before the next one."""
+        return max(1, round(self.gaps[position] * 1000 / speed))
+
+
+def build_replay(stream, game_id):
+    """
+    Fetch a game's full play-by-play and index it for replay.
+
+    Args:
+        stream (Pitch_Stream): Fetches and summarizes the game.
+        game_id (str): Game to replay.
+
+    Returns:
+        ReplayIndex: Every pitch of the game so far.
+    """
+    game_data = stream.get_pbp_data(game_id)
+    return ReplayIndex(game_id, stream.game_matchup(game_id, game_data), stream.summarize_game(game_data))
@@ -0,0 +1,229 @@
+import threading
+from datetime import datetime, timedelta, timezone
+
+# Sportradar game statuses. Delays are still "on" (the game resumes the same day); the
+# finished ones never change again for that day, so their games are evicted.
+LIVE_STATUSES = ("inprogress",)
+DELAYED_STATUSES = ("delayed", "wdelay", "fdelay", "odelay")
+FINISHED_STATUSES = ("complete", "closed", "cancelled", "postponed", "suspended", "unnecessary")
+
+# When the schedule is refreshed: from START_LEAD before a game's first pitch until it is live
+# (for at most START_GRACE past the scheduled time), and from END_LEAD before its expected end
+# until it is final, every AROUND_EVENT_REFRESH; otherwise (mid-game, delays, late starts,
+# games without a start time) every MID_GAME_REFRESH.
+START_LEAD = timedelta(minutes=10)
+START_GRACE = timedelta(hours=1)
+END_LEAD = timedelta(minutes=20)
+EXPECTED_GAME_LENGTH = timedelta(hours=2, minutes=40)
+AROUND_EVENT_REFRESH = timedelta(minutes=2)
+MID_GAME_REFRESH = timedelta(minutes=15)
+
+
+def _parse_time(value):
+    # Schedule times are ISO 8601 with an offset, e.g. 2025-06-01T23:05:00+00:00.
+    try:
+        parsed = datetime.fromisoformat(value.replace('Z', '+00:00'))
+    except (AttributeError, ValueError):
+        return None
+    return parsed if parsed.tzinfo is not None else parsed.replace(tzinfo=timezone.utc)
+
+
+def team_name(all_teams, team_id, team=None):
+    """
+    Return a team's display name, falling back to the schedule's own team object (market and
+    name, or abbreviation) and then the id for teams missing from teams.json.
+    """
+    name = all_teams.get(team_id)
+    if name:
+        return name.strip()
+    team = team or {}
+    return f"{team.get('market', '')} {team.get('name', '')}".strip() or team.get('abbr') or team_id or "Unknown"
+
+
+class ScheduledGame:
+    """
+      One game of a day's schedule and where it is in its lifecycle.
+
+      Attributes:
+          game_id (str): Sportradar game id.
+          day (datetime.date): Schedule day the game is listed on.
+          matchup (str): Dropdown label, "Away vs(@) Home".
+          status (str): Latest schedule status.
+          scheduled (datetime or None): Scheduled first pitch (UTC), None if not announced.
+          started_at (datetime or None): When it was first seen live.
+          finished_at (datetime or None): When it was first seen final.
+      """
+
+    __slots__ = ("game_id", "day", "matchup", "status", "scheduled", "started_at", "finished_at")
+
+    def __init__(self, game_id, day, matchup, status, scheduled):
+        self.game_id = game_id
+        self.day = day
+        self.matchup = matchup
+        self.status = status
+        self.scheduled = scheduled
+        self.started_at = None
+        self.finished_at = None
+
+    def next_refresh(self, now, last_refresh):
+        """Return when this game next needs a schedule refresh, or None once it is final."""
+        if self.status in FINISHED_STATUSES:
+            return None
+        if self.status in LIVE_STATUSES:
+            expected_end = (self.started_at or self.scheduled or now) + EXPECTED_GAME_LENGTH - END_LEAD
+            if now >= expected_end:
+                return last_refresh + AROUND_EVENT_REFRESH
+            return min(last_refresh + MID_GAME_REFRESH, expected_end)
+        if self.scheduled is None or self.status in DELAYED_STATUSES:
+            return last_refresh + MID_GAME_REFRESH
+        if now >= self.scheduled + START_GRACE:
+            return last_refresh + MID_GAME_REFRESH
+        if now >= self.scheduled - START_LEAD:
+            return last_refresh + AROUND_EVENT_REFRESH
+        return self.scheduled - START_LEAD
+
+
+class ScheduleTracker:
+    """
+      Schedule lifecycle across days: which days to fetch, when, and which games are live.
+
+      The schedule day follows the local date, so a process left running rolls over to the
+      new day's schedule by itself; the previous day stays tracked after midnight only while
+      one of its games is still being played. Each day's games are cached, so a 304 on a
+      day's schedule keeps its state. Refreshes are only due around scheduled starts and
+      expected ends (see ScheduledGame.next_refresh), at rollover, and until a day's
+      schedule has been fetched once.
+
+      Games that finish, and the games of days that are no longer tracked, are queued for
+      eviction so callers can drop their per-game state (validators, metric series, read
+      positions, umpire accuracy) and memory stays bounded however long the process runs.
+
+      Attributes:
+          fixed_day (datetime.date or None): Day to track forever instead of the local date (replay).
+          games (dict): Game id -> ScheduledGame of every tracked game.
+          last_refresh (datetime or None): When the schedule was last refreshed (UTC).
+      """
+
+    def __init__(self, fixed_day=None):
+        self.fixed_day = fixed_day
+        self.games = {}
+        self.last_refresh = None
+        self._fetched_days = set()
+        self._evicted = []
+        self._dropped_days = []
+        self._lock = threading.Lock()
+
+    def current_day(self, now=None):
+        """Return the schedule day to show: the fixed day, or the local date."""
+        if self.fixed_day is not None:
+            return self.fixed_day
+        return (now or datetime.now(timezone.utc)).astimezone().date()
+
+    def days_to_fetch(self, now=None):
+        """
+        Return the days whose schedule a refresh fetches, oldest first: the previous day while
+        one of its games is still on, then the current day. Days no longer needed are dropped.
+        """
+        today = self.current_day(now)
+        yesterday = today - timedelta(days=1)
+        with self._lock:
+            on_yesterday = any(game.day == yesterday and game.status in LIVE_STATUSES + DELAYED_STATUSES
+                               for game in self.games.values())
+            days = [yesterday, today] if on_yesterday else [today]
+            for game_id, game in list(self.games.items()):
+                if game.day not in days:
+                    self._evict(game_id)
+            for day in self._fetched_days - set(days):
+                self._fetched_days.discard(day)
+                self._dropped_days.append(day)
+        return days
+
+    def update(self, day, schedule_games, all_teams, now=None):
+        """
+        Apply one day's schedule.json games.
+
+        Args:
+            day (datetime.date): Day the schedule belongs to.
+            schedule_games (list): The response's 'games'.
+            all_teams (dict): Team id -> team name.
+            now (datetime, optional): Current UTC time.
+
+        Returns:
+            list: (game_id, old_status, new_status) of every status change; old_status is None
+            for games seen for the first time.
+        """
+        now = now or datetime.now(timezone.utc)
+        transitions = []
+        with self._lock:
+            self._fetched_days.add(day)
+            for entry in schedule_games:
+                game_id = entry.get('id')
+                status = entry.get('status', 'scheduled')
+                game = self.games.get(game_id)
+                if game is None:
+                    if status in FINISHED_STATUSES:
+                        continue  # Already over when first seen: nothing to track or show.
+                    home_team = team_name(all_teams, (entry.get('home_team') or '').strip(), entry.get('home'))
+                    away_team = team_name(all_teams, (entry.get('away_team') or '').strip(), entry.get('away'))
+                    game = self.games[game_id] = ScheduledGame(game_id, day, f"{away_team} vs(@) {home_team}",
+                                                               status, _parse_time(entry.get('scheduled')))
+                    transitions.append((game_id, None, status))
+                elif game.status != status:
+                    transitions.append((game_id, game.status, status))
+                    game.status = status
+                else:
+                    continue
+                if status in LIVE_STATUSES and game.started_at is None:
+                    game.started_at = now
+                if status in FINISHED_STATUSES:
+                    game.finished_at = now
+                    self._evict(game_id)
+        return transitions
+
+    def mark_refreshed(self, now=None):
+        """Record a completed refresh of every day in `days_to_fetch`."""
+        with self._lock:
+            self.last_refresh = now or datetime.now(timezone.utc)
+
+    def next_refresh(self, now=None):
+        """Return when the schedule should next be refreshed (UTC), or None if never again."""
+        now = now or datetime.now(timezone.utc)
+        with self._lock:
+            if self.last_refresh is None or self.current_day(now) not in self._fetched_days:
+                return now
+            times = [game.next_refresh(now, self.last_refresh) for game in self.games.values()]
+        times = [time for time in times if time is not None]
+        if times:
+            return min(times)
+        if self.fixed_day is not None:
+            return None
+        # Nothing left today: wake up for the next day's schedule.
+        local_now = now.astimezone()
+        return datetime.combine(local_now.date() + timedelta(days=1), datetime.min.time(), local_now.tzinfo)
+
+    def refresh_due(self, now=None):
+        """Return True when the schedule should be refreshed this cycle."""
+        now = now or datetime.now(timezone.utc)
+        next_refresh = self.next_refresh(now)
+        return next_refresh is not None and now >= next_refresh
+
+    def live_games(self):
+        """Return {matchup: game_id} of the games being played, in scheduled order."""
+        with self._lock:
+            live = [game for game in self.games.values() if game.status in LIVE_STATUSES]
+        live.sort(key=lambda game: (game.scheduled is None, game.scheduled or datetime.min, game.matchup))
+        return {game.matchup: game.game_id for game in live}
+
+    def pop_evicted(self):
+        """
+        Returns:
+            tuple: (game ids, days) evicted since the last call; callers drop their state for them.
+        """
+        with self._lock:
+            evicted, self._evicted = self._evicted, []
+            dropped, self._dropped_days = self._dropped_days, []
+        return evicted, dropped
+
+    def _evict(self, game_id):
+        self.games.pop(game_id, None)
+        self._evicted.append(game_id)
@@ -0,0 +1,253 @@
+import atexit
+import calendar
+import json
+import os
+import sys
+import threading
+import time
+from contextlib import contextmanager
+from datetime import datetime
+
+try:
+    import fcntl  # POSIX
+except ImportError:
+    fcntl = None
+try:
+    import msvcrt  # Windows
+except ImportError:
+    msvcrt = None
+
+# Monthly call quota for each access level. None means no monthly cap.
+ACCESS_LEVEL_MONTHLY_QUOTA = {
+    "trial": 1000,
+    "production": None,
+}
+
+# Poll intervals (ms) by game state.
+MID_AT_BAT_MS = 10000
+DEFAULT_POLL_MS = 20000
+BETWEEN_HALVES_MS = 45000
+NO_EVENTS_MS = 60000
+QUOTA_EXHAUSTED_MS = 600000
+
+# Exponential backoff on 429 / 5xx / network errors: DEFAULT_POLL_MS * 2**failures, capped.
+MAX_BACKOFF_MS = 300000
+
+# Once today's share of the remaining monthly quota is used up, intervals are stretched by this factor.
+OVER_DAILY_BUDGET_FACTOR = 4
+
+QUOTA_FILE_PATH = os.path.join(os.path.expanduser("~"), ".mlb_strikezone_quota.json")
+
+# The call count is saved every SAVE_EVERY_CALLS calls or SAVE_INTERVAL_SECONDS, whichever
+# comes first, and at exit, rather than on every request.
+SAVE_EVERY_CALLS = 20
+SAVE_INTERVAL_SECONDS = 5
+
+
+def _empty_usage(month):
+    return {"month": month, "calls": 0, "days": {}}
+
+
+def _add_usage(usage, extra):
+    # Counts in `extra` for another month than `usage` are dropped: the quota is monthly.
+    if extra["month"] == usage["month"]:
+        usage["calls"] += extra["calls"]
+        for day, calls in extra["days"].items():
+            usage["days"][day] = usage["days"].get(day, 0) + calls
+    return usage
+
+
+@contextmanager
+def _file_lock(path):
+    # Serializes quota file updates across processes (the window, --headless, shard workers).
+    with open(f"{path}.lock", 'a+') as handle:
+        if fcntl is not None:
+            fcntl.flock(handle, fcntl.LOCK_EX)
+        elif msvcrt is not None:
+            handle.seek(0)
+            msvcrt.locking(handle.fileno(), msvcrt.LK_LOCK, 1)
+        try:
+            yield
+        finally:
+            if fcntl is not None:
+                fcntl.flock(handle, fcntl.LOCK_UN)
+            elif msvcrt is not None:
+                handle.seek(0)
+                msvcrt.locking(handle.fileno(), msvcrt.LK_UNLCK, 1)
+
+
+class PollScheduler:
+    """
+      Quota-aware poll scheduler that replaces the fixed 20 second refresh. Request
+      rate (QPS) is enforced separately by the session's RateLimiter.
+
+      It counts every request made through the shared Sportradar_Session (persisted per
+      month so the count survives restarts, and shared by every process using the same
+      quota file: each adds its own new calls to the file and reads back the total), adapts the next poll interval to the state of
+      the displayed game, backs off exponentially on 429/5xx/network errors, and slows down
+      once the day's share of the remaining monthly quota has been spent.
+
+      Attributes:
+          access_level (str): API access level the limits are taken from.
+          monthly_quota (int or None): Calls allowed per month, None if uncapped.
+          consecutive_failures (int): Failed requests since the last success.
+          quota_file (str or None): JSON file the monthly call count is persisted to.
+      """
+
+    def __init__(self, access_level, quota_file=QUOTA_FILE_PATH):
+        """
+        Args:
+            access_level (str): The API access level (e.g., "trial" or "production").
+            quota_file (str, optional): Where to persist the monthly call count. None disables persistence.
+        """
+        self.access_level = access_level
+        self.monthly_quota = ACCESS_LEVEL_MONTHLY_QUOTA.get(access_level, ACCESS_LEVEL_MONTHLY_QUOTA["trial"])
+        self.quota_file = quota_file
+        self.consecutive_failures = 0
+        self._lock = threading.Lock()
+        self._save_lock = threading.Lock()
+        self._usage = self._load_usage()
+        self._unsaved = _empty_usage(self._usage["month"])
+        self._saved_at = time.monotonic()
+        if quota_file:
+            atexit.register(self.flush)
+
+    def _read_stored(self):
+        if not os.path.exists(self.quota_file):
+            return {}
+        with open(self.quota_file, 'r') as file:
+            return json.load(file)
+
+    def _load_usage(self):
+        usage = _empty_usage(datetime.now().strftime("%Y-%m"))
+        if self.quota_file:
+            try:
+                stored = self._read_stored().get(self.access_level, {})
+                if stored.get("month") == usage["month"]:
+                    usage.update(stored)
+            except (OSError, ValueError):
+                pass
+        return usage
+
+    def flush(self):
+        """
+        Add the calls made since the last save to the quota file, and take the file's total
+        (which includes other processes' calls) as this scheduler's count.
+        """
+        if not self.quota_file:
+            return
+        with self._save_lock:
+            with self._lock:
+                unsaved, self._unsaved = self._unsaved, _empty_usage(self._usage["month"])
+                self._saved_at = time.monotonic()
+            try:
+                with _file_lock(self.quota_file):
+                    try:
+                        stored = self._read_stored()
+                    except ValueError:
+                        stored = {}  # Unreadable (e.g. written by an older version): start over.
+                    usage = stored.get(self.access_level, {})
+                    if usage.get("month", "") < unsaved["month"]:
+                        usage = _empty_usage(unsaved["month"])
+                    if unsaved["calls"]:
+                        stored[self.access_level] = _add_usage(usage, unsaved)
+                        # Written then renamed, so a crash never leaves a truncated file.
+                        temp_path = f"{self.quota_file}.{os.getpid()}.tmp"
+                        with open(temp_path, 'w') as file:
+                            json.dump(stored, file)
+                        os.replace(temp_path, self.quota_file)
+            except OSError as e:
+                print("Could not save API quota usage:", e, file=sys.stderr)
+                with self._lock:
+                    _add_usage(self._unsaved, unsaved)
+                return
+            with self._lock:
+                if usage["month"] == self._usage["month"]:
+                    self._usage = _add_usage(usage, self._unsaved)
+
+    def _save_due(self):
+        with self._lock:
+            return self._unsaved["calls"] >= SAVE_EVERY_CALLS or (
+                    self._unsaved["calls"] and time.monotonic() - self._saved_at >= SAVE_INTERVAL_SECONDS)
+
+    def record_request(self, url, status_code):
+        """
+        Sportradar_Session request hook: count the call and track failures for backoff.
+
+        Args:
+            url (str): Requested URL (unused, part of the hook signature).
+            status_code (int or None): HTTP status, or None if the request raised.
+        """
+        now = datetime.now()
+        with self._lock:
+            month = now.strftime("%Y-%m")
+            if self._usage["month"] != month:
+                self._usage = _empty_usage(month)
+                self._unsaved = _empty_usage(month)
+            today = now.strftime("%d")
+            for usage in (self._usage, self._unsaved):
+                usage["calls"] += 1
+                usage["days"][today] = usage["days"].get(today, 0) + 1
+
+            if status_code is None or status_code == 429 or status_code >= 500:
+                self.consecutive_failures += 1
+            else:
+                self.consecutive_failures = 0
+        if self._save_due():
+            self.flush()
+
+    def remaining_budget(self):
+        """
+        Returns:
+            int or None: Calls left this month, or None for access levels without a monthly cap.
+        """
+        if self.monthly_quota is None:
+            return None
+        if self.quota_file and time.monotonic() - self._saved_at >= SAVE_INTERVAL_SECONDS:
+            self.flush()  # Also picks up the calls other processes made meanwhile.
+        with self._lock:
+            return max(0, self.monthly_quota - self._usage["calls"])
+
+    def _over_daily_budget(self):
+        if self.monthly_quota is None:
+            return False
+        now = datetime.now()
+        days_in_month = calendar.monthrange(now.year, now.month)[1]
+        days_left = days_in_month - now.day + 1
+        with self._lock:
+            used_today = self._usage["days"].get(now.strftime("%d"), 0)
+            remaining_at_start_of_today = self.monthly_quota - self._usage["calls"] + used_today
+        return used_today >= remaining_at_start_of_today / days_left
+
+    def next_interval_ms(self, pitch_summary):
+        """
+        Pick the delay before the next poll.
+
+        Args:
+            pitch_summary (dict or None): Latest summary of the displayed game, if any.
+
+        Returns:
+            int: Milliseconds until the next poll.
+        """
+        if self.remaining_budget() == 0:
+            return QUOTA_EXHAUSTED_MS
+        if self.consecutive_failures:
+            return min(DEFAULT_POLL_MS * 2 ** self.consecutive_failures, MAX_BACKOFF_MS)
+
+        interval = self._interval_for_state(pitch_summary)
+        if self._over_daily_budget():
+            interval *= OVER_DAILY_BUDGET_FACTOR
+        return interval
+
+    @staticmethod
+    def _interval_for_state(pitch_summary):
+        if pitch_summary is None:
+            return DEFAULT_POLL_MS
+        if pitch_summary.get('pitch_zone') == -1 and not pitch_summary.get('hitter'):
+            # "No events yet ...", "Inning coming up." or no innings at all.
+            return NO_EVENTS_MS
+        if str(pitch_summary.get('outs')) == '3':
+            return BETWEEN_HALVES_MS
+        if pitch_summary.get('balls') != '' or pitch_summary.get('strikes') != '':
+            return MID_AT_BAT_MS
+        return DEFAULT_POLL_MS
@@ -0,0 +1,475 @@
+"""Sharded polling for very large slates (MiLB, WBC, NPB: a hundred games or more)."""
+import math
+import multiprocessing
+import queue
+import sys
+import time
+from multiprocessing import shared_memory
+
+import numpy as np
+
+from mlb_strikezone_app.fetch_worker import ResultsThread
+from mlb_strikezone_app.http_client import ACCESS_LEVEL_QPS
+from mlb_strikezone_app.metrics import shared_metrics
+from mlb_strikezone_app.mlb_api import Pitch_Stream, SPORTRADAR_BASE_URL, load_teams
+from mlb_strikezone_app.replay import build_replay
+from mlb_strikezone_app.scheduler import PollScheduler
+
+DEFAULT_SHARDS = 4
+DEFAULT_CAPACITY = 256
+
+# How often readers scan the table and workers re-check their rows (seconds).
+SCAN_SECONDS = 0.25
+
+ASSIGNMENT_DTYPE = np.dtype([
+    ("seq", "<u4"),
+    ("generation", "<u4"),  # Bumped on every (re)assignment so stale pitches of a reused row are ignored.
+    ("game_id", "S40"),     # Empty when the row is free.
+], align=True)
+
+# Count fields and scores are small ints; the summaries also carry '' and 'N/A' there.
+EMPTY = -1
+NOT_AVAILABLE = -2
+
+PITCH_DTYPE = np.dtype([
+    ("seq", "<u4"),
+    ("generation", "<u4"),  # Assignment generation the pitch was fetched for.
+    ("version", "<u4"),     # Bumped on every write; readers compare it to spot new pitches.
+    ("updated_at", "<f8"),
+    ("inning", "<i2"),      # EMPTY when the summary carries a message ("Inning coming up.") instead.
+    ("inning_text", "S64"),
+    ("half", "S8"),
+    ("home_score", "<i2"),
+    ("away_score", "<i2"),
+    ("balls", "i1"),
+    ("strikes", "i1"),
+    ("outs", "i1"),
+    ("runners_on", "i1"),
+    ("zone", "i1"),
+    ("speed", "<f8"),       # NaN when unknown.
+    ("x", "<f8"),
+    ("y", "<f8"),
+    ("umpire_correct", "<u2"),
+    ("umpire_called", "<u2"),
+    ("ball_strike_or_foul", "S8"),
+    ("pitch_type", "S32"),
+    ("pitch_outcome", "S48"),
+    ("hitter", "S48"),
+    ("pitcher", "S48"),
+    ("description", "S192"),  # Longer play descriptions are cut.
+], align=True)
+
+
+def _small(value):
+    if isinstance(value, int):
+        return value
+    if isinstance(value, str) and value.isdigit():
+        return int(value)
+    return EMPTY if value == '' else NOT_AVAILABLE
+
+
+def _from_small(value):
+    value = int(value)
+    if value == EMPTY:
+        return ''
+    return 'N/A' if value == NOT_AVAILABLE else value
+
+
+def _text(value, size):
+    # Cut on a character boundary so the stored bytes always decode.
+    return str(value).encode('utf-8')[:size].decode('utf-8', 'ignore').encode('utf-8')
+
+
+def _from_text(value):
+    return bytes(value).decode('utf-8', 'ignore')
+
+
+def _number(value):
+    value = float(value)
+    return int(value) if value.is_integer() else value
+
+
+def summary_record(pitch_summary, generation, version):
+    """Pack a pitch summary into a PITCH_DTYPE tuple (its seq left at 0)."""
+    inning = pitch_summary.get('inning_number')
+    speed = pitch_summary.get('pitch_speed')
+    return (0, generation, version, time.time(),
+            inning if isinstance(inning, int) else EMPTY, _text('' if isinstance(inning, int) else inning, 64),
+            _text(pitch_summary.get('inning_half', ''), 8),
+            _small(pitch_summary.get('home_team_score')), _small(pitch_summary.get('away_team_score')),
+            _small(pitch_summary.get('balls')), _small(pitch_summary.get('strikes')),
+            _small(pitch_summary.get('outs')), pitch_summary.get('runners_on', 0), pitch_summary.get('pitch_zone', -1),
+            speed if isinstance(speed, (int, float)) else math.nan,
+            pitch_summary.get('pitch_x', 0), pitch_summary.get('pitch_y', 0),
+            pitch_summary.get('umpire_correct', 0), pitch_summary.get('umpire_called', 0),
+            _text(pitch_summary.get('ball_strike_or_foul', ''), 8), _text(pitch_summary.get('pitch_type', ''), 32),
+            _text(pitch_summary.get('pitch_outcome', ''), 48), _text(pitch_summary.get('hitter', ''), 48),
+            _text(pitch_summary.get('pitcher', ''), 48), _text(pitch_summary.get('description', ''), 192))
+
+
+def record_summary(record):
+    """Unpack a PITCH_DTYPE record into the pitch summary dict the window and headless writer use."""
+    speed = float(record['speed'])
+    return {
+        "inning_number": int(record['inning']) if record['inning'] != EMPTY else _from_text(record['inning_text']),
+        "inning_half": _from_text(record['half']),
+        "home_team_score": _from_small(record['home_score']),
+        "away_team_score": _from_small(record['away_score']),
+        "hitter": _from_text(record['hitter']),
+        "pitcher": _from_text(record['pitcher']),
+        "balls": _from_small(record['balls']),
+        "strikes": _from_small(record['strikes']),
+        "outs": _from_small(record['outs']),
+        "runners_on": int(record['runners_on']),
+        "ball_strike_or_foul": _from_text(record['ball_strike_or_foul']),
+        "pitch_type": _from_text(record['pitch_type']),
+        "pitch_speed": '' if math.isnan(speed) else _number(speed),
+        "pitch_zone": int(record['zone']),
+        "pitch_x": _number(record['x']),
+        "pitch_y": _number(record['y']),
+        "pitch_outcome": _from_text(record['pitch_outcome']),
+        "description": _from_text(record['description']),
+        "umpire_correct": int(record['umpire_correct']),
+        "umpire_called": int(record['umpire_called']),
+    }
+
+
+class PitchTable:
+    """
+      The shared-memory assignment and latest-pitch tables: one block holding `capacity`
+      ASSIGNMENT_DTYPE rows (written by the coordinator) followed by `capacity` PITCH_DTYPE
+      rows (each written by its row's worker).
+
+      Every record starts with a seqlock counter owned by its single writer, odd while the
+      record is being written. Readers copy the record and retry if the counter was odd or
+      moved meanwhile, so they never see a half-written record and never block the writer.
+
+      Attributes:
+          capacity (int): Rows, i.e. games that can be tracked at once.
+          assignments (numpy.ndarray): ASSIGNMENT_DTYPE rows, a view into the shared block.
+          pitches (numpy.ndarray): PITCH_DTYPE rows, a view into the shared block.
+          name (str): Shared memory block name workers attach to.
+      """
+
+    def __init__(self, capacity=DEFAULT_CAPACITY, name=None):
+        """
+        Args:
+            capacity (int): Number of rows.
+            name (str, optional): Attach to this existing block instead of creating one.
+        """
+        self.capacity = capacity
+        size = capacity * (ASSIGNMENT_DTYPE.itemsize + PITCH_DTYPE.itemsize)
+        if name is None:
+            self.shm = shared_memory.SharedMemory(create=True, size=size)
+            self.shm.buf[:size] = bytes(size)
+        else:
+            # Spawned workers share the creator's resource tracker, so attaching adds no second owner:
+            # the block is unlinked once, by the coordinator.
+            self.shm = shared_memory.SharedMemory(name=name)
+        self.name = self.shm.name
+        self.assignments = np.ndarray((capacity,), dtype=ASSIGNMENT_DTYPE, buffer=self.shm.buf)
+        self.pitches = np.ndarray((capacity,), dtype=PITCH_DTYPE, buffer=self.shm.buf,
+                                  offset=capacity * ASSIGNMENT_DTYPE.itemsize)
+
+    @staticmethod
+    def _write(table, row, values):
+        seqs = table['seq']
+        seq = int(seqs[row])
+        seqs[row] = seq + 1  # Odd before any body byte changes: readers retry until it is even again.
+        record = np.array([values], dtype=table.dtype).view(np.uint8)
+        body = seqs.itemsize  # The body is everything after the leading seq.
+        table.view(np.uint8).reshape(len(table), -1)[row, body:] = record[body:]
+        seqs[row] = seq + 2
+
+    @staticmethod
+    def _read(table, row):
+        seqs = table['seq']
+        while True:
+            before = int(seqs[row])
+            if not before & 1:
+                record = table[row:row + 1].copy()[0]
+                if int(seqs[row]) == before:
+                    return record
+            time.sleep(0)
+
+    def assign(self, row, generation, game_id):
+        """Point a row at a game (or free it with game_id ''). Coordinator only."""
+        self._write(self.assignments, row, (0, generation, (game_id or '').encode('ascii')))
+
+    def assignment(self, row):
+        """Return (generation, game_id or None) of a row."""
+        record = self._read(self.assignments, row)
+        game_id = bytes(record['game_id']).decode('ascii')
+        return int(record['generation']), game_id or None
+
+    def write_pitch(self, row, generation, pitch_summary):
+        """Store a row's latest pitch summary. The row's worker only."""
+        version = int(self.pitches['version'][row]) + 1
+        self._write(self.pitches, row, summary_record(pitch_summary, generation, version))
+
+    def read_pitch(self, row):
+        """Return a consistent copy of a row's PITCH_DTYPE record."""
+        return self._read(self.pitches, row)
+
+    def close(self):
+        # Drop the numpy views first: the block cannot be closed while they export its buffer.
+        self.assignments = self.pitches = None
+        self.shm.close()
+
+
+def shard_qps(access_level, shards):
+    """
+    Return the request rate of each shard worker and of the coordinator: the account QPS split
+    evenly between them, the coordinator's schedule and replay fetches counting as one more.
+    """
+    return ACCESS_LEVEL_QPS.get(access_level, ACCESS_LEVEL_QPS["trial"]) / (shards + 1)
+
+
+def _shard_main(table_name, capacity, shard, shards, api_key, access_level, base_url, stop):
+    # Entry point of one worker process. Polls the games of its rows, each on its own PollScheduler interval.
+    table = PitchTable(capacity, name=table_name)
+    stream = Pitch_Stream(api_key, access_level, base_url=base_url)
+    stream.http.rate_limiter.set_rate(shard_qps(access_level, shards))
+    # Counted in the same quota file as the coordinator's calls, so the window's calls left and
+    # every process's budget-based intervals include the shards' traffic.
+    scheduler = PollScheduler(access_level)
+    stream.http.request_hooks.append(scheduler.record_request)
+    owned = {}      # row -> (generation, game_id)
+    next_poll = {}  # row -> time.monotonic() of its next poll
+    latest = {}     # row -> latest pitch summary, for the poll interval
+    try:
+        while not stop.is_set():
+            for row in range(shard, capacity, shards):
+                assignment = table.assignment(row)
+                if owned.get(row, (0, None)) == assignment:
+                    continue
+                if row in owned:
+                    stream.evict_game(owned.pop(row)[1])
+                    next_poll.pop(row, None)
+                    latest.pop(row, None)
+                if assignment[1] is not None:
+                    owned[row] = assignment
+                    next_poll[row] = 0
+
+            for row, (generation, game_id) in owned.items():
+                if time.monotonic() < next_poll[row]:
+                    continue
+                try:
+                    summaries = stream.stream_new_pitches(game_id, conditional=True)
+                    if summaries:
+                        latest[row] = summaries[-1]
+                        table.write_pitch(row, generation, summaries[-1])
+                except Exception as e:
+                    print(f"Shard {shard}: error polling {game_id} ({type(e).__name__}):", e, file=sys.stderr)
+                next_poll[row] = time.monotonic() + scheduler.next_interval_ms(latest.get(row)) / 1000
+            stop.wait(SCAN_SECONDS)
+    except KeyboardInterrupt:
+        pass
+    finally:
+        scheduler.flush()  # Worker processes skip atexit handlers.
+        table.close()
+
+
+class ShardedPoller:
+    """
+      Coordinator of the shard processes: owns the table, hands rows to live games and reads
+      back the pitches that changed. The schedule itself is fetched once, by `api`. Worker
+      `shard` polls the rows with `row % shards == shard` and writes their latest pitch into
+      the table, so results never cross a pipe or get pickled.
+
+      Attributes:
+          api (MLB_API_Calls): Fetches the schedule; its live_games_dict decides the assignments.
+          shards (int): Worker processes.
+          table (PitchTable): Shared tables.
+          rows (dict): Game id -> row.
+      """
+
+    def __init__(self, api, shards=DEFAULT_SHARDS, capacity=DEFAULT_CAPACITY):
+        """
+        Args:
+            api (MLB_API_Calls): Schedule source, e.g. the window itself.
+            shards (int): Number of worker processes.
+            capacity (int): Games that can be tracked at once.
+        """
+        self.api = api
+        self.shards = max(1, shards)
+        api.http.rate_limiter.set_rate(shard_qps(api.access_level, self.shards))
+        self.table = PitchTable(capacity)
+        self.rows = {}
+        self._generations = [0] * capacity
+        self._seen = np.zeros(capacity, dtype=[("generation", "<u4"), ("version", "<u4")])
+        context = multiprocessing.get_context("spawn")
+        self._stop = context.Event()
+        self._processes = [context.Process(target=_shard_main, name=f"strikezone-shard-{shard}", daemon=True,
+                                           args=(self.table.name, capacity, shard, self.shards, api.api_key,
+                                                 api.access_level, api.base_url, self._stop))
+                           for shard in range(self.shards)]
+
+    def start(self):
+        for process in self._processes:
+            process.start()
+
+    def sync_games(self, game_ids=None):
+        """
+        Give every live game of `api.live_games_dict` a row and free the rows of games that left it.
+
+        Args:
+            game_ids (iterable, optional): Only track these game ids.
+        """
+        wanted = [game_id for game_id in self.api.live_games_dict.values()
+                  if game_ids is None or game_id in game_ids]
+        wanted_set = set(wanted)
+        for game_id in [game_id for game_id in self.rows if game_id not in wanted_set]:
+            row = self.rows.pop(game_id)
+            self._generations[row] += 1
+            self.table.assign(row, self._generations[row], '')
+        free = iter(sorted(set(range(self.table.capacity)) - set(self.rows.values())))
+        for game_id in wanted:
+            if game_id in self.rows:
+                continue
+            row = next(free, None)
+            if row is None:
+                print(f"More than {self.table.capacity} live games; {game_id} is not tracked.", file=sys.stderr)
+                continue
+            self.rows[game_id] = row
+            self._generations[row] += 1
+            self.table.assign(row, self._generations[row], game_id)
+
+    def changed(self):
+        """
+        Returns:
+            list: (game_id, pitch_summary) of every game whose latest pitch changed since the last call.
+        """
+        pitches = self.table.pitches
+        current = np.empty_like(self._seen)
+        current['generation'] = pitches['generation']
+        current['version'] = pitches['version']
+        changed = []
+        rows = {row: game_id for game_id, row in self.rows.items()}
+        for row in np.flatnonzero(current != self._seen):
+            game_id = rows.get(int(row))
+            record = self.table.read_pitch(int(row))
+            self._seen[row] = (record['generation'], record['version'])
+            # Skip pitches a worker wrote for the row's previous game.
+            if game_id is not None and record['generation'] == self._generations[row] and record['version']:
+                changed.append((game_id, record_summary(record)))
+        return changed
+
+    def stop(self):
+        """Stop the workers and free the shared memory."""
+        self._stop.set()
+        for process in self._processes:
+            process.join(timeout=5)
+            if process.is_alive():
+                process.terminate()
+        self.table.close()
+        self.table.shm.unlink()
+
+
+class ShardedFetchWorker(ResultsThread):
+    """
+      Stand-in for FetchWorker when the window runs with `--shards`: it refreshes the schedule,
+      assigns the games to the shard processes and turns changed table rows into the same
+      ("games", ...) / ("pitches", ...) results, so rendering is unchanged.
+
+      Attributes:
+          app (StrikeZone_Updates): The window; also fetches the schedule.
+          poller (ShardedPoller): The shard processes and their table.
+          prefetch_all (bool): Always True; every game is polled.
+          jobs (queue.Queue): Schedule refresh and replay requests. `None` stops the thread.
+          results (queue.Queue): Finished results for the UI thread.
+      """
+
+    prefetch_all = True
+
+    def __init__(self, app, shards=DEFAULT_SHARDS):
+        super().__init__("strikezone-sharded")
+        self.app = app
+        self.poller = ShardedPoller(app, shards)
+        self.jobs = queue.Queue()
+
+    def push_connected(self):
+        return False
+
+    def submit_poll(self, selected_game, refresh_schedule=True):
+        """Queue a schedule refresh when due; pitches arrive from the shards on their own."""
+        if refresh_schedule:
+            self.jobs.put(("poll", selected_game))
+
+    def submit_pitch(self, game_id):
+        """Nothing to do: every game's latest pitch is already read from the table."""
+
+    def submit_replay(self, game_id):
+        """Queue a full fetch of a game's play-by-play, indexed for replay."""
+        self.jobs.put(("replay", game_id))
+
+    def stop(self):
+        self.jobs.put(None)
+
+    def run(self):
+        self.poller.start()
+        try:
+            while True:
+                try:
+                    job = self.jobs.get(timeout=SCAN_SECONDS)
+                except queue.Empty:
+                    job = ("scan", None)
+                if job is None:
+                    return
+                try:
+                    kind, arg = job
+                    if kind == "poll":
+                        self.app.get_live_games(load_teams())
+                        self.poller.sync_games()
+                        games = list(self.app.live_games_dict.values())
+                        self.results.put(("games", self.app.live_games_dict.get(arg, games[0] if games else None)))
+                    elif kind == "replay":
+                        self.results.put(("replay", arg, build_replay(self.app, arg)))
+                    for game_id, pitch_summary in self.poller.changed():
+                        self.results.put(("pitches", game_id, [pitch_summary]))
+                except Exception as e:
+                    self.results.put(("error", e))
+        finally:
+            self.poller.stop()
+
+
+def run_sharded(api_key, access_level, shards=DEFAULT_SHARDS, output_path=None, game_ids=None, schedule_date=None,
+                base_url=SPORTRADAR_BASE_URL, alert_rules=()):
+    """
+    Headless JSON lines from a sharded poller, until interrupted.
+
+    Args:
+        api_key (str): The user's Sportradar API key.
+        access_level (str): The API access level (e.g., "trial" or "production").
+        shards (int): Worker processes.
+        output_path (str, optional): File to append JSON lines to. Defaults to stdout.
+        game_ids (iterable, optional): Restrict polling to these game ids.
+        schedule_date (datetime.date, optional): Day whose schedule is polled. Defaults to today.
+        base_url (str, optional): Root of the MLB API. Defaults to Sportradar.
+        alert_rules (iterable): Alert rule texts (see alerts.py).
+    """
+    from mlb_strikezone_app.headless import Headless_Pitch_Stream
+    output = open(output_path, 'a') if output_path else sys.stdout
+    writer = Headless_Pitch_Stream(api_key, access_level, output, game_ids, schedule_date, base_url,
+                                   alert_rules=alert_rules)
+    poller = ShardedPoller(writer, shards)
+    poller.start()
+    try:
+        while True:
+            try:
+                if writer.schedule.refresh_due():
+                    writer.get_live_games(load_teams())
+                    poller.sync_games(writer.game_ids)
+                matchups = {game_id: matchup for matchup, game_id in writer.live_games_dict.items()}
+                for game_id, pitch_summary in poller.changed():
+                    writer.emit(game_id, matchups.get(game_id), pitch_summary)
+            except Exception as e:
+                shared_metrics().increment("errors", kind="poll", error=type(e).__name__)
+                print(f"Error updating live data ({type(e).__name__}):", e, file=sys.stderr)
+            time.sleep(SCAN_SECONDS)
+    except KeyboardInterrupt:
+        pass
+    finally:
+        poller.stop()
+        if output is not sys.stdout:
+            output.close()
@@ -0,0 +1,278 @@
+"""Local stand-in for the Sportradar MLB endpoints and push feed, serving simulated live games."""
+import argparse
+import json
+import random
+import sys
+import threading
+import time
+from datetime import datetime, timezone
+from http.server import ThreadingHTTPServer, BaseHTTPRequestHandler
+
+from mlb_strikezone_app.mlb_api import load_teams
+from mlb_strikezone_app.synthetic import build_game
+
+# A real game throws roughly one pitch every 20 seconds; --speed multiplies that clock.
+REAL_SECONDS_PER_PITCH = 20
+
+# The push feed checks for new pitches this often and sends a heartbeat line after this much silence.
+PUSH_TICK_SECONDS = 0.1
+PUSH_HEARTBEAT_SECONDS = 5
+
+
+def pitch_positions(game):
+    """Return (inning, half, event, pitch) indexes of every pitch of a game, in order."""
+    positions = []
+    for inning_index, inning in enumerate(game['innings']):
+        for half_index, half in enumerate(inning.get('halfs', [])):
+            for event_index, event in enumerate(half.get('events', [])):
+                at_bat = event.get('at_bat')
+                if not at_bat:
+                    continue
+                for pitch_index, pitch in enumerate(at_bat.get('events', [])):
+                    if pitch.get('type', 'pitch') == 'pitch':
+                        positions.append((inning_index, half_index, event_index, pitch_index))
+    return positions
+
+
+def game_until(game, position, status):
+    """Return a copy of `game` cut just after the pitch at `position`, sharing the untouched parts."""
+    inning_index, half_index, event_index, pitch_index = position
+    inning = game['innings'][inning_index]
+    half = inning['halfs'][half_index]
+    event = half['events'][event_index]
+    at_bat = dict(event['at_bat'], events=event['at_bat']['events'][:pitch_index + 1])
+    half = dict(half, events=half['events'][:event_index] + [dict(event, at_bat=at_bat)])
+    inning = dict(inning, halfs=inning['halfs'][:half_index] + [half])
+    return dict(game, status=status, innings=game['innings'][:inning_index] + [inning])
+
+
+class SimulatedGame:
+    """
+      One synthetic game revealed pitch by pitch on the simulator clock.
+
+      Attributes:
+          game (dict): The complete game as built by `build_game`.
+          positions (list): Index path of every pitch, in order.
+          home_team (str): Team id.
+          away_team (str): Team id.
+      """
+
+    def __init__(self, game, home_team, away_team):
+        self.game = dict(game, home_team=home_team, away_team=away_team)
+        self.home_team = home_team
+        self.away_team = away_team
+        self.positions = pitch_positions(game)
+        self._body_cache = (None, None)
+
+    def status(self, pitches_thrown):
+        return "closed" if pitches_thrown >= len(self.positions) else "inprogress"
+
+    def pbp_body(self, pitches_thrown):
+        """Return the pbp.json bytes after `pitches_thrown` pitches, reusing the last one if unchanged."""
+        pitches_thrown = min(max(pitches_thrown, 1), len(self.positions))
+        cached_count, cached_body = self._body_cache
+        if cached_count == pitches_thrown:
+            return cached_body
+        game = game_until(self.game, self.positions[pitches_thrown - 1], self.status(pitches_thrown))
+        body = json.dumps({'game': game}, separators=(',', ':')).encode('utf-8')
+        self._body_cache = (pitches_thrown, body)
+        return body
+
+    def push_message(self, index):
+        """Return the push feed line (without newline) of the pitch at `positions[index]`."""
+        inning_index, half_index, event_index, pitch_index = self.positions[index]
+        inning = self.game['innings'][inning_index]
+        half = inning['halfs'][half_index]
+        at_bat = half['events'][event_index]['at_bat']
+        payload = {"game": {"id": self.game['id'], "status": self.status(index + 1)},
+                   "inning": inning['number'], "half": half['half'],
+                   "at_bat": dict(at_bat, events=at_bat['events'][:pitch_index + 1]),
+                   "event": at_bat['events'][pitch_index]}
+        message = {"payload": payload, "metadata": {"game_id": self.game['id'], "event_type": "pitch"}}
+        return json.dumps(message, separators=(',', ':')).encode('utf-8')
+
+
+class Simulator:
+    """
+      State of the stand-in server: the games, their clock and the faults to inject.
+
+      Attributes:
+          games (dict): Game id -> SimulatedGame.
+          pitches_per_second (float): Pitches each game throws per wall-clock second.
+          latency_ms (float): Mean added response delay; actual delays vary +-50%.
+          rate_limit_rate (float): Share of requests answered 429 Too Many Requests.
+          malformed_rate (float): Share of pbp responses and push lines sent as truncated JSON.
+          push_max_seconds (float): Push streams are closed by the server after this long; 0 keeps them open.
+      """
+
+    def __init__(self, games=15, innings=9, speed=1.0, latency_ms=0, rate_limit_rate=0.0, malformed_rate=0.0,
+                 seed=0, push_max_seconds=0):
+        team_ids = [team_id for team_id, name in load_teams().items() if not name.startswith(' ')]
+        self.games = {}
+        for index in range(games):
+            game = build_game(innings, seed=seed + index, game_id=f"sim-{seed + index:04d}")
+            home, away = team_ids[(2 * index) % len(team_ids)], team_ids[(2 * index + 1) % len(team_ids)]
+            self.games[game['id']] = SimulatedGame(game, home, away)
+        self.pitches_per_second = speed / REAL_SECONDS_PER_PITCH
+        self.latency_ms = latency_ms
+        self.rate_limit_rate = rate_limit_rate
+        self.malformed_rate = malformed_rate
+        self.push_max_seconds = push_max_seconds
+        self.started_at = time.monotonic()
+        # Every game is scheduled for, and starts at, the moment the simulator starts.
+        self.scheduled = datetime.now(timezone.utc).isoformat()
+        self._rng = random.Random(seed)
+        self._lock = threading.Lock()
+
+    def pitches_thrown(self):
+        return 1 + int((time.monotonic() - self.started_at) * self.pitches_per_second)
+
+    def chance(self, rate):
+        with self._lock:
+            return self._rng.random() < rate
+
+    def delay(self):
+        if self.latency_ms:
+            with self._lock:
+                jitter = self._rng.uniform(0.5, 1.5)
+            time.sleep(self.latency_ms * jitter / 1000)
+
+    def teams_body(self):
+        teams = []
+        for team_id, name in load_teams().items():
+            market, _, nickname = name.strip().rpartition(' ')
+            teams.append({"id": team_id, "market": market, "name": nickname})
+        return {"teams": teams}
+
+    def schedule_body(self):
+        thrown = self.pitches_thrown()
+        return {"games": [{"id": game_id, "status": game.status(thrown), "scheduled": self.scheduled,
+                           "home_team": game.home_team, "away_team": game.away_team}
+                          for game_id, game in self.games.items()]}
+
+
+class SimulatorHandler(BaseHTTPRequestHandler):
+    """Routes /mlb/{level}/v8/en/... requests to the Simulator in `server.simulator`."""
+
+    protocol_version = "HTTP/1.1"
+
+    def do_GET(self):
+        simulator = self.server.simulator
+        simulator.delay()
+        if simulator.chance(simulator.rate_limit_rate):
+            self._send(429, b'{"message": "Too Many Requests"}', {"Retry-After": "1"})
+            return
+
+        path = self.path.split('?')[0].strip('/').split('/')
+        if path[-1] == 'subscribe':
+            self._stream_pitches()
+        elif path[-1] == 'teams.json':
+            self._send_json(simulator.teams_body())
+        elif path[-1] == 'pbp.json' and path[-2] in simulator.games:
+            thrown = simulator.pitches_thrown()
+            game = simulator.games[path[-2]]
+            body = game.pbp_body(thrown)
+            etag = f'"{path[-2]}-{min(thrown, len(game.positions))}"'
+            if self.headers.get('if-none-match') == etag:
+                self._send(304, b'', {"ETag": etag})
+            elif simulator.chance(simulator.malformed_rate):
+                self._send(200, body[:len(body) // 2], {"Content-Type": "application/json"})
+            else:
+                self._send(200, body, {"Content-Type": "application/json", "ETag": etag})
+        elif path[-1] == 'schedule.json':
+            self._send_json(simulator.schedule_body())
+        else:
+            self._send(404, b'{"message": "Not Found"}')
+
+    def _stream_pitches(self):
+        # Like a real push feed, only pitches thrown after the client connected are sent.
+        simulator = self.server.simulator
+        self.send_response(200)
+        self.send_header("Content-Type", "application/json")
+        self.send_header("Transfer-Encoding", "chunked")
+        self.end_headers()
+        self.close_connection = True
+        sent = simulator.pitches_thrown()
+        opened_at = last_write = time.monotonic()
+        while not simulator.push_max_seconds or time.monotonic() - opened_at < simulator.push_max_seconds:
+            thrown = simulator.pitches_thrown()
+            lines = [game.push_message(index) for index in range(sent, thrown)
+                     for game in simulator.games.values() if index < len(game.positions)]
+            sent = thrown
+            if not lines and time.monotonic() - last_write >= PUSH_HEARTBEAT_SECONDS:
+                lines = [b'{"heartbeat":{"interval":%d,"type":"heartbeat"}}' % PUSH_HEARTBEAT_SECONDS]
+            for line in lines:
+                if simulator.chance(simulator.malformed_rate):
+                    line = line[:len(line) // 2]
+                self.wfile.write(b"%x\r\n%s\n\r\n" % (len(line) + 1, line))
+                last_write = time.monotonic()
+            if lines:
+                self.wfile.flush()
+            time.sleep(PUSH_TICK_SECONDS)
+        self.wfile.write(b"0\r\n\r\n")
+
+    def _send_json(self, data):
+        self._send(200, json.dumps(data).encode('utf-8'), {"Content-Type": "application/json"})
+
+    def _send(self, status, body, headers=None):
+        self.send_response(status)
+        for key, value in (headers or {}).items():
+            self.send_header(key, value)
+        self.send_header("Content-Length", str(len(body)))
+        self.end_headers()
+        self.wfile.write(body)
+
+    def log_message(self, *args):
+        pass
+
+
+class SimulatorServer(ThreadingHTTPServer):
+    daemon_threads = True
+
+    def handle_error(self, request, client_address):
+        # Pollers that time out or exit mid-response are expected under load; anything else is reported.
+        if not isinstance(sys.exc_info()[1], ConnectionError):
+            super().handle_error(request, client_address)
+
+
+def start_simulator(simulator, port=0, host="127.0.0.1"):
+    """
+    Serve a Simulator from a daemon thread.
+
+    Returns:
+        SimulatorServer: The running server; its base URL is http://host:port/mlb.
+    """
+    server = SimulatorServer((host, port), SimulatorHandler)
+    server.simulator = simulator
+    threading.Thread(target=server.serve_forever, name="strikezone-simulator", daemon=True).start()
+    return server
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Local Sportradar MLB stand-in serving simulated live games")
+    parser.add_argument("--port", type=int, default=8765, help="Port to listen on (default 8765)")
+    parser.add_argument("--games", type=int, default=15, help="Simultaneous live games (default 15)")
+    parser.add_argument("--innings", type=int, default=9, help="Innings per game (default 9)")
+    parser.add_argument("--speed", type=float, default=1.0,
+                        help="Game clock multiplier; 1 is about one pitch per 20 s per game (default 1)")
+    parser.add_argument("--latency_ms", type=float, default=0, help="Mean added response latency in ms")
+    parser.add_argument("--rate_limit_rate", type=float, default=0.0, help="Share of requests answered 429 (0-1)")
+    parser.add_argument("--malformed_rate", type=float, default=0.0,
+                        help="Share of pbp responses and push lines sent as truncated JSON (0-1)")
+    parser.add_argument("--seed", type=int, default=0, help="Seed of the generated games and the faults")
+    parser.add_argument("--push_max_seconds", type=float, default=0,
+                        help="Close every push stream after this many seconds to exercise reconnects (default never)")
+    args = parser.parse_args()
+
+    simulator = Simulator(args.games, args.innings, args.speed, args.latency_ms, args.rate_limit_rate,
+                          args.malformed_rate, args.seed, args.push_max_seconds)
+    server = start_simulator(simulator, args.port)
+    print(f"Simulating {args.games} games at {args.speed}x on http://127.0.0.1:{server.server_address[1]}/mlb")
+    try:
+        threading.Event().wait()
+    except KeyboardInterrupt:
+        server.shutdown()
+
+
+if __name__ == "__main__":
+    main()
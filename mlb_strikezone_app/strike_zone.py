@@ -1,101 +1,36 @@
-import os
-import json
-import requests
+import time
 import tkinter as tk
 from tkinter import font
-from ctypes import windll
-from PIL import Image, ImageTk
-
-# Get the directory of the current script (strike_zone.py)
-script_dir = os.path.dirname(os.path.abspath(__file__))
-
-# Construct the full paths to the JSON files
-play_outcomes_file_path = os.path.join(script_dir, 'play_outcome_codes.json')
-teams_file_path = os.path.join(script_dir, 'teams.json')
-strike_zone_picture_path = os.path.join(script_dir, 'strike_zone.JPG')
-
-# Now open the file using the absolute path
-with open(play_outcomes_file_path, 'r') as file:
-    play_outcome_codes = json.load(file)
-
-with open(teams_file_path, 'r') as file:
-    teams = json.load(file)
-
-
-class MLB_API_Calls:
-    """
-      A class to interact with the Sportradar MLB API for fetching team data,
-      today's live games, and pitch-by-pitch (PBP) data.
-
-      Attributes:
-          api_key (str): API key for authenticating requests to Sportradar.
-          access_level (str): Access level for the API (e.g., 'trial', 'production').
-          live_games_dict (dict): Dictionary mapping game matchups to game IDs.
-          games_url (str): URL for fetching today's game schedule.
-          teams_url (str): URL for fetching all MLB teams.
-      """
-
-    def __init__(self, api_key, access_level):
-        from datetime import datetime
-        now = datetime.now()
-        year = now.strftime("%Y")
-        month = now.strftime("%m")  # zero-padded month
-        day = now.strftime("%d")  # zero-padded day
-        self.live_games_dict = {}
-        self.access_level = access_level
-        self.api_key = api_key
-        self.games_url = f"https://api.sportradar.com/mlb/{self.access_level}/v8/en/games/{year}/{month}/{day}/schedule.json?api_key={self.api_key}"
-        self.teams_url = f"https://api.sportradar.com/mlb/{self.access_level}/v8/en/league/teams.json?api_key={self.api_key}"
-
-    def get_teams(self):
-        """
-        Fetch all MLB teams and return a mapping of team IDs to full team names.
-        Used to create play_outcome_codes.json. Use again in time in case MLB Teams change their names.
-
-        Returns:
-            dict: A dictionary with team IDs as keys and team names as values.
-
-        Example:
-            # api = MLB_API_Calls(api_key="your_api_key", access_level="trial")
-            # teams = api.get_teams()
-            # isinstance(teams, dict)
-            True
-        """
-        all_teams_temp = {}
-        with requests.get(self.teams_url, headers={"accept": "application/json"}) as r:
-            for team in r.json()['teams']:
-                all_teams_temp[team.get('id')] = team.get('market', ' ') + " " + team.get('name', ' ')
-        return all_teams_temp
-
-    def get_live_games(self, all_teams):
-        """
-       Update the live_games_dict with currently in-progress MLB games.
-
-       Args:
-           all_teams (dict): A dictionary of team IDs to team names.
-       """
-        with requests.get(self.games_url, headers={"accept": "application/json"}) as r:
-            for game in r.json().get('games', []):
-                if game.get('status') == 'inprogress':
-                    game_id = game.get('id')
-                    home_team = all_teams[game.get('home_team').strip()]
-                    away_team = all_teams[game.get('away_team').strip()]
-                    key = f"{away_team.strip()} vs(@) {home_team.strip()}"
-                    self.live_games_dict[key] = game_id
-
-    def get_pbp_data(self, game_id):
-        """
-        Fetch the pitch-by-pitch (PBP) data for a specific game.
-
-        Args:
-            game_id (str): The unique identifier of the game.
-
-        Returns:
-            dict: A dictionary containing the PBP data for the game.
-        """
-        url = f"https://api.sportradar.com/mlb/{self.access_level}/v8/en/games/{game_id}/pbp.json?api_key={self.api_key}"
-        response = requests.get(url, headers={"accept": "application/json"})
-        return response.json().get('game', {})
+from mlb_strikezone_app.alerts import AlertEngine
+from mlb_strikezone_app.assets import scaled_background_path
+from mlb_strikezone_app.fetch_worker import FetchWorker
+from mlb_strikezone_app.metrics import shared_metrics
+from mlb_strikezone_app.mlb_api import Pitch_Stream, SPORTRADAR_BASE_URL
+from mlb_strikezone_app.pitch_trail import PitchTrail
+from mlb_strikezone_app.replay import REPLAY_SPEEDS
+from mlb_strikezone_app.view_model import summary_view, changed_fields, menu_changes, LABEL_FIELDS
+from mlb_strikezone_app.scheduler import PollScheduler
+
+try:
+    from ctypes import windll  # Windows only, used for DPI awareness.
+except ImportError:
+    windll = None
+
+# How often (ms) the Tk loop checks the fetch worker for finished results.
+FETCH_RESULTS_POLL_MS = 100
+
+# Pitches that landed between two polls are replayed one after another this far apart (ms),
+# and at most this many of them are replayed (e.g. after switching back to a game).
+PITCH_REPLAY_MS = 1500
+MAX_REPLAYED_PITCHES = 8
+
+# Speed a replay starts at.
+DEFAULT_REPLAY_SPEED = 10
+
+# A fired alert rule flashes the window this color for this long (ms), and switches to its
+# game unless another alert already did within that time.
+ALERT_COLOR = "orange"
+ALERT_FLASH_MS = 4000
 
 
 class StrikeZone:
@@ -112,10 +47,19 @@ class StrikeZone:
           itemChecked (tk.StringVar): Tracks the currently selected game in the dropdown.
           trace_id (str): Optional string identifier for the game or session.
           drop (tk.OptionMenu): Dropdown menu for selecting live MLB games.
+          menu_entries (list): Labels currently in the dropdown menu, in menu order.
+          current_view (SummaryView or None): Snapshot of what the labels and pitch dot show now.
           canvas (tk.Canvas): Area for rendering the strike zone image and pitch dots.
-          background_image (PIL.Image): Loaded strike zone image before conversion.
-          background_photo (ImageTk.PhotoImage): Tkinter-compatible image used in the canvas.
+          background_image (PIL.Image or None): Scaled strike zone image the heatmap is drawn over;
+              only loaded when the heatmap is enabled.
+          background_photo (tk.PhotoImage or ImageTk.PhotoImage): Image shown in the canvas.
           last_pitch_dot (object): Reference to the last drawn pitch indicator on the canvas.
+          trail_scope (str): 'off' shows only the last pitch; 'at_bat' or 'inning' keeps a numbered,
+              fading trail of every pitch in the current at-bat or inning.
+          pitch_trail (PitchTrail or None): Pooled canvas items for the trail when enabled.
+          heatmap_scope (str): 'off', 'game' or 'pitcher'; draws a pitch-location heatmap for the
+              displayed game or its current pitcher into the background image.
+          heatmap (PitchHeatmap or None): NumPy density grid behind the heatmap layer when enabled.
           center_x (int): X-coordinate for the center of the canvas.
           center_y (int): Y-coordinate for the center of the canvas.
           away_vs_home_label (tk.Label): Displays the team matchup (away vs home).
@@ -126,9 +70,11 @@ class StrikeZone:
           last_pitch_label (tk.Label): Displays information about the most recent pitch.
           pitch_outcome_label (tk.Label): Describes the outcome of the last pitch.
           play_outcome_label (tk.Label): Describes the outcome of the play, if applicable.
+          umpire_accuracy_label (tk.Label): Running share of the game's called balls and strikes that
+              match the rulebook zone.
       """
 
-    def __init__(self, root):
+    def __init__(self, root, trail_scope='off', heatmap_scope='off'):
         """
         Initializes the StrikeZone GUI with a dropdown menu, canvas displaying
         a strike zone image, and an informational section showing game data.
@@ -136,6 +82,8 @@ class StrikeZone:
 
         Args:
             root (tk.Tk): The root window for the application.
+            trail_scope (str): 'off', 'at_bat' or 'inning'. See `trail_scope` attribute.
+            heatmap_scope (str): 'off', 'game' or 'pitcher'. See `heatmap_scope` attribute.
         """
         self.root = root
         self.root.title("Strike Zone")
@@ -158,19 +106,39 @@ class StrikeZone:
 
         self.drop = tk.OptionMenu(self.container, self.itemChecked, *['No Live Games'])
         self.drop.pack(fill='x')
+        self.menu_entries = ['No Live Games']
+        self.current_view = None
 
         self.canvas = tk.Canvas(self.container, width=self.canvas_width, height=self.canvas_height)
         self.canvas.pack(pady=(10, 5))
 
-        # Load and place the background image
-        self.background_image = Image.open(strike_zone_picture_path)
-        self.background_image = self.background_image.resize((self.canvas_width, self.canvas_height), Image.LANCZOS)
-        self.background_photo = ImageTk.PhotoImage(self.background_image)
+        # Load and place the background image, pre-scaled once per canvas size and DPI.
+        background_path = scaled_background_path(self.canvas_width, self.canvas_height,
+                                                 round(root.winfo_fpixels('1i')))
+        if heatmap_scope != 'off':
+            # The heatmap repaints the photo through Pillow, so it needs the PIL pair.
+            from PIL import Image, ImageTk
+            self.background_image = Image.open(background_path).convert("RGB")
+            self.background_photo = ImageTk.PhotoImage(self.background_image)
+        else:
+            self.background_image = None
+            self.background_photo = tk.PhotoImage(file=background_path)
         self.canvas.create_image(6, 6, anchor=tk.NW, image=self.background_photo)
 
         self.last_pitch_dot = None
         self.center_x = self.canvas_width // 2
         self.center_y = self.canvas_height // 2
+        self.trail_scope = trail_scope
+        self.pitch_trail = PitchTrail(self.canvas) if trail_scope != 'off' else None
+        self.trail_key = None
+        self.last_trail_pitch = None
+        self.heatmap_scope = heatmap_scope
+        self.heatmap = None
+        if heatmap_scope != 'off':
+            from mlb_strikezone_app.heatmap import PitchHeatmap  # NumPy is only imported when asked for.
+            self.heatmap = PitchHeatmap(self.canvas_width, self.canvas_height)
+        self.heatmap_key = None
+        self.last_heatmap_pitch = None
 
         # --- Modern Styled Info Section ---
         info_frame = tk.Frame(self.container, bg="white", padx=12, pady=12, highlightbackground="#ccc",
@@ -217,6 +185,9 @@ class StrikeZone:
         self.play_outcome_label = tk.Label(info_frame, font=("Helvetica", 12), **label_style)
         self.play_outcome_label.pack(pady=(0, 4))
 
+        self.umpire_accuracy_label = tk.Label(info_frame, font=("Helvetica", 10), **label_style)
+        self.umpire_accuracy_label.pack(pady=(0, 4))
+
         # Overlay frame (centered)
         overlay_frame = tk.Frame(root, width=200, height=600, bg="#f0f0f0", bd=2, relief="raised")
         overlay_frame.place(relx=0.5, rely=0.4, anchor="center")
@@ -233,7 +204,8 @@ class StrikeZone:
             "• Go to https://console.sportradar.com/signup\n"
             "• Create a free account → Add trial → choose MLB API.\n"
             "• Your API key will appear on your Sportradar console page.\n\n"
-            "Note: The program refreshes every 20 seconds. The background flashes red letting you know the program has:\n\n"
+            "Note: The program refreshes about every 20 seconds (faster mid at-bat, slower between innings). "
+            "The background flashes red letting you know the program has:\n\n"
             "• Refreshed data shown\n"
             "• Updated live games dropdown"
         )
@@ -247,22 +219,33 @@ class StrikeZone:
         #
 
 
-class StrikeZone_Updates(StrikeZone, MLB_API_Calls):
+class StrikeZone_Updates(StrikeZone, Pitch_Stream):
     """
        Extension of StrikeZone that integrates real-time MLB pitch tracking
        using the Sportradar API.
 
        Inherits:
            StrikeZone: Handles GUI rendering and layout.
-           MLB_API_Calls: Manages API calls to fetch live game and pitch-by-pitch data.
+           Pitch_Stream: Fetches live game and pitch-by-pitch data and parses it into pitch summaries.
 
        Attributes:
            currently_displayed_game_id (str): ID of the game currently shown in the UI.
-           last_out (str): Keeps track of the last recorded out.
-           last_inning (str): Keeps track of the last recorded inning.
+           fetch_worker (FetchWorker, FanoutClient or ShardedFetchWorker): Background thread running all
+               API calls and parsing, or, in client mode, reading a `--serve` fan-out server instead,
+               or, with `shards`, reading the table of the shard processes.
+           server_url (str or None): Fan-out server this window is a client of; None calls Sportradar.
+           latest_summaries (dict): Warm cache of the latest pitch summary per game id.
+           poll_scheduler (PollScheduler): Picks poll intervals and tracks the API call budget.
+           replay (ReplayIndex or None): Game being replayed instead of followed live.
+           replay_position (int): Position in `replay` of the pitch shown.
+           replay_playing (bool): Whether the replay advances on its own.
+           alerts (AlertEngine): User alert rules checked against every new pitch of every game.
+           stale_text (str): Stale data notice shown under the dropdown, '' while the data is fresh.
        """
 
-    def __init__(self, root, api_key, access_level):
+    def __init__(self, root, api_key, access_level, prefetch_all=False, max_concurrency=4, schedule_date=None,
+                 trail_scope='off', heatmap_scope='off', base_url=SPORTRADAR_BASE_URL, push=False, server_url=None,
+                 shards=0, alert_rules=()):
         """
        Initializes the StrikeZone_Updates instance, connecting GUI elements with live data.
 
@@ -270,125 +253,57 @@ class StrikeZone_Updates(StrikeZone, MLB_API_Calls):
            root (tk.Tk): The root window for the application.
            api_key (str): The user's Sportradar API key.
            access_level (str): The API access level (e.g., "trial" or "production").
+           prefetch_all (bool): Poll every live game each cycle so switching games renders instantly.
+           max_concurrency (int): Maximum parallel pbp fetches when `prefetch_all` is set.
+           schedule_date (datetime.date, optional): Day whose schedule is polled. Defaults to today.
+           trail_scope (str): 'off', 'at_bat' or 'inning' pitch trail on the strike zone.
+           heatmap_scope (str): 'off', 'game' or 'pitcher' pitch-location heatmap.
+           base_url (str, optional): Root of the MLB API, e.g. the local simulator. Defaults to Sportradar.
+           push (bool): Take new pitches from the push feed as they happen, polling only while it is down.
+           server_url (str, optional): Subscribe to this fan-out server (`--serve`) instead of
+               calling Sportradar, so any number of viewers share one poller's quota.
+           shards (int): Poll every game from this many worker processes (sharded.py); 0 polls in-process.
+           alert_rules (iterable): Alert rule texts (see alerts.py). Invalid rules raise ValueError.
+               Any rule turns on `prefetch_all`, so every live game's pitches are checked.
        """
-        MLB_API_Calls.__init__(self, api_key, access_level)
-        StrikeZone.__init__(self, root)
+        Pitch_Stream.__init__(self, api_key, access_level, schedule_date, base_url)
+        StrikeZone.__init__(self, root, trail_scope, heatmap_scope)
         self.currently_displayed_game_id = 'No Live Games'
         # self.get_live_games(teams)
         # self.display_live_games()
-        self.last_out = 'N/A'
-        self.last_inning = 'N/A'
-
-    def get_latest_inning(self, game_data):
-        """
-        Extracts the most recent inning and half-inning data from the full game object.
-
-        Args:
-            game_data (dict): A full play-by-play response from the API.
-
-        Returns:
-            tuple:
-                - inning_dict (dict or None): The most recent inning's data.
-                - half_dict (dict or None): The most recent half-inning's data.
-                - error_msg (str or None): Error message if inning data is not found.
-        """
-        innings = game_data.get('innings', [])
-        if not innings:
-            return None, None, "No innings data found."
-
-        last_inning = innings[-1]
-        halfs = last_inning.get('halfs', [])
-        if not halfs:
-            return None, None, "Inning coming up."
-
-        last_half = halfs[1] if halfs[-1].get("events") else halfs[0]
-        #print("Last Inning:", last_inning.get('number', 'not here'), "Last Half:", last_half.get('half', 'not here'))
-        return last_inning, last_half, None
-
-    def stream_latest_pitch_and_info(self, game_id):
-        """
-        Fetches and summarizes the most recent pitch and game context data for a given game.
-
-        Args:
-            game_id (str): Unique identifier for the selected MLB game.
-
-        Returns:
-            dict: A dictionary summarizing the most recent pitch, including:
-                - inning_number (str)
-                - inning_half (str)
-                - home_team_score (str)
-                - away_team_score (str)
-                - hitter (str)
-                - pitcher (str)
-                - balls (str)
-                - strikes (str)
-                - outs (str)
-                - ball_strike_or_foul (str)
-                - pitch_type (str)
-                - pitch_speed (str)
-                - pitch_zone (int)
-                - pitch_x (float)
-                - pitch_y (float)
-                - pitch_outcome (str)
-                - description (str)
-                Or a message-only fallback if no pitch data is currently available.
-        """
-        #print(game_id)
-        game_data = self.get_pbp_data(game_id)
-        inning, half_data, error = self.get_latest_inning(game_data)
-        if error:
-            error_summary = {
-                "inning_number": f"{error}",
-                "inning_half": '',
-                "home_team_score": "",
-                "away_team_score": "",
-                "hitter": '',
-                "pitcher": '',
-                "balls": '',
-                "strikes": '',
-                "outs": "",
-                "ball_strike_or_foul": '',
-                "pitch_type": "",
-                "pitch_speed": "",
-                "pitch_zone": -1,
-                "pitch_x": 0,
-                "pitch_y": 0,
-                "pitch_outcome": '',
-                "description": ''
-            }
-            #print(error)
-            return error_summary
-
-        events = half_data.get('events', [])
-        half = "Top" if half_data.get('half', '') == 'T' else "Bottom"
-        inning_number = inning.get('number', 'N/A')
-        if not events:
-            error_summary = {
-                "inning_number": f"No events yet in the {half} of the {inning_number}.",
-                "inning_half": '',
-                "home_team_score": "",
-                "away_team_score": "",
-                "hitter": '',
-                "pitcher": '',
-                "balls": '',
-                "strikes": '',
-                "outs": "",
-                "ball_strike_or_foul": '',
-                "pitch_type": "",
-                "pitch_speed": "",
-                "pitch_zone": -1,
-                "pitch_x": 0,
-                "pitch_y": 0,
-                "pitch_outcome": '',
-                "description": ''
-            }
-            #print(f"No events yet in the {half} of the {inning_number}.")
-            return error_summary
-
-        at_bat = events[-1].get('at_bat', {})
-        summary = self.summarize_at_bat(at_bat, inning_number, half)
-
-        return summary
+        self.latest_summaries = {}
+        self.alerts = AlertEngine(alert_rules)
+        self.alert_surfaced_at = None
+        self.poll_scheduler = PollScheduler(access_level)
+        self.http.request_hooks.append(self.poll_scheduler.record_request)
+        self.server_url = server_url
+        if server_url:
+            from mlb_strikezone_app.fanout import FanoutClient
+            self.fetch_worker = FanoutClient(self, server_url)
+        elif shards:
+            from mlb_strikezone_app.sharded import ShardedFetchWorker
+            self.fetch_worker = ShardedFetchWorker(self, shards)
+        else:
+            # Alert rules watch every game, so they need every game polled, not just the selected one.
+            self.fetch_worker = FetchWorker(self, prefetch_all=prefetch_all or bool(self.alerts.rules),
+                                            max_concurrency=max_concurrency, push=push)
+        self.fetch_worker.start()
+        self.replay = None
+        self.replay_position = 0
+        self.replay_playing = False
+        self.replay_loading = None
+        self.replay_after_id = None
+        self.replay_frame = None
+        if not server_url:
+            # A viewer of a fan-out server has no API access to fetch whole games with.
+            self.replay_button = tk.Button(self.container, text="Replay", command=self.toggle_replay)
+            self.replay_button.pack(fill='x', after=self.drop)
+        self.alert_label = tk.Label(self.container, font=("Helvetica", 11, "bold"), fg="#B71C1C", wraplength=280)
+        if self.alerts.rules:
+            self.alert_label.pack(before=self.canvas)
+        self.stale_label = tk.Label(self.container, font=("Helvetica", 10), fg="#757575", wraplength=280)
+        self.stale_text = ''
+        self.root.after(FETCH_RESULTS_POLL_MS, self.process_fetch_results)
 
     def update_away_vs_home_text(self, text):
         """
@@ -397,56 +312,42 @@ class StrikeZone_Updates(StrikeZone, MLB_API_Calls):
         Args:
             text (str): Text to display.
         """
-        text_var = tk.StringVar()
-        text_var.set(text)
         self.away_vs_home_label.config(text=text)
 
     def update_score_text(self, text):
         """Update the score label."""
-        text_var = tk.StringVar()
-        text_var.set(text)
         self.score_label.config(text=text)
 
     def update_inning_text(self, text):
         """Update the inning label."""
-        text_var = tk.StringVar()
-        text_var.set(text)
         self.inning_label.config(text=text)
 
     def update_hitter_pitcher_text(self, text):
         """Update the hitter vs pitcher label."""
-        text_var = tk.StringVar()
-        text_var.set(text)
         self.hitter_pitcher_label.config(text=text)
 
     def update_count_text(self, text):
         """Update the balls-strikes-outs count label."""
-        text_var = tk.StringVar()
-        text_var.set(text)
         self.count_label.config(text=text)
 
     def update_last_pitch_text(self, text):
         """Update the last pitch information label."""
-        text_var = tk.StringVar()
-        text_var.set(text)
         self.last_pitch_label.config(text=text)
 
     def update_pitch_outcome_text(self, text):
         """Update the pitch outcome label."""
-        text_var = tk.StringVar()
-        text_var.set(text)
         self.pitch_outcome_label.config(text=text)
 
     def update_play_outcome_text(self, text):
         """Update the play outcome label."""
-        text_var = tk.StringVar()
-        text_var.set(text)
         self.play_outcome_label.config(text=text)
 
     def option_changed(self, *args):
         """
         Called when a new game is selected from the dropdown.
-        Updates the currently displayed game and fetches new pitch data.
+        Updates the currently displayed game, renders its cached summary right away if one
+        is warm, and otherwise queues a pitch data fetch on the background worker. The
+        result is rendered by `process_fetch_results`.
         """
         selected_game = self.itemChecked.get()
 
@@ -454,13 +355,21 @@ class StrikeZone_Updates(StrikeZone, MLB_API_Calls):
             return
 
         selected_game_id = self.live_games_dict.get(selected_game)
-        if selected_game_id == self.currently_displayed_game_id:
-            pitch_summary = self.stream_latest_pitch_and_info(self.currently_displayed_game_id)
-            self.play_summary(pitch_summary)
-        else:
-            self.currently_displayed_game_id = selected_game_id
-            pitch_summary = self.stream_latest_pitch_and_info(self.currently_displayed_game_id)
-            self.play_summary(pitch_summary)
+        if selected_game_id is None:
+            return
+        if selected_game_id != self.currently_displayed_game_id:
+            # Start a fresh pitch trail and heatmap for the other game.
+            self.trail_key = None
+            self.heatmap_key = None
+        self.currently_displayed_game_id = selected_game_id
+        if self.replay is not None:
+            return  # Shown once the replay is closed.
+        cached_summary = self.latest_summaries.get(selected_game_id)
+        if cached_summary is not None:
+            self.play_summary(cached_summary)
+            if self.fetch_worker.prefetch_all or self.fetch_worker.push_connected():
+                return  # Every game is refreshed each poll or pushed, the cache is current.
+        self.fetch_worker.submit_pitch(selected_game_id)
 
     def display_live_games(self):
         """
@@ -476,179 +385,182 @@ class StrikeZone_Updates(StrikeZone, MLB_API_Calls):
         - If `self.api_key` is set: uses live data and updates the menu based on currently active games.
         - If no games are available: displays "No Live Games" in the dropdown.
         """
+        games = list(self.live_games_dict.keys())
         if self.api_key == '':
-            games = list(self.live_games_dict.keys())
-            menu = self.drop["menu"]
-            menu.delete(0, "end")
-            for opt in games:
-                menu.add_command(label=opt, command=lambda val=opt: self.itemChecked.set(val))
+            self.sync_menu(games)
             self.itemChecked.set(games[0])
             return
 
-        games = list(self.live_games_dict.keys())
         currently_displayed_game = self.itemChecked.get()
 
         if currently_displayed_game in games:
-            menu = self.drop["menu"]
-            menu.delete(0, "end")
-            if self.trace_id:
-                self.itemChecked.trace_remove('write', self.trace_id)
-
-            for opt in games:
-                menu.add_command(label=opt, command=lambda val=opt: self.itemChecked.set(val))
-
-            self.itemChecked.set(currently_displayed_game)
-            self.trace_id = self.itemChecked.trace_add("write", self.option_changed)
+            self.sync_menu(games)
+            if not self.trace_id:
+                self.trace_id = self.itemChecked.trace_add("write", self.option_changed)
 
-        elif currently_displayed_game == 'No Live Games' and games:
-            menu = self.drop["menu"]
-            menu.delete(0, "end")
+        elif games:
+            # Nothing shown yet, or the shown game finished and left the schedule.
+            self.sync_menu(games)
             if self.trace_id:
                 self.itemChecked.trace_remove('write', self.trace_id)
-
-            for opt in games:
-                menu.add_command(label=opt, command=lambda val=opt: self.itemChecked.set(val))
-
             self.itemChecked.set(games[0])
             self.trace_id = self.itemChecked.trace_add("write", self.option_changed)
         else:
+            self.sync_menu(['No Live Games'])
             self.itemChecked.set('No Live Games')
 
+    def sync_menu(self, games):
+        """
+        Bring the dropdown entries in line with `games`, deleting and adding only the
+        entries that changed instead of rebuilding the whole menu.
+
+        Args:
+            games (list): Dropdown labels of the live games.
+        """
+        deletes, appends = menu_changes(self.menu_entries, games)
+        if not deletes and not appends:
+            return
+        menu = self.drop["menu"]
+        for index in deletes:
+            menu.delete(index)
+            del self.menu_entries[index]
+        for opt in appends:
+            menu.add_command(label=opt, command=lambda val=opt: self.itemChecked.set(val))
+            self.menu_entries.append(opt)
+
+    def pitch_to_canvas(self, pitch_x, pitch_y):
+        """
+        Convert Sportradar pitch_x/pitch_y to canvas coordinates.
+
+        Returns:
+            tuple: (x, y) on the canvas.
+        """
+        x = self.center_x - (pitch_x / 300) * (self.canvas_width / 2)
+        y = self.center_y - (pitch_y / 200) * (self.canvas_height / 2)
+        return x, y
+
+    @staticmethod
+    def pitch_color(ball_strike_foul):
+        """Red for strikes and fouls (and unknown results), green for balls."""
+        red = "#E53935"
+        green = "#43A047"
+        if ball_strike_foul == 'Strike' or ball_strike_foul == 'Foul Ball':
+            return red
+        elif ball_strike_foul == 'Ball':
+            return green
+        else:
+            return red
+
     def add_pitch(self, pitch_x, pitch_y, ball_strike_foul):
         """
         Plot a pitch dot on the canvas using coordinates and pitch result.
+        With a pitch trail enabled the dot is added to the trail instead of replacing the last one.
 
         Args:
             pitch_x (float): Horizontal location of the pitch.
             pitch_y (float): Vertical location of the pitch.
             ball_strike_foul (str): Result of the pitch ('Ball', 'Strike', etc.).
         """
-        x = self.center_x - (pitch_x / 300) * (self.canvas_width / 2)
-        y = self.center_y - (pitch_y / 200) * (self.canvas_height / 2)
+        x, y = self.pitch_to_canvas(pitch_x, pitch_y)
+        pitch_color = self.pitch_color(ball_strike_foul)
 
         # print(f"Placing dot at (x={x:.1f}, y={y:.1f})")
 
+        if self.pitch_trail is not None:
+            self.pitch_trail.add(x, y, pitch_color)
+            return
+
         if self.last_pitch_dot is not None:
             self.canvas.delete(self.last_pitch_dot)
 
         radius = 9.5
-        red = "#E53935"
-        green = "#43A047"
-        if ball_strike_foul == 'Strike' or ball_strike_foul == 'Foul Ball':
-            pitch_color = red
-        elif ball_strike_foul == 'Ball':
-            pitch_color = green
-        else:
-            pitch_color = red
-
         self.last_pitch_dot = self.canvas.create_oval(
             x - radius, y - radius, x + radius, y + radius, fill=pitch_color, outline='black'
         )
 
-    def play_summary(self, pitch_summary):
+    def add_pitch_to_trail(self, pitch_summary):
         """
-        Update all GUI fields with the latest pitch summary.
+        Add a summary's pitch to the trail, starting a new trail when the at-bat or inning
+        (per `trail_scope`) changes. Summaries without a pitch and repeats of the last
+        pitch (re-rendered when a poll brings nothing new) are skipped.
 
         Args:
-            pitch_summary (dict): Dictionary with pitch, score, and player info.
+            pitch_summary (dict): Pitch summary from Pitch_Stream.
         """
-        self.update_away_vs_home_text(f"{self.itemChecked.get()}")
-        self.update_score_text(f"{pitch_summary['away_team_score']} - {pitch_summary['home_team_score']}")
-        self.update_inning_text(f"{pitch_summary['inning_half']} - {pitch_summary['inning_number']}")
-        self.update_hitter_pitcher_text(f"{pitch_summary['pitcher']} vs {pitch_summary['hitter']}")
-        self.update_count_text(
-            f"COUNT: {pitch_summary['balls']}-{pitch_summary['strikes']}, OUTS: {pitch_summary['outs']}")
-        self.update_last_pitch_text(
-            f"Last Pitch: {pitch_summary['pitch_type']} at {pitch_summary['pitch_speed']} mph")
-        self.update_pitch_outcome_text(f"Pitch Outcome: {pitch_summary['pitch_outcome']}")
-        self.update_play_outcome_text(f"Play Outcome: {pitch_summary['description']}")
+        key = (pitch_summary['inning_number'], pitch_summary['inning_half'])
+        if self.trail_scope == 'at_bat':
+            key += (pitch_summary['hitter'], pitch_summary['pitcher'])
+        if key != self.trail_key:
+            self.pitch_trail.clear()
+            self.trail_key = key
+            self.last_trail_pitch = None
+
+        if pitch_summary['pitch_type'] == '':
+            return
+        pitch = self.pitch_identity(pitch_summary)
+        if pitch == self.last_trail_pitch:
+            return
+        self.last_trail_pitch = pitch
         self.add_pitch(pitch_summary['pitch_x'], pitch_summary['pitch_y'], pitch_summary['ball_strike_or_foul'])
 
-    def summarize_at_bat(self, at_bat, inning_number, half):
+    def add_pitch_to_heatmap(self, pitch_summary):
         """
-        Parse and summarize at-bat data for GUI rendering.
+        Bin a summary's pitch into the heatmap (same transform as `add_pitch`) and redraw the
+        background image with the heatmap layer. The heatmap restarts for another game, or
+        for another pitcher when `heatmap_scope` is 'pitcher'.
 
         Args:
-            at_bat (dict): Dictionary containing at-bat and pitch data.
-            inning_number (int or str): Inning number of the event.
-            half (str): 'Top' or 'Bottom' half of the inning.
+            pitch_summary (dict): Pitch summary from Pitch_Stream.
+        """
+        key = pitch_summary['pitcher'] if self.heatmap_scope == 'pitcher' else ''
+        if key != self.heatmap_key:
+            self.heatmap.clear()
+            self.heatmap_key = key
+            self.last_heatmap_pitch = None
 
-        Returns:
-            dict: Summary of batter, pitcher, pitch type, count, and scores.
-        """
-        events = at_bat.get('events', [])
-        hitter = at_bat.get('hitter', {})
-        pitcher = at_bat.get('pitcher', {})
-        hitter_name = f"{hitter.get('preferred_name', '')} {hitter.get('last_name', '')}"
-        pitcher_name = f"{pitcher.get('preferred_name', '')} {pitcher.get('last_name', '')}"
-        home_team_score = at_bat.get('score', {}).get('home_team_runs', 'N/A')
-        away_team_score = at_bat.get('score', {}).get('away_team_runs', 'N/A')
-        if not events:
-            return {
-                "inning_number": inning_number,
-                "inning_half": half,
-                "home_team_score": home_team_score,
-                "away_team_score": away_team_score,
-                "hitter": hitter_name,
-                "pitcher": pitcher_name,
-                "balls": '',
-                "strikes": '',
-                "outs": self.last_out,
-                "ball_strike_or_foul": '',
-                "pitch_type": "",
-                "pitch_speed": "",
-                "pitch_zone": -1,
-                "pitch_x": 0,
-                "pitch_y": 0,
-                "pitch_outcome": "",
-                "description": at_bat.get('description', '')
-            }
-
-        last_event = events[-1]
-        count = last_event.get('count', {})
-        balls = count.get('balls', 0)
-        strikes = count.get('strikes', 0)
-        outs = count.get('outs', '')
-        if outs == '':
-            if self.last_inning == inning_number:
-                outs = self.last_out
-        else:
-            self.last_out = outs
-
-        mlb_pitch_data = last_event.get('mlb_pitch_data', {})
-        pitch_type = mlb_pitch_data.get('description', 'Unknown')
-        pitch_zone = mlb_pitch_data.get('zone', -1)
-        pitch_speed = last_event.get('pitcher', {}).get('pitch_speed', 0)
-        pitch_x = last_event.get('pitcher', {}).get('pitch_x', 0)
-        pitch_y = last_event.get('pitcher', {}).get('pitch_y', 0)
-        pitch_outcome = play_outcome_codes.get(last_event.get('outcome_id'), 'Unknown')
-
-        if pitch_outcome in ['Strike', ' Foul Ball']:
-            ball_strike_or_foul = 'Strike'
-        elif "Ball" in pitch_outcome:
-            ball_strike_or_foul = 'Ball'
-        else:
-            ball_strike_or_foul = 'N/A'
-
-        return {
-            "inning_number": inning_number,
-            "inning_half": half,
-            "home_team_score": home_team_score,
-            "away_team_score": away_team_score,
-            "hitter": hitter_name,
-            "pitcher": pitcher_name,
-            "balls": balls,
-            "strikes": strikes,
-            "outs": outs,
-            "ball_strike_or_foul": ball_strike_or_foul,
-            "pitch_type": pitch_type,
-            "pitch_speed": pitch_speed,
-            "pitch_zone": pitch_zone,
-            "pitch_x": pitch_x,
-            "pitch_y": pitch_y,
-            "pitch_outcome": pitch_outcome,
-            "description": at_bat.get('description', '')
-        }
+        if pitch_summary['pitch_type'] == '':
+            return
+        pitch = self.pitch_identity(pitch_summary)
+        if pitch == self.last_heatmap_pitch:
+            return
+        self.last_heatmap_pitch = pitch
+
+        x, y = self.pitch_to_canvas(pitch_summary['pitch_x'], pitch_summary['pitch_y'])
+        self.heatmap.add(x - 6, y - 6)  # The background image is drawn at canvas (6, 6).
+        self.background_photo.paste(self.heatmap.composite(self.background_image).convert("RGB"))
+
+    @staticmethod
+    def pitch_identity(pitch_summary):
+        """Fields that tell two summaries of the same pitch apart from a new pitch."""
+        return tuple(pitch_summary[k] for k in ('pitch_x', 'pitch_y', 'pitch_speed', 'balls', 'strikes', 'outs'))
+
+    def play_summary(self, pitch_summary):
+        """
+        Update all GUI fields with the latest pitch summary.
+
+        The summary is turned into an immutable SummaryView and only the labels (and the
+        pitch dot) that differ from the snapshot already on screen are reconfigured.
+
+        Args:
+            pitch_summary (dict): Dictionary with pitch, score, and player info.
+        """
+        with shared_metrics().timer("render", game=self.currently_displayed_game_id):
+            self._render_summary(pitch_summary)
+
+    def _render_summary(self, pitch_summary):
+        view = summary_view(self.shown_matchup(), pitch_summary)
+        changed = changed_fields(self.current_view, view)
+        self.current_view = view
+        for field in changed:
+            if field in LABEL_FIELDS:
+                getattr(self, f"{field}_label").config(text=getattr(view, field))
+
+        if self.pitch_trail is not None:
+            self.add_pitch_to_trail(pitch_summary)
+        elif 'pitch' in changed:
+            self.add_pitch(*view.pitch)
+        if self.heatmap is not None:
+            self.add_pitch_to_heatmap(pitch_summary)
 
     def change_bg(self, color):
         """
@@ -659,30 +571,287 @@ class StrikeZone_Updates(StrikeZone, MLB_API_Calls):
         """
         self.container.configure(bg=color)
 
+    def process_fetch_results(self):
+        """
+        Drain finished results from the fetch worker and render them, then re-arm itself.
+        Runs on the Tk main loop and never blocks on I/O.
+        """
+        for result in self.fetch_worker.drain():
+            kind = result[0]
+            try:
+                if kind == "games":
+                    live_ids = set(self.live_games_dict.values())
+                    for game_id in [game_id for game_id in self.latest_summaries if game_id not in live_ids]:
+                        del self.latest_summaries[game_id]
+                        self.alerts.forget(game_id)
+                    self.display_live_games()
+                    selected_game_id = self.live_games_dict.get(self.itemChecked.get())
+                    if selected_game_id is not None:
+                        self.currently_displayed_game_id = selected_game_id
+                elif kind == "pitches":
+                    _, game_id, pitch_summaries = result
+                    self.latest_summaries[game_id] = pitch_summaries[-1]
+                    if game_id == self.currently_displayed_game_id and self.replay is None:
+                        self.replay_pitches(game_id, pitch_summaries[-MAX_REPLAYED_PITCHES:])
+                    fired = [name for pitch_summary in pitch_summaries
+                             for name in self.alerts.check(game_id, pitch_summary)]
+                    if fired:
+                        self.raise_alert(game_id, fired)
+                elif kind == "replay":
+                    _, game_id, index = result
+                    if game_id == self.replay_loading:
+                        self.show_replay(index)
+                elif kind == "error":
+                    error = result[1]
+                    shared_metrics().increment("errors", kind="fetch", error=type(error).__name__)
+                    print(f"Error updating live data ({type(error).__name__}):", error)
+            except Exception as e:
+                shared_metrics().increment("errors", kind="render", error=type(e).__name__)
+                print(f"Error rendering live data ({type(e).__name__}):", e)
+
+        self.show_staleness()
+        self.root.after(FETCH_RESULTS_POLL_MS, self.process_fetch_results)
+
+    def show_staleness(self):
+        """
+        Say under the dropdown when the schedule or the displayed game is only last good data,
+        because the API is failing (see MLB_API_Calls.serve_stale), and hide the notice again
+        once a poll succeeds.
+        """
+        text = ''
+        if not self.server_url and self.replay is None:
+            stale, since = self.stale_since('schedule', self.currently_displayed_game_id)
+            if stale:
+                shown = f"data from {since.astimezone():%H:%M:%S}" if since is not None else "no data yet"
+                text = f"Stale: API unavailable, showing {shown}. Retrying..."
+        if text == self.stale_text:
+            return
+        if text:
+            self.stale_label.config(text=text)
+            if not self.stale_text:
+                self.stale_label.pack(before=self.canvas)
+        else:
+            self.stale_label.pack_forget()
+        self.stale_text = text
+
+    def raise_alert(self, game_id, rule_names):
+        """
+        Flash the window for fired alert rules, name them and the game, and switch the
+        dropdown to that game (at most once per flash, and never during a replay).
+
+        Args:
+            game_id (str): Game whose pitch fired the rules.
+            rule_names (list): Names of the rules that fired.
+        """
+        matchup = next((label for label, live_id in self.live_games_dict.items() if live_id == game_id), game_id)
+        self.alert_label.config(text=f"Alert: {', '.join(dict.fromkeys(rule_names))} - {matchup}")
+        self.change_bg(ALERT_COLOR)
+        self.container.after(ALERT_FLASH_MS, lambda: self.change_bg(self.defaultbg))
+        now = time.monotonic()
+        recently_surfaced = self.alert_surfaced_at is not None and now - self.alert_surfaced_at < ALERT_FLASH_MS / 1000
+        if game_id != self.currently_displayed_game_id and matchup in self.live_games_dict \
+                and self.replay is None and not recently_surfaced:
+            self.alert_surfaced_at = now
+            self.itemChecked.set(matchup)  # option_changed renders its cached latest pitch.
+
+    def replay_pitches(self, game_id, pitch_summaries):
+        """
+        Render pitches thrown between two polls one after another, PITCH_REPLAY_MS apart.
+        Pending renders are dropped if a different game is selected meanwhile.
+
+        Args:
+            game_id (str): Game the pitches belong to.
+            pitch_summaries (list): Pitch summaries in the order they were thrown.
+        """
+        def render(pitch_summary):
+            if game_id == self.currently_displayed_game_id and self.replay is None:
+                self.play_summary(pitch_summary)
+
+        self.play_summary(pitch_summaries[0])
+        for delay_index, pitch_summary in enumerate(pitch_summaries[1:], start=1):
+            self.root.after(delay_index * PITCH_REPLAY_MS, lambda summary=pitch_summary: render(summary))
+
+    def shown_matchup(self):
+        """Return the replayed game's matchup while replaying, else the selected game's."""
+        return self.replay.matchup if self.replay is not None else self.itemChecked.get()
+
+    def toggle_replay(self):
+        """Replay button: replay the selected game, or go back to following it live."""
+        if self.replay is not None or self.replay_loading is not None:
+            self.stop_replay()
+            return
+        game_id = self.live_games_dict.get(self.itemChecked.get())
+        if game_id is not None:
+            self.start_replay(game_id)
+
+    def start_replay(self, game_id):
+        """
+        Fetch a game's whole play-by-play on the worker and replay it from its first pitch
+        once indexed (see `show_replay`). Works for finished games too, e.g. `--replay GAME_ID`.
+
+        Args:
+            game_id (str): Game to replay.
+        """
+        if self.server_url:
+            print("Replay needs Sportradar access of its own; not available as a viewer of a --serve poller.")
+            return
+        self.replay_loading = game_id
+        self.replay_button.config(text="Loading replay...")
+        self.fetch_worker.submit_replay(game_id)
+
+    def show_replay(self, index):
+        """
+        Show the replay controls (play/pause, speed, and a slider over every pitch) and start
+        playing `index` from its first pitch.
+
+        Args:
+            index (ReplayIndex): The game to replay.
+        """
+        self.replay_loading = None
+        if not len(index):
+            print(f"Nothing to replay yet for {index.matchup}.")
+            self.replay_button.config(text="Replay")
+            return
+        self.replay = index
+        self.replay_button.config(text="Back to live")
+        self.replay_frame = tk.Frame(self.container)
+        self.replay_frame.pack(fill='x', after=self.replay_button)
+        self.replay_play_button = tk.Button(self.replay_frame, text="Pause", width=6,
+                                            command=self.toggle_replay_playback)
+        self.replay_play_button.pack(side='left')
+        self.replay_speed = tk.StringVar(value=f"{DEFAULT_REPLAY_SPEED}x")
+        tk.OptionMenu(self.replay_frame, self.replay_speed, *[f"{speed}x" for speed in REPLAY_SPEEDS]).pack(
+            side='left')
+        self.replay_speed.trace_add("write", lambda *args: self.schedule_replay_tick())
+        self.replay_position_label = tk.Label(self.replay_frame, font=("Helvetica", 10))
+        self.replay_position_label.pack(side='left', padx=(6, 0))
+        self.replay_slider = tk.Scale(self.replay_frame, from_=0, to=len(index) - 1, orient='horizontal',
+                                      showvalue=0, command=self.replay_slider_moved)
+        self.replay_slider.pack(side='bottom', fill='x')
+        self.replay_playing = True
+        self.show_replay_pitch(0, step=False)
+        self.schedule_replay_tick()
+
+    def stop_replay(self):
+        """Close the replay and show the selected game's latest pitch again."""
+        if self.replay_after_id is not None:
+            self.root.after_cancel(self.replay_after_id)
+            self.replay_after_id = None
+        if self.replay_frame is not None:
+            self.replay_frame.destroy()
+            self.replay_frame = None
+        self.replay = None
+        self.replay_loading = None
+        self.replay_playing = False
+        self.replay_button.config(text="Replay")
+        self.trail_key = None
+        self.heatmap_key = None
+        cached_summary = self.latest_summaries.get(self.currently_displayed_game_id)
+        if cached_summary is not None:
+            self.play_summary(cached_summary)
+
+    def show_replay_pitch(self, position, step=True):
+        """
+        Render the replayed pitch at `position` with `play_summary`. After a jump (`step`
+        False) the pitch trail and heatmap are first rebuilt up to that pitch from the index.
+
+        Args:
+            position (int): Position in the replay index.
+            step (bool): True when `position` directly follows the pitch shown.
+        """
+        index = self.replay
+        self.replay_position = position
+        if not step:
+            if self.pitch_trail is not None:
+                self.trail_key = None
+                for earlier in range(index.scope_start(position, self.trail_scope), position):
+                    self.add_pitch_to_trail(index.summary(earlier))
+            if self.heatmap is not None:
+                self.rebuild_heatmap(position)
+        pitch_summary = index.summary(position)
+        self.play_summary(pitch_summary)
+        self.replay_slider.set(position)
+        self.replay_position_label.config(
+            text=f"{pitch_summary['inning_half']} {pitch_summary['inning_number']}, "
+                 f"pitch {position + 1}/{len(index)}")
+
+    def rebuild_heatmap(self, position):
+        """Bin the replayed pitches before `position` (of the same pitcher, per `heatmap_scope`) afresh."""
+        pitcher = self.replay.summary(position)['pitcher']
+        self.heatmap.clear()
+        self.heatmap_key = pitcher if self.heatmap_scope == 'pitcher' else ''
+        self.last_heatmap_pitch = None
+        for earlier in range(position):
+            pitch_summary = self.replay.summary(earlier)
+            if pitch_summary['pitch_type'] == '' or (self.heatmap_scope == 'pitcher'
+                                                     and pitch_summary['pitcher'] != pitcher):
+                continue
+            x, y = self.pitch_to_canvas(pitch_summary['pitch_x'], pitch_summary['pitch_y'])
+            self.heatmap.add(x - 6, y - 6)
+        self.background_photo.paste(self.heatmap.composite(self.background_image).convert("RGB"))
+
+    def replay_slider_moved(self, value):
+        """Slider callback: jump to the pitch under the slider."""
+        position = int(float(value))
+        if self.replay is None or position == self.replay_position:
+            return
+        self.show_replay_pitch(position, step=position == self.replay_position + 1)
+        self.schedule_replay_tick()
+
+    def toggle_replay_playback(self):
+        """Play/pause button; playing from the last pitch starts over."""
+        self.replay_playing = not self.replay_playing
+        if self.replay_playing and self.replay_position == len(self.replay) - 1:
+            self.show_replay_pitch(0, step=False)
+        self.replay_play_button.config(text="Pause" if self.replay_playing else "Play")
+        self.schedule_replay_tick()
+
+    def schedule_replay_tick(self):
+        """(Re)arm the timer showing the next replayed pitch, after its gap at the chosen speed."""
+        if self.replay_after_id is not None:
+            self.root.after_cancel(self.replay_after_id)
+            self.replay_after_id = None
+        if self.replay is None or not self.replay_playing:
+            return
+        speed = int(self.replay_speed.get().rstrip('x'))
+        self.replay_after_id = self.root.after(self.replay.gap_ms(self.replay_position, speed), self.replay_tick)
+
+    def replay_tick(self):
+        self.replay_after_id = None
+        if self.replay is None or not self.replay_playing:
+            return
+        self.show_replay_pitch(self.replay_position + 1)
+        if self.replay_position == len(self.replay) - 1:
+            self.replay_playing = False
+            self.replay_play_button.config(text="Play")
+        self.schedule_replay_tick()
+
     def update_live_data(self, suppress_flash):
         """
-        Refresh the GUI with the latest live games and schedule the next update.
+        Queue a refresh of the selected game's pitch data (and, when due, the live games
+        schedule) on the background worker and schedule the next update. The delay comes
+        from `poll_scheduler`: shorter mid at-bat, longer between halves or before any
+        events, backing off after API errors and when the call quota runs low.
 
         If `suppress_flash` is False, briefly change the background to red to show a refresh,
         then restore it after 4 seconds.
 
         Args:
             suppress_flash (bool): Skip red flash if True.
-
-        Exceptions:
-            Prints any errors during the update process.
         """
-        try:
-            if not suppress_flash:
-                self.change_bg('red')
-            self.container.after(4000, lambda: self.change_bg(self.defaultbg))  # Restore to white after 4 seconds
-            self.get_live_games(teams)
-            self.display_live_games()
-            self.option_changed()
-        except Exception as e:
-            print("Error updating live data:", e)
+        if not suppress_flash:
+            self.change_bg('red')
+        self.container.after(4000, lambda: self.change_bg(self.defaultbg))  # Restore to white after 4 seconds
+        self.fetch_worker.submit_poll(self.itemChecked.get(), self.schedule.refresh_due())
+
+        # A client of a fan-out server makes no Sportradar calls of its own.
+        remaining = None if self.server_url else self.poll_scheduler.remaining_budget()
+        if remaining is not None:
+            self.root.title(f"Strike Zone ({remaining} calls left)")
+            shared_metrics().set_gauge("quota_remaining", remaining)
 
-        self.root.after(20000, lambda: self.update_live_data(False))
+        interval = self.poll_scheduler.next_interval_ms(self.latest_summaries.get(self.currently_displayed_game_id))
+        self.root.after(interval, lambda: self.update_live_data(False))
 
 
 if __name__ == "__main__":
@@ -692,7 +861,8 @@ if __name__ == "__main__":
     access_level = 'trial'
     api_key = ''
 
-    windll.shcore.SetProcessDpiAwareness(1) # Makes strike oval a little sharper visually.
+    if windll is not None:
+        windll.shcore.SetProcessDpiAwareness(1) # Makes strike oval a little sharper visually.
     app = StrikeZone_Updates(root1, api_key, access_level)  # calls both classes
 
     # Dummy data that fills up the window for dev purposes if strike_zone.py is run alone.
@@ -0,0 +1,113 @@
+import random
+import uuid
+
+PITCH_TYPES = [("FA", "Fastball"), ("SL", "Slider"), ("CU", "Curveball"), ("CH", "Changeup"),
+               ("SI", "Sinker"), ("FC", "Cutter")]
+PITCH_OUTCOMES = ["bB", "bB", "kKL", "kKS", "kF", "kF", "bDB", "kFT"]
+AT_BAT_OUTCOMES = ["oGO", "oFO", "oLO", "oPO", "aS", "aD", "aHR", "oKST1", "aBB"]
+FIRST_NAMES = ["Pete", "Aaron", "Juan", "Mookie", "Shohei", "Freddie", "Gerrit", "Max", "Carlos", "Paul"]
+LAST_NAMES = ["Alonso", "Judge", "Soto", "Betts", "Ohtani", "Freeman", "Cole", "Scherzer", "Carrasco", "Goldschmidt"]
+
+
+def _uid(rng):
+    return str(uuid.UUID(int=rng.getrandbits(128), version=4))
+
+
+def _player(rng):
+    first = rng.choice(FIRST_NAMES)
+    last = rng.choice(LAST_NAMES)
+    return {
+        "id": _uid(rng),
+        "first_name": first,
+        "preferred_name": first,
+        "last_name": last,
+        "full_name": f"{first} {last}",
+        "jersey_number": str(rng.randint(1, 99)),
+        "position": rng.choice(["P", "C", "IF", "OF"]),
+    }
+
+
+def _pitch(rng, balls, strikes, outs, pitch_count):
+    code, description = rng.choice(PITCH_TYPES)
+    outcome = rng.choice(PITCH_OUTCOMES)
+    zone = rng.randint(1, 14)
+    return {
+        "id": _uid(rng),
+        "type": "pitch",
+        "status": "official",
+        "outcome_id": outcome,
+        "created_at": "2025-06-01T23:10:00+00:00",
+        "updated_at": "2025-06-01T23:10:05+00:00",
+        "wall_clock": {"start_time": "2025-06-01T23:10:00+00:00", "end_time": "2025-06-01T23:10:05+00:00"},
+        "count": {"balls": balls, "strikes": strikes, "outs": outs, "pitch_count": pitch_count},
+        "flags": {"is_ab_over": False, "is_bunt": False, "is_bunt_shown": False, "is_hit": False,
+                  "is_wild_pitch": False, "is_passed_ball": False, "is_double_play": False},
+        "pitcher": {"pitch_speed": round(rng.uniform(78, 101), 1), "pitch_type": code,
+                    "pitch_zone": zone, "pitch_x": rng.randint(-250, 250), "pitch_y": rng.randint(-180, 180),
+                    "pitch_count": pitch_count},
+        "mlb_pitch_data": {"code": code, "description": description, "zone": zone,
+                           "spin_rate": rng.randint(1800, 2800), "release_extension": round(rng.uniform(5, 7), 2)},
+    }
+
+
+def _at_bat(rng, outs, score):
+    pitches = []
+    balls = strikes = 0
+    for pitch_count in range(1, rng.randint(1, 8) + 1):
+        pitches.append(_pitch(rng, balls, strikes, outs, pitch_count))
+        if pitches[-1]["outcome_id"].startswith("b"):
+            balls = min(balls + 1, 3)
+        else:
+            strikes = min(strikes + 1, 2)
+    pitches[-1]["flags"]["is_ab_over"] = True
+    return {
+        "at_bat": {
+            "id": _uid(rng),
+            "hitter_id": _uid(rng),
+            "hitter": _player(rng),
+            "pitcher": _player(rng),
+            "description": f"{rng.choice(LAST_NAMES)} {rng.choice(['grounds out', 'flies out', 'singles', 'strikes out'])}.",
+            "outcome_id": rng.choice(AT_BAT_OUTCOMES),
+            "score": dict(score),
+            "events": pitches,
+        }
+    }
+
+
+def build_game(innings=9, seed=0, game_id=None):
+    """
+    Build a synthetic pbp.json 'game' object shaped like Sportradar's MLB v8 play-by-play.
+
+    Used by the benchmarks and the local stand-in server so they can run without an
+    API key. Each half-inning has three outs worth of at-bats with 1-8 pitches each.
+
+    Args:
+        innings (int): Number of innings to generate (9 for a regulation game, more for extras).
+        seed (int): Random seed; the same seed always builds the same game.
+        game_id (str, optional): Game id to use. A seeded uuid is used by default.
+
+    Returns:
+        dict: The 'game' object, i.e. what get_pbp_data returns.
+    """
+    rng = random.Random(seed)
+    score = {"home_team_runs": 0, "away_team_runs": 0}
+    game = {
+        "id": game_id or _uid(rng),
+        "status": "inprogress",
+        "coverage": "full",
+        "home_team": _uid(rng),
+        "away_team": _uid(rng),
+        "innings": [{"number": 0, "sequence": 1, "halfs": [{"half": "T", "events": [{"lineup": {"id": _uid(rng)}}]}]}],
+    }
+    for number in range(1, innings + 1):
+        halfs = []
+        for half in ("T", "B"):
+            events = []
+            for outs in range(3):
+                for _ in range(rng.randint(1, 2)):
+                    events.append(_at_bat(rng, outs, score))
+                if rng.random() < 0.15:
+                    score["away_team_runs" if half == "T" else "home_team_runs"] += 1
+            halfs.append({"half": half, "events": events})
+        game["innings"].append({"number": number, "sequence": number + 1, "halfs": halfs})
+    return game
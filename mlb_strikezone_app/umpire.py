@@ -0,0 +1,44 @@
+# Pitch outcome codes (play_outcome_codes.json) that are an umpire's ball/strike call.
+# Swinging strikes, fouls, automatic (pitch timer) calls, intentional balls and pitchouts
+# are not judgement calls and are left out.
+CALLED_STRIKE_CODES = ("kKL",)
+CALLED_BALL_CODES = ("bB", "bDB")
+
+# Sportradar/Gameday zones 1-9 tile the rulebook strike zone; 11-14 are outside it.
+# Pitches without a zone (-1) cannot be judged and are left out.
+STRIKE_ZONES = range(1, 10)
+
+
+class RunningAccuracy:
+    """
+      Live umpire accuracy of one game, updated in O(1) per new pitch.
+
+      Attributes:
+          called (int): Called balls and strikes judged so far.
+          correct (int): Of those, calls that agree with the rulebook zone.
+      """
+
+    __slots__ = ("called", "correct")
+
+    def __init__(self):
+        self.called = 0
+        self.correct = 0
+
+    def add(self, outcome_id, zone):
+        """
+        Count one pitch if it was a called ball or strike with a known zone.
+
+        Args:
+            outcome_id (str): Pitch outcome code, e.g. 'kKL'.
+            zone (int): Zone of the pitch, -1 when unknown.
+        """
+        is_strike_call = outcome_id in CALLED_STRIKE_CODES
+        if not (is_strike_call or outcome_id in CALLED_BALL_CODES) or zone is None or zone < 0:
+            return
+        self.called += 1
+        if is_strike_call == (zone in STRIKE_ZONES):
+            self.correct += 1
+
+    def percent(self):
+        """Return the share of correct calls in percent, or None before the first call."""
+        return 100 * self.correct / self.called if self.called else None
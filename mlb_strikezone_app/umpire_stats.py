@@ -0,0 +1,110 @@
+import json
+import sys
+
+import numpy as np
+
+from mlb_strikezone_app.backfill import PitchArchive
+from mlb_strikezone_app.umpire import CALLED_STRIKE_CODES, CALLED_BALL_CODES, STRIKE_ZONES
+
+COUNT_BUCKETS = 12  # balls 0-3 x strikes 0-2
+
+
+def _codes(lookup, values):
+    codes = [lookup(value) for value in values]
+    return np.array([code for code in codes if code is not None], dtype=np.int64)
+
+
+def judge_calls(outcome, zone, strike_codes, ball_codes):
+    """
+    Classify called pitches against the rulebook zone.
+
+    Args:
+        outcome (numpy.ndarray): Interned outcome code per pitch.
+        zone (numpy.ndarray): Zone per pitch.
+        strike_codes (numpy.ndarray): Codes of CALLED_STRIKE_CODES in the same string table.
+        ball_codes (numpy.ndarray): Codes of CALLED_BALL_CODES in the same string table.
+
+    Returns:
+        tuple: (called, correct) boolean arrays; `correct` is only meaningful where `called`.
+    """
+    is_strike_call = np.isin(outcome, strike_codes)
+    is_ball_call = np.isin(outcome, ball_codes)
+    in_zone = (zone >= STRIKE_ZONES.start) & (zone < STRIKE_ZONES.stop)
+    judged = zone >= 0
+    called = (is_strike_call | is_ball_call) & judged
+    correct = called & (is_strike_call == in_zone)
+    return called, correct
+
+
+def _grouped(groups, called, correct, size):
+    totals = np.bincount(groups[called], minlength=size)
+    rights = np.bincount(groups[correct], minlength=size)
+    return totals, rights
+
+
+def _rates(totals, rights, labels):
+    return {label: (int(right), int(total)) for label, total, right in zip(labels, totals, rights) if total}
+
+
+def count_labels():
+    """Return the 'balls-strikes' label of every count bucket, in bucket order."""
+    return [f"{balls}-{strikes}" for balls in range(4) for strikes in range(3)]
+
+
+def _count_index(balls, strikes):
+    # Bucket of every pitch's count, -1 where the feed left the count out (stored as -1).
+    index = np.clip(balls, 0, 3).astype(np.int64) * 3 + np.clip(strikes, 0, 2).astype(np.int64)
+    return np.where((balls >= 0) & (strikes >= 0), index, -1)
+
+
+def archive_accuracy(archive):
+    """
+    Umpire accuracy over a backfilled season, computed column-wise on the memory-mapped archive.
+
+    Args:
+        archive (PitchArchive): An archive built by `--backfill`.
+
+    Returns:
+        dict: {"overall": (correct, called), "by_game": {game_id: ...}, "by_umpire": {name: ...},
+        "by_count": {"balls-strikes": ...}}; every value is a (correct calls, called pitches) pair.
+    """
+    columns = archive.columns
+    called, correct = judge_calls(columns['outcome'], columns['zone'],
+                                  _codes(archive.code, CALLED_STRIKE_CODES), _codes(archive.code, CALLED_BALL_CODES))
+    game = np.asarray(columns['game'], dtype=np.int64)
+    game_totals, game_rights = _grouped(game, called, correct, len(archive.games))
+
+    umpires = sorted({g.get('umpire') or 'Unknown' for g in archive.games})
+    umpire_index = {name: index for index, name in enumerate(umpires)}
+    umpire_of_game = np.array([umpire_index[g.get('umpire') or 'Unknown'] for g in archive.games], dtype=np.int64)
+    umpire_totals = np.bincount(umpire_of_game, weights=game_totals, minlength=len(umpires))
+    umpire_rights = np.bincount(umpire_of_game, weights=game_rights, minlength=len(umpires))
+
+    count_index = _count_index(columns['balls'], columns['strikes'])
+    counted = count_index >= 0
+    count_totals, count_rights = _grouped(count_index, called & counted, correct & counted, COUNT_BUCKETS)
+    return {
+        "overall": (int(correct.sum()), int(called.sum())),
+        "by_game": _rates(game_totals, game_rights, [g['id'] for g in archive.games]),
+        "by_umpire": _rates(umpire_totals, umpire_rights, umpires),
+        "by_count": _rates(count_totals, count_rights, count_labels()),
+    }
+
+
+def print_umpire_report(archive_dir, output=sys.stdout):
+    """
+    Print `archive_accuracy` of a backfilled season as JSON, each pair as {"correct", "called"}.
+
+    Args:
+        archive_dir (str): Folder of an archive built by `--backfill`.
+        output (file, optional): Where to write the report. Defaults to stdout.
+    """
+    report = archive_accuracy(PitchArchive(archive_dir))
+
+    def pair(value):
+        return {"correct": value[0], "called": value[1]}
+
+    json.dump({"overall": pair(report["overall"]),
+               **{group: {label: pair(value) for label, value in report[group].items()}
+                  for group in ("by_game", "by_umpire", "by_count")}}, output, indent=2)
+    output.write("\n")
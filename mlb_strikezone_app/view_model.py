@@ -0,0 +1,82 @@
+from collections import namedtuple
+
+# Immutable snapshot of everything the info labels and the pitch dot show for one summary.
+# Field names match the StrikeZone label attributes without the `_label` suffix.
+SummaryView = namedtuple("SummaryView", [
+    "away_vs_home",
+    "score",
+    "inning",
+    "hitter_pitcher",
+    "count",
+    "last_pitch",
+    "pitch_outcome",
+    "play_outcome",
+    "umpire_accuracy",
+    "pitch",
+])
+
+LABEL_FIELDS = SummaryView._fields[:-1]
+
+
+def summary_view(matchup, pitch_summary):
+    """
+    Build the display snapshot of a pitch summary.
+
+    Args:
+        matchup (str): Dropdown label of the game, e.g. "Miami Marlins vs(@) Los Angeles Dodgers".
+        pitch_summary (dict): Pitch summary from Pitch_Stream.
+
+    Returns:
+        SummaryView: Label texts plus the (pitch_x, pitch_y, ball_strike_or_foul) of the dot.
+    """
+    return SummaryView(
+        away_vs_home=f"{matchup}",
+        score=f"{pitch_summary['away_team_score']} - {pitch_summary['home_team_score']}",
+        inning=f"{pitch_summary['inning_half']} - {pitch_summary['inning_number']}",
+        hitter_pitcher=f"{pitch_summary['pitcher']} vs {pitch_summary['hitter']}",
+        count=f"COUNT: {pitch_summary['balls']}-{pitch_summary['strikes']}, OUTS: {pitch_summary['outs']}",
+        last_pitch=f"Last Pitch: {pitch_summary['pitch_type']} at {pitch_summary['pitch_speed']} mph",
+        pitch_outcome=f"Pitch Outcome: {pitch_summary['pitch_outcome']}",
+        play_outcome=f"Play Outcome: {pitch_summary['description']}",
+        umpire_accuracy=umpire_accuracy_text(pitch_summary.get('umpire_correct'), pitch_summary.get('umpire_called')),
+        pitch=(pitch_summary['pitch_x'], pitch_summary['pitch_y'], pitch_summary['ball_strike_or_foul']),
+    )
+
+
+def umpire_accuracy_text(correct, called):
+    """Return the running umpire accuracy label, e.g. 'Ump Accuracy: 93.8% (30/32 calls)'."""
+    if not called:
+        return "Ump Accuracy: N/A"
+    return f"Ump Accuracy: {100 * correct / called:.1f}% ({correct}/{called} calls)"
+
+
+def changed_fields(previous, current):
+    """
+    Args:
+        previous (SummaryView or None): Snapshot currently on screen.
+        current (SummaryView): Snapshot to show.
+
+    Returns:
+        list: Names of the fields whose value differs (all of them when `previous` is None).
+    """
+    if previous is None:
+        return list(SummaryView._fields)
+    return [field for field, old, new in zip(SummaryView._fields, previous, current) if old != new]
+
+
+def menu_changes(shown, wanted):
+    """
+    Work out the dropdown edits turning the `shown` entries into the `wanted` ones.
+
+    Args:
+        shown (list): Menu labels currently in the dropdown, in menu order.
+        wanted (list): Menu labels that should be there.
+
+    Returns:
+        tuple: (indexes to delete, highest first, labels to append in order).
+    """
+    wanted_set = set(wanted)
+    shown_set = set(shown)
+    deletes = [index for index in range(len(shown) - 1, -1, -1) if shown[index] not in wanted_set]
+    appends = [label for label in wanted if label not in shown_set]
+    return deletes, appends
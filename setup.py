@@ -5,11 +5,12 @@ setup(
     version='1.0.0',
     description='App that polls the MLB API and creates a visual strike zone with descriptions of each pitch and its outcome.',
     author='Vincent Crescente',
-    packages=find_packages(where='.'),  # Search from the root
+    packages=find_packages(where='.', exclude=['benchmarks', 'benchmarks.*']),  # Search from the root
     package_dir={'mlb_strikezone_app': 'mlb_strikezone_app'},
     install_requires=[
         'pillow==11.2.1',
         'requests==2.32.3',
+        'numpy==2.2.6',
         'python-dotenv==1.0.0'
     ],
     entry_points={
@@ -0,0 +1,28 @@
+import pytest
+
+from mlb_strikezone_app.http_client import ACCESS_LEVEL_QPS, Sportradar_Session
+from mlb_strikezone_app.mlb_api import Pitch_Stream
+from mlb_strikezone_app.simulator import Simulator, start_simulator
+
+
+@pytest.fixture
+def simulator():
+    """Start a local Simulator; call with Simulator keyword arguments, returns (simulator, base_url)."""
+    servers = []
+
+    def start(**options):
+        server = start_simulator(Simulator(**options))
+        servers.append(server)
+        return server.simulator, f"http://127.0.0.1:{server.server_address[1]}/mlb"
+
+    yield start
+    for server in servers:
+        server.shutdown()
+
+
+def private_stream(base_url):
+    """A Pitch_Stream on its own Sportradar_Session, so breaker and validator state stay in the test."""
+    stream = Pitch_Stream("test-key", "production", base_url=base_url)
+    stream.http = Sportradar_Session()
+    stream.http.rate_limiter.set_rate(ACCESS_LEVEL_QPS["production"])
+    return stream
@@ -0,0 +1,61 @@
+import pytest
+
+from mlb_strikezone_app.alerts import AlertEngine, compile_rule
+from mlb_strikezone_app.mlb_api import load_play_outcome_codes
+
+CODES = load_play_outcome_codes()
+
+
+def _pitch(**fields):
+    summary = {"inning_number": 1, "home_team_score": 0, "away_team_score": 0, "balls": 0, "strikes": 0, "outs": 0,
+               "runners_on": 0, "pitch_type": "Four-seam fastball", "pitch_speed": 95.0, "pitch_zone": 12,
+               "pitch_x": 0.0, "pitch_y": 0.0, "pitch_outcome": CODES["bB"]}
+    summary.update(fields)
+    return summary
+
+
+def test_rule_forms():
+    assert compile_rule("heat").source == "pitch_speed >= 100"
+    named = compile_rule("loaded = full_count and bases_loaded")
+    assert (named.name, named.source) == ("loaded", "full_count and bases_loaded")
+    assert compile_rule("fast=heat").source == "pitch_speed >= 100"
+    assert compile_rule("pitch_speed ≥ 99 and balls ≠ 3").source == "pitch_speed >= 99 and balls != 3"
+    # `==` is a comparison, not a name.
+    assert compile_rule("balls == 3").name == "balls == 3"
+
+
+@pytest.mark.parametrize("rule, message", [
+    ("__import__('os').system('true')", "unsupported syntax: Call"),
+    ("pitch_type.lower() == 'slider'", "unsupported syntax"),
+    ("hitter[0] == 'A'", "unsupported syntax: Subscript"),
+    ("[x for x in (1, 2)]", "unsupported syntax: ListComp"),
+    ("(lambda: 1) == 1", "unsupported syntax: Lambda"),
+    ("speed > 100", "unknown field 'speed'"),
+    ("pitch_speed >", "not a valid expression"),
+])
+def test_rules_outside_the_whitelist_are_rejected(rule, message):
+    with pytest.raises(ValueError, match=message):
+        compile_rule(rule)
+
+
+def test_engine_fires_once_per_new_pitch():
+    engine = AlertEngine(["heat", "full_count_bases_loaded", "missed_call", "score_change", "pitch_speed / 0 > 1"])
+
+    assert engine.check("g1", _pitch(pitch_speed=101.2)) == ["heat"]
+    assert engine.check("g1", _pitch(pitch_speed=101.2)) == []  # The same pitch summarized again.
+    assert engine.check("g1", _pitch(balls=3, strikes=2, runners_on=3)) == ["full_count_bases_loaded"]
+    assert engine.check("g1", _pitch(pitch_outcome=CODES["kKL"], pitch_zone=12, balls=1)) == ["missed_call"]
+    assert engine.check("g1", _pitch(pitch_outcome=CODES["kKL"], pitch_zone=-1, balls=2)) == []
+    assert engine.check("g1", _pitch(home_team_score=2, balls=3)) == ["score_change"]
+    # Other games keep their own previous pitch and score.
+    assert engine.check("g2", _pitch(home_team_score=2, balls=3)) == []
+    # Messages without a pitch, and fields the pitch does not have, never fire.
+    assert engine.check("g1", _pitch(pitch_type='', pitch_speed=120.0)) == []
+    assert engine.check("g1", _pitch(pitch_speed='', balls=1)) == []
+
+
+def test_forgotten_game_starts_over():
+    engine = AlertEngine(["score_change"])
+    engine.check("g1", _pitch(home_team_score=1))
+    engine.forget("g1")
+    assert engine.check("g1", _pitch(home_team_score=4, balls=1)) == []
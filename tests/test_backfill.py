@@ -0,0 +1,81 @@
+import json
+
+import pytest
+import requests
+
+from mlb_strikezone_app import backfill
+from mlb_strikezone_app.backfill import PitchArchive, Season_Backfill, retry_delay
+from mlb_strikezone_app.http_client import ACCESS_LEVEL_QPS, Sportradar_Session
+from mlb_strikezone_app.scheduler import PollScheduler
+
+
+def _http_error(status_code, headers):
+    response = requests.Response()
+    response.status_code = status_code
+    response.headers.update(headers)
+    return requests.HTTPError(response=response)
+
+
+def test_retry_delay_prefers_retry_after():
+    assert retry_delay(requests.ConnectionError(), 0) == backfill.RETRY_BASE_SECONDS
+    assert retry_delay(requests.ConnectionError(), 2) == 4 * backfill.RETRY_BASE_SECONDS
+    assert retry_delay(requests.ConnectionError(), 30) == backfill.RETRY_MAX_SECONDS
+    assert retry_delay(_http_error(429, {"Retry-After": "7"}), 0) == 7
+    assert retry_delay(_http_error(503, {"Retry-After": "Wed, 21 Oct 2015 07:28:00 GMT"}), 3) == 0
+    assert retry_delay(_http_error(503, {"Retry-After": "soon"}), 1) == 2 * backfill.RETRY_BASE_SECONDS
+
+
+def _backfill(base_url, archive_dir):
+    run = Season_Backfill("test-key", "production", 2025, archive_dir, base_url=base_url)
+    # Its own session, so 429s neither trip nor are throttled by the suite's shared breaker and limiter.
+    run.http = Sportradar_Session()
+    run.http.rate_limiter.set_rate(ACCESS_LEVEL_QPS["production"])
+    run.http.request_hooks.append(run.poll_scheduler.record_request)
+    return run
+
+
+@pytest.fixture
+def no_quota_file(monkeypatch):
+    monkeypatch.setattr(backfill, "PollScheduler", lambda access_level: PollScheduler(access_level, quota_file=None))
+
+
+def test_backfill_retries_429s_and_checkpoints_in_batches(simulator, tmp_path, monkeypatch, no_quota_file):
+    # Every game is over at once; about a third of the requests are answered 429 with Retry-After: 1.
+    sim, base_url = simulator(games=12, innings=1, speed=1e6, rate_limit_rate=0.35)
+    monkeypatch.setattr(backfill, "RETRY_MAX_SECONDS", 0.01)
+    monkeypatch.setattr(backfill, "CHECKPOINT_EVERY_GAMES", 5)
+    saved = []
+    write_json = backfill._write_json
+    monkeypatch.setattr(backfill, "_write_json", lambda path, data: (saved.append(path), write_json(path, data)))
+
+    run = _backfill(base_url, str(tmp_path))
+    statuses = []
+    run.http.request_hooks.append(lambda url, status_code: statuses.append(status_code))
+    assert run.run()
+
+    checkpoints = [path for path in saved if path == run.checkpoint_path]
+    assert len(checkpoints) == 3  # After 5 and 10 games, then the last 2 when the run ends.
+    with open(run.checkpoint_path) as file:
+        assert len(json.load(file)["done"]) == 12
+    archive = PitchArchive(str(tmp_path))
+    assert len(archive) == sum(len(game.positions) for game in sim.games.values())
+    assert 429 in statuses
+
+
+def test_interrupted_backfill_keeps_its_checkpoint(simulator, tmp_path, monkeypatch, no_quota_file):
+    _, base_url = simulator(games=4, innings=1, speed=1e6)
+    run = _backfill(base_url, str(tmp_path))
+    backfill_game = run.backfill_game
+
+    def interrupt_on_third(game_id, day):
+        if len(run.done) == 2:
+            raise KeyboardInterrupt
+        backfill_game(game_id, day)
+
+    monkeypatch.setattr(run, "backfill_game", interrupt_on_third)
+    with pytest.raises(KeyboardInterrupt):
+        run.run()
+
+    with open(run.checkpoint_path) as file:
+        assert len(json.load(file)["done"]) == 2
+    assert _backfill(base_url, str(tmp_path)).run()
@@ -0,0 +1,75 @@
+import os
+import time
+
+import pytest
+
+from conftest import private_stream
+from mlb_strikezone_app.disk_cache import ReplayMissError, ResponseCache, cache_key_url, endpoint_kind
+
+
+def _cached_stream(base_url, directory, mode, **options):
+    stream = private_stream(base_url)
+    stream.http.cache = ResponseCache(str(directory), mode, **options)
+    statuses = []
+    stream.http.request_hooks.append(lambda url, status_code: statuses.append(status_code))
+    return stream, statuses
+
+
+def test_keys_and_endpoints():
+    url = "https://api.sportradar.com/mlb/trial/v8/en/games/g1/pbp.json?api_key=secret"
+    assert cache_key_url(url) == "https://api.sportradar.com/mlb/trial/v8/en/games/g1/pbp.json"
+    assert endpoint_kind(url) == "pbp"
+    assert endpoint_kind("https://x/mlb/trial/v8/en/league/teams.json") == "teams"
+    assert endpoint_kind("https://x/mlb/trial/v8/en/games/2025/06/01/schedule.json") == "schedule"
+    assert endpoint_kind("https://x/mlb/trial/stream/en/events/subscribe") == "push"
+    with pytest.raises(ValueError):
+        ResponseCache("unused", "off")
+
+
+def test_record_then_replay_offline(simulator, tmp_path):
+    sim, base_url = simulator(games=2, speed=0)
+    game_id = next(iter(sim.games))
+    stream, statuses = _cached_stream(base_url, tmp_path, "record")
+    recorded = stream.get_pbp_data(game_id)
+    assert recorded["id"] == game_id and statuses == [200]
+
+    # Within the pbp TTL the recording is served without a request.
+    assert stream.get_pbp_data(game_id) == recorded and statuses == [200]
+
+    # Replay never touches the network: the request hooks see no request at all.
+    replay, replay_statuses = _cached_stream(base_url, tmp_path, "replay")
+    replay.api_key = "another-key"  # Recordings do not depend on the key.
+    assert replay.get_pbp_data(game_id) == recorded
+    with pytest.raises(ReplayMissError):
+        replay.get_pbp_data("never-recorded")
+    assert replay_statuses == []
+
+
+def test_record_mode_refetches_expired_entries(simulator, tmp_path):
+    sim, base_url = simulator(games=1, speed=0)
+    game_id = next(iter(sim.games))
+    stream, statuses = _cached_stream(base_url, tmp_path, "record", ttls={"pbp": 0.05})
+    stream.get_pbp_data(game_id)
+    time.sleep(0.1)
+    stream.get_pbp_data(game_id)
+    assert statuses == [200, 200]
+
+
+def test_least_recently_used_entries_are_evicted(simulator, tmp_path):
+    sim, base_url = simulator(games=3, speed=0)
+    first, second, third = sim.games
+    stream, _ = _cached_stream(base_url, tmp_path, "record")
+    stream.get_pbp_data(first)
+    stream.get_pbp_data(second)
+    entry_bytes = sum(os.path.getsize(os.path.join(tmp_path, name)) for name in os.listdir(tmp_path)) // 2
+
+    # Room for two entries; reading the first again makes the second the least recently used.
+    stream.http.cache.max_bytes = 2 * entry_bytes + entry_bytes // 2
+    time.sleep(0.01)
+    stream.get_pbp_data(first)
+    stream.get_pbp_data(third)
+
+    lookup = stream.http.cache.lookup
+    assert lookup(stream.pbp_url(first)) is not None
+    assert lookup(stream.pbp_url(second)) is None
+    assert lookup(stream.pbp_url(third)) is not None
@@ -0,0 +1,44 @@
+import threading
+
+from mlb_strikezone_app.fanout import Broadcaster, sse_event
+
+
+def test_resume_returns_only_newer_events():
+    broadcaster = Broadcaster()
+    broadcaster.publish("games", {"games": {"A vs(@) B": "g1"}})
+    broadcaster.publish("pitch", {"game_id": "g1", "pitch": 1}, game_id="g1")
+    broadcaster.publish("pitch", {"game_id": "g1", "pitch": 2}, game_id="g1")
+
+    assert broadcaster.events_after(1, 0) == (3, [sse_event(2, "pitch", {"game_id": "g1", "pitch": 1}),
+                                                  sse_event(3, "pitch", {"game_id": "g1", "pitch": 2})])
+    assert broadcaster.events_after(3, 0.01) == (3, [])  # Nothing new before the timeout.
+
+
+def test_resume_wakes_up_on_publish():
+    broadcaster = Broadcaster()
+    threading.Timer(0.05, broadcaster.publish, ("pitch", {"pitch": 1}, "g1")).start()
+    assert broadcaster.events_after(0, 5) == (1, [sse_event(1, "pitch", {"pitch": 1})])
+
+
+def test_resume_outside_the_backlog_needs_a_snapshot():
+    broadcaster = Broadcaster(backlog=3)
+    broadcaster.publish("games", {"games": {"A vs(@) B": "g1", "C vs(@) D": "g2"}})
+    for pitch in range(5):
+        broadcaster.publish("pitch", {"pitch": pitch}, game_id="g1" if pitch % 2 else "g2")
+
+    assert broadcaster.events_after(2, 0) == (6, None)  # Events 3 and older fell out of the backlog.
+    assert broadcaster.events_after(3, 0)[1] == [sse_event(number, "pitch", {"pitch": number - 2})
+                                                 for number in (4, 5, 6)]
+    assert broadcaster.events_after(40, 0) == (6, None)  # An id from before a server restart.
+
+    last_id, events = broadcaster.snapshot()
+    assert last_id == 6
+    assert events == [broadcaster.games, sse_event(6, "pitch", {"pitch": 4}), sse_event(5, "pitch", {"pitch": 3})]
+
+
+def test_games_event_drops_pitches_of_games_that_left():
+    broadcaster = Broadcaster()
+    broadcaster.publish("pitch", {"pitch": 1}, game_id="g1")
+    broadcaster.publish("pitch", {"pitch": 2}, game_id="g2")
+    broadcaster.publish("games", {"games": {"C vs(@) D": "g2"}})
+    assert list(broadcaster.latest_pitches) == ["g2"]
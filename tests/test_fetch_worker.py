@@ -0,0 +1,97 @@
+import time
+
+from mlb_strikezone_app.alerts import AlertEngine
+from mlb_strikezone_app.fetch_worker import FetchWorker
+from mlb_strikezone_app.mlb_api import Pitch_Stream
+from mlb_strikezone_app.simulator import Simulator, start_simulator
+from mlb_strikezone_app.strike_zone import FETCH_RESULTS_POLL_MS, StrikeZone_Updates
+
+# Every simulated response takes 0.4-1.2 s, so a schedule + pbp poll is in flight for over a second.
+SLOW_LATENCY_MS = 800
+
+
+class _Selection:
+    def __init__(self):
+        self.value = 'No Live Games'
+
+    def get(self):
+        return self.value
+
+
+class _Root:
+    def __init__(self):
+        self.scheduled = []
+
+    def after(self, ms, callback):
+        self.scheduled.append((ms, callback))
+
+
+class _HeadlessApp:
+    """
+      The state StrikeZone_Updates.process_fetch_results reads, with the widget updates
+      recorded instead of drawn, so the real drain-and-render tick runs without a display.
+      """
+
+    process_fetch_results = StrikeZone_Updates.process_fetch_results
+
+    def __init__(self, stream, worker):
+        self.stream = stream
+        self.fetch_worker = worker
+        self.root = _Root()
+        self.itemChecked = _Selection()
+        self.latest_summaries = {}
+        self.alerts = AlertEngine()
+        self.currently_displayed_game_id = None
+        self.replay = None
+        self.replay_loading = None
+        self.rendered = []
+
+    @property
+    def live_games_dict(self):
+        return self.stream.live_games_dict
+
+    def display_live_games(self):
+        self.rendered.append(("games", dict(self.live_games_dict)))
+        # The user picks the first game from the dropdown.
+        self.itemChecked.value = next(iter(self.live_games_dict), self.itemChecked.value)
+
+    def replay_pitches(self, game_id, pitch_summaries):
+        self.rendered.append(("pitches", game_id, pitch_summaries))
+
+    def show_staleness(self):
+        pass
+
+
+def test_results_drain_keeps_ticking_while_slow_poll_is_in_flight():
+    server = start_simulator(Simulator(games=1, latency_ms=SLOW_LATENCY_MS))
+    stream = Pitch_Stream("test-key", "production", base_url=f"http://127.0.0.1:{server.server_address[1]}/mlb")
+    worker = FetchWorker(stream, teams={})
+    app = _HeadlessApp(stream, worker)
+    worker.start()
+    try:
+        submitted_at = time.monotonic()
+        worker.submit_poll('No Live Games')
+        ticks = []
+        tick = app.process_fetch_results
+        while not any(entry[0] == "pitches" for entry in app.rendered) and time.monotonic() - submitted_at < 15:
+            tick_started = time.monotonic()
+            tick()
+            ticks.append(time.monotonic() - tick_started)
+            # Each tick re-arms itself on the Tk loop; run the callback it scheduled.
+            delay_ms, tick = app.root.scheduled.pop()
+            assert delay_ms == FETCH_RESULTS_POLL_MS
+            time.sleep(delay_ms / 1000)
+        elapsed = time.monotonic() - submitted_at
+    finally:
+        worker.stop()
+        server.shutdown()
+
+    assert elapsed >= 2 * SLOW_LATENCY_MS / 1000 * 0.5
+    # The loop ran at its own pace for the whole request: one tick per interval, none blocked.
+    assert len(ticks) >= elapsed * 1000 / FETCH_RESULTS_POLL_MS * 0.5
+    assert max(ticks) < FETCH_RESULTS_POLL_MS / 1000
+    assert [entry[0] for entry in app.rendered] == ["games", "pitches"]
+    game_id = app.currently_displayed_game_id
+    assert game_id in stream.live_games_dict.values()
+    assert app.rendered[1][1] == game_id and app.rendered[1][2]
+    assert app.latest_summaries[game_id] == app.rendered[1][2][-1]
@@ -0,0 +1,76 @@
+import pytest
+import requests
+
+from conftest import private_stream
+from mlb_strikezone_app.http_client import CircuitBreaker, CircuitOpenError, is_transient
+
+
+def test_breaker_opens_after_threshold_and_probes_after_reset():
+    breaker = CircuitBreaker(failure_threshold=3, reset_seconds=0.05)
+    for _ in range(3):
+        breaker.before_request()
+        breaker.record(False)
+    assert breaker.state == "open"
+    with pytest.raises(CircuitOpenError):
+        breaker.before_request()
+
+    breaker._opened_at -= 1
+    breaker.before_request()
+    assert breaker.state == "half_open"
+    with pytest.raises(CircuitOpenError):
+        breaker.before_request()  # Only one probe at a time.
+    breaker.record(False)
+    assert breaker.state == "open" and breaker.reset_seconds == 0.1
+
+    breaker._opened_at -= 1
+    breaker.before_request()
+    breaker.record(True)
+    assert (breaker.state, breaker.failures, breaker.reset_seconds) == ("closed", 0, 0.05)
+
+
+def test_is_transient():
+    assert is_transient(requests.ConnectionError())
+    assert is_transient(ValueError("truncated JSON"))
+    assert is_transient(CircuitOpenError())
+    assert not is_transient(KeyError("teams"))
+
+
+def test_malformed_bodies_trip_the_breaker_and_are_served_stale(simulator):
+    _, base_url = simulator(games=1, malformed_rate=1.0)
+    stream = private_stream(base_url)
+    stream.http.breaker = CircuitBreaker(failure_threshold=3)
+    for _ in range(3):
+        assert stream.get_pbp_tail("sim-0000") is None
+    assert stream.http.breaker.state == "open"
+    assert stream.stale_since("sim-0000") == (True, None)
+    # Open: no request goes out, the game keeps being served stale.
+    assert stream.get_pbp_tail("sim-0000") is None
+
+
+def test_probe_is_released_when_decode_raises_something_unexpected(simulator):
+    _, base_url = simulator(games=1)
+    stream = private_stream(base_url)
+    breaker = stream.http.breaker = CircuitBreaker(failure_threshold=1, reset_seconds=60)
+    breaker.record(False)
+    breaker._opened_at -= 120
+
+    def broken_decode(response):
+        raise RuntimeError("bug in a parser")
+
+    with pytest.raises(RuntimeError):
+        stream.http.get(stream.pbp_url("sim-0000"), decode=broken_decode)
+    assert breaker.state == "open"
+    breaker._opened_at -= 240
+    assert stream.http.get(stream.pbp_url("sim-0000"), decode=lambda r: r.json())["game"]["id"] == "sim-0000"
+    assert breaker.state == "closed"
+
+
+def test_recovery_marks_the_game_fresh_again(simulator):
+    sim, base_url = simulator(games=1)
+    stream = private_stream(base_url)
+    sim.malformed_rate = 1.0
+    assert stream.get_pbp_tail("sim-0000") is None
+    assert stream.stale_since("sim-0000")[0]
+    sim.malformed_rate = 0.0
+    assert stream.get_pbp_tail("sim-0000")["innings"]
+    assert stream.stale_since("sim-0000") == (False, None)
@@ -0,0 +1,51 @@
+import json
+
+from mlb_strikezone_app.pbp_state import GameProgress, iter_pitches
+from mlb_strikezone_app.pbp_tail import extract_innings_tail
+from mlb_strikezone_app.simulator import game_until, pitch_positions
+from mlb_strikezone_app.synthetic import build_game
+
+GAME = build_game(innings=4, seed=11)
+POSITIONS = pitch_positions(GAME)
+ALL_PITCH_IDS = [pitch['id'] for _, _, _, pitch in iter_pitches(GAME)]
+
+
+def _until(count):
+    return game_until(GAME, POSITIONS[count - 1], "inprogress")
+
+
+def _ids(found):
+    return [pitch['id'] for _, _, _, pitch in found]
+
+
+def test_first_read_returns_only_the_latest_pitch():
+    progress = GameProgress()
+    assert _ids(progress.new_pitches(_until(40))) == [ALL_PITCH_IDS[39]]
+    assert progress.new_pitches(_until(40)) == []
+
+
+def test_later_reads_return_every_pitch_in_between_in_order():
+    progress = GameProgress()
+    progress.new_pitches(_until(1))
+    seen = [ALL_PITCH_IDS[0]]
+    # Uneven steps cross at-bats, half-innings and innings between polls.
+    for count in (2, 3, 9, 30, 31, 75, len(POSITIONS)):
+        seen += _ids(progress.new_pitches(_until(count)))
+        assert seen == ALL_PITCH_IDS[:count]
+
+
+def test_innings_tail_resumes_like_the_full_game():
+    full, tailed = GameProgress(), GameProgress()
+    for count in (5, 60, 61, 140, len(POSITIONS)):
+        game = _until(count)
+        tail = extract_innings_tail(json.dumps({'game': game}), tailed.inning_index)
+        assert _ids(tailed.new_pitches(tail)) == _ids(full.new_pitches(game))
+
+
+def test_pitches_claimed_by_the_push_feed_are_not_repeated():
+    progress = GameProgress()
+    progress.new_pitches(_until(10))
+    for pitch_id in ALL_PITCH_IDS[10:14]:
+        assert progress.claim_pitch(pitch_id)
+    assert not progress.claim_pitch(ALL_PITCH_IDS[12])
+    assert _ids(progress.new_pitches(_until(16))) == ALL_PITCH_IDS[14:16]
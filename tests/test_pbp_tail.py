@@ -0,0 +1,60 @@
+import json
+
+import pytest
+
+from mlb_strikezone_app.pbp_tail import extract_innings_tail
+from mlb_strikezone_app.synthetic import build_game
+
+# Strings that throw off a brace count or a naive key search if string state is ignored.
+TRICKY_TEXT = [
+    '}',
+    '{',
+    '}} {"number": 1, "halfs": []} {{',
+    'said \\"halfs\\": {',
+    'ends in a backslash \\',
+    'halfs',
+]
+
+
+def _game_with_notes(text):
+    game = build_game(innings=4, seed=5)
+    for inning in game['innings']:
+        # Put the text ahead of "halfs" so the backwards walk to the inning's '{' has to cross it.
+        halfs = inning.pop('halfs')
+        inning['note'] = text
+        inning['halfs'] = halfs
+        inning['halfs'][0]['events'][0].setdefault('note', text)
+    return game
+
+
+def test_tail_matches_full_decode():
+    game = build_game(innings=12, seed=3)
+    body = json.dumps({'game': game})
+
+    assert extract_innings_tail(body) == {'innings': game['innings'][-1:], 'innings_offset': 12}
+    assert extract_innings_tail(body.encode(), first_inning_index=10) == {'innings': game['innings'][10:],
+                                                                         'innings_offset': 10}
+    # An index past the end (the game lost an inning since the last read) clamps to the last one.
+    assert extract_innings_tail(body, first_inning_index=40)['innings_offset'] == 12
+
+
+@pytest.mark.parametrize("text", TRICKY_TEXT)
+def test_braces_and_quotes_inside_strings(text):
+    game = _game_with_notes(text)
+    body = json.dumps({'game': game})
+
+    tail = extract_innings_tail(body, first_inning_index=2)
+    assert tail == {'innings': game['innings'][2:], 'innings_offset': 2}
+
+
+def test_string_value_halfs_is_not_an_inning():
+    game = build_game(innings=2, seed=1)
+    game['status'] = 'halfs'
+    body = json.dumps({'game': game})
+
+    assert extract_innings_tail(body) == {'innings': game['innings'][-1:], 'innings_offset': 2}
+
+
+def test_unexpected_body_falls_back():
+    assert extract_innings_tail(b'{"game": {"innings": []}}') is None
+    assert extract_innings_tail('{"game": {"innings": [{"halfs": [') is None
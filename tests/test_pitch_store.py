@@ -0,0 +1,57 @@
+from mlb_strikezone_app.pbp_state import iter_pitches
+from mlb_strikezone_app.pitch_store import GamePitchStore, HALF_CODES
+from mlb_strikezone_app.synthetic import build_game
+
+
+def _store(game):
+    store = GamePitchStore()
+    for inning, half, at_bat, pitch in iter_pitches(game):
+        store.append(inning['number'], half['half'], at_bat, pitch)
+    return store
+
+
+def test_columns_hold_every_pitch_in_order():
+    game = build_game(innings=3, seed=2)
+    pitches = list(iter_pitches(game))
+    store = _store(game)
+
+    assert len(store) == len(pitches)
+    assert store.nbytes() == len(pitches) * sum(column.itemsize for column in store.columns.values())
+    for row, (inning, half, at_bat, pitch) in enumerate(pitches):
+        record = store.record(row)
+        assert abs(record.speed - pitch['pitcher']['pitch_speed']) < 1e-3  # float32 column
+        assert record.zone == pitch['mlb_pitch_data']['zone']
+        assert (record.balls, record.strikes) == (pitch['count']['balls'], pitch['count']['strikes'])
+        assert store.strings[record.outcome] == pitch['outcome_id']
+        assert store.strings[record.pitcher] == at_bat['pitcher']['id']
+        assert (record.inning, record.half) == (inning['number'], HALF_CODES[half['half']])
+
+
+def test_inning_and_at_bat_slices_are_contiguous_views():
+    game = build_game(innings=3, seed=2)
+    pitches = list(iter_pitches(game))
+    store = _store(game)
+
+    rows = store.rows_for_inning(2, 'B')
+    expected = [row for row, (inning, half, _, _) in enumerate(pitches) if inning['number'] == 2 and half['half'] == 'B']
+    assert list(rows) == expected
+    assert list(store.rows_for_inning(2)) == [row for row, (inning, _, _, _) in enumerate(pitches)
+                                              if inning['number'] == 2]
+    assert store.rows_for_inning(40) == range(0)
+
+    at_bat = pitches[-1][2]
+    rows = store.rows_for_at_bat(at_bat['id'])
+    assert len(rows) == len(at_bat['events'])
+    view = store.column('speed', rows)
+    assert view.obj is store.columns['speed']  # A view into the column, not a copy.
+    assert list(view) == list(store.columns['speed'][rows.start:rows.stop])
+    assert store.rows_for_at_bat('no-such-at-bat') == range(0)
+
+
+def test_missing_fields_are_stored_as_minus_one():
+    store = GamePitchStore()
+    at_bat = {'id': 'ab', 'pitcher': {'id': 'p'}, 'hitter': {'id': 'h'}}
+    row = store.append(1, 'T', at_bat, {'outcome_id': 'bB', 'count': {'balls': None}, 'mlb_pitch_data': {}})
+    record = store.record(row)
+    assert (record.zone, record.balls, record.strikes, record.outs) == (-1, -1, -1, -1)
+    assert (record.x, record.y, record.speed) == (0, 0, 0)
@@ -0,0 +1,65 @@
+from datetime import date, datetime, timedelta, timezone
+
+from mlb_strikezone_app.schedule_state import AROUND_EVENT_REFRESH, MID_GAME_REFRESH, START_LEAD, ScheduleTracker
+
+TEAMS = {"h1": "Home One", "a1": "Away One", "h2": "Home Two", "a2": "Away Two", "h3": "Home Three", "a3": "Away Three"}
+# Noon local time, so a day later is the next local date wherever the tests run.
+NOON = datetime.combine(date(2025, 6, 1), datetime.min.time()).astimezone().replace(hour=12).astimezone(timezone.utc)
+
+
+def _game(game_id, status, scheduled=None, number=1):
+    return {"id": game_id, "status": status, "home_team": f"h{number}", "away_team": f"a{number}",
+            "scheduled": (scheduled or NOON).isoformat()}
+
+
+def test_day_rolls_over_and_evicts_the_previous_day():
+    tracker = ScheduleTracker()
+    day = tracker.current_day(NOON)
+    transitions = tracker.update(day, [_game("g1", "inprogress"), _game("g2", "scheduled", number=2),
+                                       _game("g3", "closed", number=3)], TEAMS, NOON)
+    assert transitions == [("g1", None, "inprogress"), ("g2", None, "scheduled")]
+    assert tracker.live_games() == {"Away One vs(@) Home One": "g1"}
+
+    # After midnight the previous day is still fetched while one of its games is being played.
+    next_day = NOON + timedelta(days=1)
+    assert tracker.days_to_fetch(next_day) == [day, day + timedelta(days=1)]
+    assert tracker.pop_evicted() == ([], [])
+
+    assert tracker.update(day, [_game("g1", "closed"), _game("g2", "inprogress", number=2)], TEAMS, next_day) == [
+        ("g1", "inprogress", "closed"), ("g2", "scheduled", "inprogress")]
+    assert tracker.pop_evicted() == (["g1"], [])
+    assert tracker.update(day, [_game("g2", "complete", number=2)], TEAMS, next_day) == [
+        ("g2", "inprogress", "complete")]
+
+    assert tracker.days_to_fetch(next_day) == [day + timedelta(days=1)]
+    assert tracker.pop_evicted() == (["g2"], [day])
+    assert tracker.games == {}
+
+
+def test_rollover_drops_games_that_never_started():
+    tracker = ScheduleTracker()
+    day = tracker.current_day(NOON)
+    tracker.update(day, [_game("g1", "scheduled", NOON + timedelta(hours=3))], TEAMS, NOON)
+    assert tracker.days_to_fetch(NOON + timedelta(days=1)) == [day + timedelta(days=1)]
+    assert tracker.pop_evicted() == (["g1"], [day])
+
+
+def test_refreshes_follow_scheduled_starts():
+    start = NOON + timedelta(hours=3)
+    tracker = ScheduleTracker(fixed_day=date(2025, 6, 1))
+    assert tracker.refresh_due(NOON)  # Never fetched.
+    tracker.update(date(2025, 6, 1), [_game("g1", "scheduled", start)], TEAMS, NOON)
+    tracker.mark_refreshed(NOON)
+
+    assert tracker.next_refresh(NOON) == start - START_LEAD
+    assert not tracker.refresh_due(start - START_LEAD - timedelta(seconds=1))
+    near_start = start - timedelta(minutes=5)
+    tracker.mark_refreshed(near_start)
+    assert tracker.next_refresh(near_start) == near_start + AROUND_EVENT_REFRESH
+
+    tracker.update(date(2025, 6, 1), [_game("g1", "inprogress", start)], TEAMS, start)
+    tracker.mark_refreshed(start)
+    assert tracker.next_refresh(start) == start + MID_GAME_REFRESH
+
+    tracker.update(date(2025, 6, 1), [_game("g1", "closed", start)], TEAMS, start)
+    assert tracker.next_refresh(start) is None  # A replayed day with every game final is done.
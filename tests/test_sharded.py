@@ -0,0 +1,65 @@
+import multiprocessing
+
+from mlb_strikezone_app.sharded import PitchTable, record_summary, summary_record
+
+WRITES = 20000
+
+
+def _writer(table_name, capacity, done):
+    # Rewrites row 0 as fast as it can; every version of the record is internally consistent.
+    table = PitchTable(capacity, name=table_name)
+    try:
+        for index in range(1, WRITES + 1):
+            table.assign(0, index, f"game-{index:034d}")
+            table.write_pitch(0, index, {"inning_number": index % 30000, "pitch_speed": float(index),
+                                         "description": str(index) * (150 // len(str(index)))})
+    finally:
+        table.close()
+        done.set()
+
+
+def test_seqlock_reader_never_sees_a_torn_record():
+    table = PitchTable(4)
+    context = multiprocessing.get_context("spawn")
+    done = context.Event()
+    writer = context.Process(target=_writer, args=(table.name, table.capacity, done))
+    writer.start()
+    reads = 0
+    try:
+        while not done.is_set() or reads == 0:
+            generation, game_id = table.assignment(0)
+            if game_id is not None:
+                assert game_id == f"game-{generation:034d}"
+            record = table.read_pitch(0)
+            index = int(record['generation'])
+            if index:
+                summary = record_summary(record)
+                assert summary['pitch_speed'] == index
+                assert summary['inning_number'] == index % 30000
+                assert summary['description'] == str(index) * (150 // len(str(index)))
+            reads += 1
+        writer.join(30)
+        assert writer.exitcode == 0
+        assert int(table.read_pitch(0)['generation']) == WRITES
+    finally:
+        if writer.is_alive():
+            writer.terminate()
+        table.close()
+        table.shm.unlink()
+    assert reads > 100
+
+
+def test_summary_record_round_trip():
+    summary = {"inning_number": 7, "inning_half": "B", "home_team_score": 3, "away_team_score": 'N/A',
+               "hitter": "Shohei Ohtani", "pitcher": "Zack Wheeler", "balls": 3, "strikes": 2, "outs": '',
+               "runners_on": 3, "ball_strike_or_foul": "S", "pitch_type": "Slider", "pitch_speed": '',
+               "pitch_zone": 5, "pitch_x": -12.5, "pitch_y": 40, "pitch_outcome": "Strike Looking",
+               "description": "", "umpire_correct": 10, "umpire_called": 11}
+    table = PitchTable(2)
+    try:
+        table.write_pitch(1, 4, summary)
+        assert record_summary(table.read_pitch(1)) == summary
+        assert summary_record(summary, 4, 1)[0] == 0
+    finally:
+        table.close()
+        table.shm.unlink()
@@ -0,0 +1,76 @@
+import io
+import json
+import os
+
+import numpy as np
+
+from mlb_strikezone_app.backfill import ARCHIVE_COLUMNS, PitchArchive
+from mlb_strikezone_app.umpire import RunningAccuracy
+from mlb_strikezone_app.umpire_stats import archive_accuracy, judge_calls, print_umpire_report
+
+STRINGS = ["kKL", "bB", "kKS", "bDB", "aD"]
+# (outcome, zone, balls, strikes): called strikes and balls in and out of the zone, a swinging
+# strike and a hit (not calls), a call without a zone and a correct call without a count.
+PITCHES = [
+    ("kKL", 5, 0, 0),   # strike in the zone: correct
+    ("kKL", 12, 0, 1),  # strike outside: wrong
+    ("bB", 13, 0, 2),   # ball outside: correct
+    ("bDB", 1, 1, 2),   # ball in the zone: wrong
+    ("kKS", 5, 2, 2),   # swinging strike: not a call
+    ("aD", 8, 3, 2),    # ball in play: not a call
+    ("bB", -1, 3, 2),   # no zone: cannot be judged
+    ("bB", 11, -1, -1), # correct, but the feed left the count out
+]
+
+
+def _write_archive(directory):
+    columns = {name: np.zeros(len(PITCHES), dtype=np.dtype(typecode)) for name, typecode in ARCHIVE_COLUMNS.items()}
+    for row, (outcome, zone, balls, strikes) in enumerate(PITCHES):
+        columns['outcome'][row] = STRINGS.index(outcome)
+        columns['zone'][row] = zone
+        columns['balls'][row] = balls
+        columns['strikes'][row] = strikes
+    columns['game'][4:] = 1
+    os.makedirs(os.path.join(directory, 'columns'))
+    for name, values in columns.items():
+        np.save(os.path.join(directory, 'columns', f"{name}.npy"), values)
+    with open(os.path.join(directory, 'strings.json'), 'w') as file:
+        json.dump(STRINGS, file)
+    with open(os.path.join(directory, 'games.json'), 'w') as file:
+        json.dump({"season": 2025, "season_type": "REG",
+                   "games": [{"id": "g1", "date": "2025-04-01", "umpire": "Pat Hoberg", "start": 0, "stop": 4},
+                             {"id": "g2", "date": "2025-04-02", "umpire": None, "start": 4, "stop": 8}]}, file)
+
+
+def test_judge_calls_matches_running_accuracy():
+    outcome = np.array([STRINGS.index(pitch[0]) for pitch in PITCHES])
+    zone = np.array([pitch[1] for pitch in PITCHES], dtype=np.int8)
+    called, correct = judge_calls(outcome, zone, np.array([0]), np.array([1, 3]))
+
+    assert called.tolist() == [True, True, True, True, False, False, False, True]
+    assert correct.tolist() == [True, False, True, False, False, False, False, True]
+    running = RunningAccuracy()
+    for outcome_id, pitch_zone, _, _ in PITCHES:
+        running.add(outcome_id, pitch_zone)
+    assert (running.correct, running.called) == (int(correct.sum()), int(called.sum()))
+
+
+def test_archive_accuracy_groups(tmp_path):
+    _write_archive(str(tmp_path))
+    report = archive_accuracy(PitchArchive(str(tmp_path)))
+
+    assert report["overall"] == (3, 5)
+    assert report["by_game"] == {"g1": (2, 4), "g2": (1, 1)}
+    assert report["by_umpire"] == {"Pat Hoberg": (2, 4), "Unknown": (1, 1)}
+    # The call without a count counts overall but lands in no count bucket.
+    assert report["by_count"] == {"0-0": (1, 1), "0-1": (0, 1), "0-2": (1, 1), "1-2": (0, 1)}
+
+
+def test_print_umpire_report(tmp_path):
+    _write_archive(str(tmp_path))
+    output = io.StringIO()
+    print_umpire_report(str(tmp_path), output)
+
+    report = json.loads(output.getvalue())
+    assert report["overall"] == {"correct": 3, "called": 5}
+    assert report["by_umpire"]["Pat Hoberg"] == {"correct": 2, "called": 4}